@@ -22,12 +22,73 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 MEDIA_URL = 'media_files/'
 FLIERS_PATH = 'fliers'
+
+# Determines the widths, in pixels, of the resized renditions generated for
+# each event flier.
+FLIER_RENDITION_WIDTHS = [320, 640, 1280]
+
+# Determines how many seconds a background job is hidden from other workers
+# after being claimed, before it is assumed its worker died and it is retried.
+JOB_VISIBILITY_TIMEOUT = 300
+
+# Determines how many times a background job is attempted before it is marked
+# as failed.
+JOB_MAX_ATTEMPTS = 5
+
+# Determines how many seconds a failed background job waits before its first
+# retry; the delay doubles with each further attempt.
+JOB_RETRY_DELAY = 30
+
+# Determines how many threads each run_workers process runs jobs on.
+JOB_WORKERS = 2
 STATIC_ROOT = os.path.join(BASE_DIR, 'static/')
 MEDIA_ROOT = os.path.join(BASE_DIR, MEDIA_URL)
 
 # Determines the max number of upcoming events that can appear on the homepage.
 MAX_HOME_FLIER_COUNT = 2
 
+# Determines the longest time, in seconds, the homepage's upcoming events are
+# cached for.
+HOME_EVENTS_CACHE_TIMEOUT = 300
+
+# Names the entry of CACHES the Home app's pages are cached in for anonymous
+# visitors, and the longest time, in seconds, a page is cached for. A cache
+# shared by every process, such as a file-based cache, lets a purge reach all
+# of them.
+HOME_PAGE_CACHE_ALIAS = 'default'
+HOME_PAGE_CACHE_TIMEOUT = 300
+
+# Determines the longest time, in seconds, the {% cache %} fragments of the
+# site's templates, such as the navigation and event cards, are cached for.
+TEMPLATE_FRAGMENT_CACHE_TIMEOUT = 3600
+
+# Determines how many seconds, and how many users per process, the users
+# resolved for authenticated requests are cached for.
+ACCOUNTS_USER_CACHE_TIMEOUT = 60
+ACCOUNTS_USER_CACHE_SIZE = 1000
+
+# Determines the number of rows inserted in each transaction by
+# UserManager.bulk_import and the import_users command.
+ACCOUNTS_IMPORT_BATCH_SIZE = 1000
+
+# Names the entry of CACHES in which users are shared between processes, or
+# None to cache users in each process only.
+ACCOUNTS_USER_CACHE_ALIAS = None
+
+# Determines the number of events listed on each page of the events pages.
+EVENTS_PER_PAGE = 10
+
+# Determines the default and maximum number of rows returned by a single page
+# of a rest_api list view.
+REST_API_PAGE_SIZE = 100
+REST_API_MAX_PAGE_SIZE = 1000
+
+# Determines how many rows a rest_api export reads from the database at once.
+REST_API_EXPORT_CHUNK_SIZE = 2000
+
+# Determines the most items a rest_api bulk endpoint accepts in one request.
+REST_API_MAX_BULK_SIZE = 1000
+
 ###
 # Stripe Keys
 # These values are set in /dependencies/env_vars.template and copied into
@@ -36,6 +97,29 @@ MAX_HOME_FLIER_COUNT = 2
 STRIPE_PRIV_KEY = os.environ.get('STRIPE_PRIV_KEY', None)
 STRIPE_PUB_KEY = os.environ.get('STRIPE_PUB_KEY', None)
 
+# Determines the base url of the Stripe API, which tests point at a local
+# stand-in; see products.testing.
+STRIPE_API_BASE = 'https://api.stripe.com'
+
+# Determines the seconds the Stripe gateway waits to connect and to read a
+# response, how many times and after how many seconds (doubled on each
+# attempt) failed calls are retried, and how many connections each process
+# keeps open to Stripe.
+STRIPE_CONNECT_TIMEOUT = 5
+STRIPE_READ_TIMEOUT = 30
+STRIPE_MAX_RETRIES = 2
+STRIPE_RETRY_BACKOFF = 0.5
+STRIPE_POOL_SIZE = 10
+
+# Determines the longest time, in seconds, each process caches the product
+# catalogue for before picking up changes made by other processes.
+PRODUCT_CACHE_TIMEOUT = 300
+
+# Determines how many seconds Stripe charges which may still change are
+# cached for, and how many threads retrieve uncached charges in bulk.
+STRIPE_CHARGE_CACHE_TIMEOUT = 300
+STRIPE_PREFETCH_WORKERS = 8
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/1.10/howto/deployment/checklist/
 
@@ -49,7 +133,9 @@ AUTHENTICATION_BACKENDS = [
 REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': (
         'django_filters.rest_framework.backends.DjangoFilterBackend',
-    )
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'rest_api.pagination.CursorPagination',
+    'PAGE_SIZE': REST_API_PAGE_SIZE,
 }
 
 
@@ -99,6 +185,7 @@ TEMPLATES = [
                 'django.template.context_processors.media',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'home.context_processors.fragment_cache',
             ],
         },
     },
@@ -171,3 +258,15 @@ SOCIAL_AUTH_SETTINGS = {
 
 # Temporary local settings
 from ACM_General.settings_local import *
+
+# Compiles each template once per process outside of development, rather than
+# reading and parsing it on every render. While DEBUG is on, templates are
+# read on every render so that edits show up without a restart.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
@@ -14,3 +14,9 @@ class AccountsConfig(AppConfig):
     Defines a global app name for the accounts app.
     """
     name = 'accounts'
+
+    def ready(self):
+        """
+        Connects the Accounts app's signal receivers.
+        """
+        from . import signals  # noqa: F401
@@ -5,6 +5,7 @@ Custom User authentication backends.
 from __future__ import unicode_literals
 
 # local Django
+from .cache import user_cache
 from .models import User
 
 
@@ -58,6 +59,25 @@ class UserBackend(object):
         return is_active or is_active is None
 
     def get_user(self, user_id):
+        """
+        Fetches the user whose id (UUID) matches the given user_id, from the
+        :data:`~accounts.cache.user_cache` if it was recently fetched.
+
+        :param user_id: The UUID for which to find a user for.
+        :type user_id: str
+
+        :return: The :class:`~accounts.models.User` object posessing the UUID
+                 or None if the UUID does not exist within the database.
+        :rtype: :class:`~accounts.models.User`
+        """
+        user = user_cache.get(user_id, self.fetch_user)
+        if user is None:
+            return None
+
+        return user if self.user_can_authenticate(user) else None
+
+    @staticmethod
+    def fetch_user(user_id):
         """
         Fetches the user from the database whose id (UUID) matches the given
         user_id.
@@ -67,11 +87,9 @@ class UserBackend(object):
 
         :return: The :class:`~accounts.models.User` object posessing the UUID
                  or None if the UUID does not exist within the database.
-        :rtype: :class:`~accounts.models.User`
+        :rtype: :class:`~accounts.models.User` or None
         """
         try:
-            user = User.objects.get(pk=user_id)
+            return User.objects.get(pk=user_id)
         except User.DoesNotExist:
             return None
-
-        return user if self.user_can_authenticate(user) else None
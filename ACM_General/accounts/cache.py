@@ -0,0 +1,163 @@
+"""
+Caches the users resolved for each authenticated request, so that
+``request.user`` does not cost a query on every page view.
+"""
+# standard library
+from collections import OrderedDict
+import copy
+import threading
+import time
+
+# Django
+from django.conf import settings
+from django.core.cache import caches
+
+
+class UserCache(object):
+    """
+    A process-local LRU cache of :class:`~accounts.models.User` objects with a
+    time-to-live, in front of an optional shared Django cache.
+
+    When ``ACCOUNTS_USER_CACHE_ALIAS`` names one of the ``CACHES``, each user
+    is stored there under a version number which is incremented whenever the
+    user is invalidated. Every process checks the version before trusting its
+    local copy, so an invalidation in one process is seen by all of them.
+    Without a shared cache, a change made by another process is seen once the
+    local copy expires.
+
+    Invalidation is driven by ``post_save`` and ``post_delete``, so changes
+    made with ``QuerySet.update()`` must call :meth:`invalidate` themselves or
+    wait for the time-to-live to pass.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    @property
+    def timeout(self):
+        """
+        The seconds a user is cached for, as set by
+        ``ACCOUNTS_USER_CACHE_TIMEOUT``.
+
+        :rtype: int
+        """
+        return getattr(settings, 'ACCOUNTS_USER_CACHE_TIMEOUT', 60)
+
+    @property
+    def max_size(self):
+        """
+        The most users cached by each process, as set by
+        ``ACCOUNTS_USER_CACHE_SIZE``.
+
+        :rtype: int
+        """
+        return getattr(settings, 'ACCOUNTS_USER_CACHE_SIZE', 1000)
+
+    @property
+    def shared(self):
+        """
+        The shared cache named by ``ACCOUNTS_USER_CACHE_ALIAS``.
+
+        :return: The shared cache, or None if only the local cache is used.
+        :rtype: :class:`django.core.cache.backends.base.BaseCache` or None
+        """
+        alias = getattr(settings, 'ACCOUNTS_USER_CACHE_ALIAS', None)
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def get_version_key(user_id):
+        """
+        :return: The shared cache key holding the version of a user.
+        :rtype: str
+        """
+        return 'accounts:user-version:{}'.format(user_id)
+
+    @staticmethod
+    def get_user_key(user_id, version):
+        """
+        :return: The shared cache key holding a version of a user.
+        :rtype: str
+        """
+        return 'accounts:user:{}:{}'.format(user_id, version)
+
+    def get(self, user_id, fetch):
+        """
+        Returns a copy of the cached user with the given id, fetching and
+        caching it if it is missing, stale or expired.
+
+        :param user_id: The id of the user.
+        :type user_id: str or uuid.UUID
+        :param fetch: Called with the id to load the user from the database;
+                      returns None if the user does not exist.
+        :type fetch: function
+
+        :return: The user, or None if fetch returned None.
+        :rtype: :class:`~accounts.models.User` or None
+        """
+        user_id = str(user_id)
+        shared = self.shared
+        version = shared.get(self.get_version_key(user_id), 0) if shared \
+            else 0
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                user, entry_version, expires = entry
+                if entry_version == version and expires > time.monotonic():
+                    self._entries.move_to_end(user_id)
+                    return copy.deepcopy(user)
+                del self._entries[user_id]
+
+        user = None
+        if shared:
+            user = shared.get(self.get_user_key(user_id, version))
+        if user is None:
+            user = fetch(user_id)
+            if user is None:
+                return None
+            if shared:
+                shared.set(
+                    self.get_user_key(user_id, version), user, self.timeout
+                )
+
+        with self._lock:
+            self._entries[user_id] = (
+                user, version, time.monotonic() + self.timeout
+            )
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return copy.deepcopy(user)
+
+    def invalidate(self, user_id):
+        """
+        Drops the user with the given id from the cache of every process.
+
+        :param user_id: The id of the user.
+        :type user_id: str or uuid.UUID
+        """
+        user_id = str(user_id)
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+        shared = self.shared
+        if shared:
+            key = self.get_version_key(user_id)
+            shared.add(key, 0, None)
+            try:
+                shared.incr(key)
+            except ValueError:
+                # The key was evicted between add() and incr().
+                shared.set(key, 1, None)
+
+    def clear(self):
+        """
+        Drops every user cached by this process.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+#: The cache used by :meth:`accounts.backends.UserBackend.get_user`.
+user_cache = UserCache()
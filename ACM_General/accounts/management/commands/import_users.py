@@ -0,0 +1,67 @@
+"""
+Management command which imports users in bulk from a CSV file.
+"""
+# standard library
+import csv
+import time
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# local Django
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    """
+    Streams a CSV file with an ``email`` column, and optionally
+    ``first_name`` and ``last_name`` columns, into
+    :meth:`~accounts.managers.UserManager.bulk_import`.
+    """
+    help = 'Imports users in bulk from a CSV file with an email column.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='The CSV file to import.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='The number of rows imported in each transaction.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            csv_file = open(options['path'], newline='', encoding='utf-8-sig')
+        except OSError as err:
+            raise CommandError(err)
+
+        start = time.monotonic()
+        with csv_file:
+            reader = csv.DictReader(csv_file)
+            if 'email' not in (reader.fieldnames or ()):
+                raise CommandError('The CSV file has no email column.')
+
+            result = User.objects.bulk_import(
+                reader, batch_size=options['batch_size']
+            )
+        elapsed = time.monotonic() - start
+
+        for number, email, reason in result['rejected']:
+            # Row numbers are offset by the header.
+            self.stderr.write(
+                'Rejected line {} ({}): {}'.format(number + 1, email, reason)
+            )
+
+        rows = (
+            result['created'] + result['existing'] + len(result['rejected'])
+        )
+        self.stdout.write(self.style.SUCCESS(
+            'Imported {} user(s), skipped {} existing and rejected {} of {} '
+            'row(s) in {:.2f}s ({:.0f} rows/s).'.format(
+                result['created'],
+                result['existing'],
+                len(result['rejected']),
+                rows,
+                elapsed,
+                rows / elapsed if elapsed else rows,
+            )
+        ))
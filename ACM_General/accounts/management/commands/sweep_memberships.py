@@ -0,0 +1,62 @@
+"""
+Management command which records which users' memberships have started or
+expired.
+"""
+# Django
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# local Django
+from accounts.cache import user_cache
+from accounts.models import User
+from accounts.signals import membership_expired
+
+
+class Command(BaseCommand):
+    """
+    Brings ``User.membership_active`` up to date with each user's
+    membership expiration date and sends
+    :data:`~accounts.signals.membership_expired` for the memberships which
+    expired since the previous sweep.
+
+    Intended to be run periodically, such as hourly from cron.
+    """
+    help = (
+        'Updates the cached membership state of every user and sends '
+        'membership_expired for the memberships which have expired.'
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            expired = list(
+                User.objects.filter(
+                    membership_active=True
+                ).expired_members().select_for_update()
+            )
+            User.objects.filter(
+                pk__in=[user.pk for user in expired]
+            ).update(membership_active=False)
+
+            started = list(
+                User.objects.filter(
+                    membership_active=False
+                ).members().select_for_update().values_list('pk', flat=True)
+            )
+            User.objects.filter(
+                pk__in=started
+            ).update(membership_active=True)
+
+        for user_id in started:
+            user_cache.invalidate(user_id)
+        for user in expired:
+            user_cache.invalidate(user.pk)
+            user.membership_active = False
+
+        if expired:
+            membership_expired.send(sender=User, users=expired)
+
+        self.stdout.write(
+            '{} membership(s) expired and {} started.'.format(
+                len(expired), len(started)
+            )
+        )
@@ -2,14 +2,101 @@
 UserManager class and helper functions. Allows for serialized ``create_user``
 which properly validates the input as well as getting a user by email.
 """
+# standard library
+from itertools import islice
+
 # Django
-from core.actions import is_valid_email
+from core.actions import is_valid_email, validate_emails
+from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
-# Will be used if other managers return
-# from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+# local Django
+from .cache import user_cache
+
+
+class UserQuerySet(models.QuerySet):
+    """
+    Bulk operations on :class:`~accounts.models.User` objects.
+    """
+
+    def members(self):
+        """
+        Filters the users whose ACM membership is current, using the index on
+        ``membership_expiration``.
+
+        :rtype: :class:`~accounts.managers.UserQuerySet`
+        """
+        return self.filter(membership_expiration__gte=timezone.now())
+
+    def expired_members(self):
+        """
+        Filters the users whose ACM membership has expired. Users who have
+        never been a member are left out.
+
+        :rtype: :class:`~accounts.managers.UserQuerySet`
+        """
+        return self.filter(membership_expiration__lt=timezone.now())
+
+    def non_members(self):
+        """
+        Filters the users whose ACM membership is not current, including the
+        users who have never been a member.
+
+        :rtype: :class:`~accounts.managers.UserQuerySet`
+        """
+        return self.exclude(membership_expiration__gte=timezone.now())
+
+    def extend_memberships(self, time_delta):
+        """
+        Extends the ACM membership of every user in the queryset by
+        time_delta in a single ``UPDATE``. Memberships which are current are
+        extended from their expiration date, and all others from now.
+
+        The new expiration date is computed by the database, so concurrent
+        extensions of the same membership are never lost.
+
+        :param time_delta: The amount of time to extend the memberships by.
+        :type time_delta: django.utils.timezone.timedelta
+
+        :return: The number of users whose membership was extended.
+        :rtype: int
+
+        .. note::
+            ``post_save`` is not sent, so the extended users are dropped from
+            :data:`~accounts.cache.user_cache` here instead.
+        """
+        now = models.Value(
+            timezone.now(), output_field=models.DateTimeField()
+        )
+        with transaction.atomic(using=self.db):
+            # Only the users read here are updated, so that exactly the
+            # updated users are dropped from the cache.
+            user_ids = list(
+                self.select_for_update().values_list('pk', flat=True)
+            )
+            extended = self.model._default_manager.using(self.db).filter(
+                pk__in=user_ids
+            ).update(
+                membership_expiration=models.ExpressionWrapper(
+                    # Coalesce is needed as GREATEST returns NULL if any
+                    # argument is NULL on SQLite.
+                    Greatest(Coalesce('membership_expiration', now), now) +
+                    models.Value(
+                        time_delta, output_field=models.DurationField()
+                    ),
+                    output_field=models.DateTimeField(),
+                ),
+                membership_active=True,
+            )
+            for user_id in user_ids:
+                user_cache.invalidate(user_id)
+        return extended
 
 
-class UserManager(BaseUserManager):
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """
     Interface for database query operations for the
     :class:`~accounts.models.User` model.
@@ -107,3 +194,86 @@ class UserManager(BaseUserManager):
             raise ValueError('Superuser must have is_superuser=True.')
 
         return self._create_user(email, **extra_fields)
+
+    def bulk_import(self, rows, batch_size=None):
+        """
+        Creates users in bulk, such as from a semester's roster. The rows are
+        consumed in chunks of batch_size, and each chunk is validated, checked
+        against the existing users with a single query, and inserted with a
+        single ``bulk_create`` in its own transaction.
+
+        :param rows: Dictionaries with an ``email`` and optionally a
+                     ``first_name`` and ``last_name``, such as the rows of a
+                     :class:`csv.DictReader`.
+        :type rows: iterable
+        :param batch_size: The number of rows in each transaction. Defaults to
+                           ``ACCOUNTS_IMPORT_BATCH_SIZE``.
+        :type batch_size: int
+
+        :return: The number of users ``created``, the number of rows whose
+                 email was already ``existing``, and the ``rejected`` rows as
+                 tuples of their 1-based row number, email and reason.
+        :rtype: dict
+        """
+        if batch_size is None:
+            batch_size = getattr(settings, 'ACCOUNTS_IMPORT_BATCH_SIZE', 1000)
+
+        max_lengths = {
+            name: self.model._meta.get_field(name).max_length
+            for name in ('email', 'first_name', 'last_name')
+        }
+        result = {'created': 0, 'existing': 0, 'rejected': []}
+        rows = enumerate(rows, start=1)
+
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                return result
+
+            emails = [(row.get('email') or '').strip() for _, row in chunk]
+            users = {}
+            for (number, row), email, valid in zip(
+                chunk, emails, validate_emails(emails)
+            ):
+                fields = {
+                    'email': self.normalize_email(email),
+                    'first_name': (row.get('first_name') or '').strip(),
+                    'last_name': (row.get('last_name') or '').strip(),
+                }
+                if not valid:
+                    reason = 'email not whitelisted in ENFORCED_DOMAINS'
+                elif fields['email'] in users:
+                    reason = 'duplicate email'
+                else:
+                    reason = next((
+                        '{} is too long'.format(name)
+                        for name, value in fields.items()
+                        if len(value) > max_lengths[name]
+                    ), None)
+
+                if reason:
+                    result['rejected'].append((number, email, reason))
+                    continue
+
+                user = self.model(**fields)
+                user.set_unusable_password()
+                users[fields['email']] = user
+
+            with transaction.atomic(using=self.db):
+                existing = set(self.filter(
+                    email__in=users.keys()
+                ).values_list('email', flat=True))
+
+                new_users = [
+                    user for email, user in users.items()
+                    if email not in existing
+                ]
+                # Users created since the query above are skipped, so the
+                # inserted users are counted by their ids.
+                self.bulk_create(new_users, ignore_conflicts=True)
+                created = self.filter(
+                    pk__in=[user.pk for user in new_users]
+                ).count() if new_users else 0
+
+            result['existing'] += len(users) - created
+            result['created'] += created
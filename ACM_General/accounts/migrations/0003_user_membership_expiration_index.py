@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_starting_data'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('membership_expiration__isnull', False)), fields=['membership_expiration'], name='user_mem_expiration_idx'),
+        ),
+    ]
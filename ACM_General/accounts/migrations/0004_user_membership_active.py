@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:46
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_current_members(apps, schema_editor):
+    """
+    Sets membership_active for the users who are currently members.
+    """
+    User = apps.get_model("accounts", "User")
+    db_alias = schema_editor.connection.alias
+    User.objects.using(db_alias).filter(
+        membership_expiration__gte=timezone.now()
+    ).update(membership_active=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_membership_expiration_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='membership_active',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Membership Active'),
+        ),
+        migrations.RunPython(mark_current_members, migrations.RunPython.noop),
+    ]
@@ -23,6 +23,17 @@ class User(AbstractBaseUser):
     Overloading of the base user class to enable email validation
     as opposed to username validation in default django.
     """
+    class Meta:
+        indexes = [
+            # Finds the current and expired members. Users who have never
+            # been a member are left out of the index.
+            models.Index(
+                fields=['membership_expiration'],
+                name='user_mem_expiration_idx',
+                condition=models.Q(membership_expiration__isnull=False),
+            ),
+        ]
+
     #: Container for the User Manager.
     objects = managers.UserManager()
 
@@ -63,6 +74,16 @@ class User(AbstractBaseUser):
         null=True
     )
 
+    #: Whether the user was a member when memberships were last swept; kept
+    #: up to date by the ``sweep_memberships`` command. Use :attr:`is_member`
+    #: or :meth:`~accounts.managers.UserQuerySet.members` for the current
+    #: state.
+    membership_active = models.BooleanField(
+        verbose_name=_('Membership Active'),
+        default=False,
+        editable=False,
+    )
+
     #: Whether or not a user account should be considered 'active'.
     is_active = models.BooleanField(
         verbose_name=_('Is Active'),
@@ -113,16 +134,14 @@ class User(AbstractBaseUser):
         :type time_delta: django.utils.timezone.timedelta
 
         .. note::
-            This operation saves the user every time it is applied. This may
-            result in a performance bottleneck later, but the saving should
-            be a default action when applying this operation.
+            The new expiration date is computed by the database with
+            :meth:`~accounts.managers.UserQuerySet.extend_memberships`, so two
+            purchases made at the same time both extend the membership.
         """
-        if not self.is_member:
-            self.membership_expiration = timezone.now() + time_delta
-        else:
-            self.membership_expiration += time_delta
-
-        self.save()
+        User.objects.filter(pk=self.pk).extend_memberships(time_delta)
+        self.refresh_from_db(
+            fields=['membership_expiration', 'membership_active']
+        )
 
     def get_full_name(self):
         """
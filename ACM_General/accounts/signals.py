@@ -0,0 +1,30 @@
+"""
+Signal receivers which keep the user cache used by the Accounts app up to
+date.
+"""
+# Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+# local Django
+from .cache import user_cache
+from .models import User
+
+#: Sent by the ``sweep_memberships`` command with the ``users`` whose
+#: membership expired since the previous sweep.
+membership_expired = Signal()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user(sender, instance, **kwargs):
+    """
+    Drops a cached :class:`~accounts.models.User` whenever it is saved or
+    deleted.
+
+    :param sender: The model class which sent the signal.
+    :type sender: :class:`~accounts.models.User`
+    :param instance: The user which was saved or deleted.
+    :type instance: :class:`~accounts.models.User`
+    """
+    user_cache.invalidate(instance.pk)
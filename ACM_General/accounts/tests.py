@@ -2,16 +2,24 @@
 Contains all unit tests for the accounts app.
 """
 # standard library
+from io import StringIO
+import os
+import tempfile
 import uuid
+from unittest import mock
 
 # Django
+from django.core.management import call_command
 from django.db import IntegrityError
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 
 # local Django
 from . import models
 from accounts.backends import UserBackend
+from accounts.cache import user_cache
+from accounts.signals import membership_expired
 
 
 class UserModelCase(TestCase):
@@ -110,6 +118,141 @@ class UserModelCase(TestCase):
         self.assertEqual(superuser.is_admin, True)
         self.assertEqual(str(user), "johndoe@mst.edu")
 
+    def test_update_mem_expiration(self):
+        """
+        Ensures that memberships are extended from now when they have expired
+        and from their expiration date when they are current.
+        """
+        user = models.User.objects.get(email="test@mst.edu")
+        self.assertFalse(user.is_member)
+
+        before = timezone.now()
+        user.update_mem_expiration(timezone.timedelta(days=30))
+        self.assertTrue(user.is_member)
+        self.assertGreaterEqual(
+            user.membership_expiration, before + timezone.timedelta(days=30)
+        )
+
+        # A stale instance still extends the stored expiration date.
+        stale = models.User.objects.get(email="test@mst.edu")
+        expiration = user.membership_expiration
+        user.update_mem_expiration(timezone.timedelta(days=30))
+        stale.update_mem_expiration(timezone.timedelta(days=30))
+        self.assertEqual(
+            stale.membership_expiration,
+            expiration + timezone.timedelta(days=60),
+        )
+
+    def test_member_querysets(self):
+        """
+        Ensures that current and expired members are filtered in SQL.
+        """
+        now = timezone.now()
+        models.User.objects.filter(email="test@mst.edu").update(
+            membership_expiration=now + timezone.timedelta(days=1)
+        )
+        models.User.objects.filter(email="test2@mst.edu").update(
+            membership_expiration=now - timezone.timedelta(days=1)
+        )
+
+        self.assertEqual(
+            list(models.User.objects.members().values_list(
+                'email', flat=True
+            )),
+            ["test@mst.edu"],
+        )
+        self.assertEqual(
+            list(models.User.objects.expired_members().values_list(
+                'email', flat=True
+            )),
+            ["test2@mst.edu"],
+        )
+        self.assertNotIn(
+            "test@mst.edu",
+            models.User.objects.non_members().values_list('email', flat=True),
+        )
+        self.assertEqual(models.User.objects.non_members().count(), 2)
+
+    def test_sweep_memberships_command(self):
+        """
+        Ensures that sweep_memberships updates membership_active and sends
+        membership_expired for the memberships which expired.
+        """
+        expired_users = []
+
+        def receiver(sender, users, **kwargs):
+            expired_users.extend(users)
+
+        membership_expired.connect(receiver)
+        self.addCleanup(membership_expired.disconnect, receiver)
+
+        user = models.User.objects.get(email="test@mst.edu")
+        user.update_mem_expiration(timezone.timedelta(days=1))
+        self.assertTrue(
+            models.User.objects.get(email="test@mst.edu").membership_active
+        )
+
+        models.User.objects.filter(email="test@mst.edu").update(
+            membership_expiration=timezone.now() - timezone.timedelta(days=1)
+        )
+        models.User.objects.filter(email="test2@mst.edu").update(
+            membership_expiration=timezone.now() + timezone.timedelta(days=1)
+        )
+
+        out = StringIO()
+        call_command('sweep_memberships', stdout=out)
+        self.assertIn('1 membership(s) expired and 1 started.', out.getvalue())
+        self.assertEqual(expired_users, [user])
+        self.assertEqual(
+            set(models.User.objects.filter(
+                membership_active=True
+            ).values_list('email', flat=True)),
+            {"test2@mst.edu"},
+        )
+
+        # Nothing has changed since the previous sweep.
+        call_command('sweep_memberships', stdout=out)
+        self.assertEqual(expired_users, [user])
+
+    def test_extend_memberships(self):
+        """
+        Ensures that memberships are extended in bulk with one update, in a
+        transaction with the read of the users to drop from the user cache.
+        """
+        now = timezone.now()
+        current = now + timezone.timedelta(days=10)
+        models.User.objects.filter(email="test@mst.edu").update(
+            membership_expiration=current
+        )
+        models.User.objects.filter(email="test2@mst.edu").update(
+            membership_expiration=now - timezone.timedelta(days=10)
+        )
+        models.User.objects.create(email="test3@mst.edu")
+
+        # A SELECT and an UPDATE inside a savepoint.
+        with self.assertNumQueries(4):
+            count = models.User.objects.filter(email__in=(
+                "test@mst.edu", "test2@mst.edu", "test3@mst.edu"
+            )).extend_memberships(
+                timezone.timedelta(days=30)
+            )
+        self.assertEqual(count, 3)
+
+        self.assertEqual(
+            models.User.objects.get(
+                email="test@mst.edu"
+            ).membership_expiration,
+            current + timezone.timedelta(days=30),
+        )
+        for email in ("test2@mst.edu", "test3@mst.edu"):
+            expiration = models.User.objects.get(
+                email=email
+            ).membership_expiration
+            self.assertGreaterEqual(
+                expiration, now + timezone.timedelta(days=30)
+            )
+            self.assertLess(expiration, now + timezone.timedelta(days=31))
+
 
 class ManagerTestCase(TestCase):
     """
@@ -205,6 +348,95 @@ class ManagerTestCase(TestCase):
         self.assertEqual(user.is_superuser, True)
         self.assertEqual(user.is_staff, True)
 
+    def test_bulk_import_function(self):
+        """
+        Ensures that bulk_import creates valid users in batches and reports
+        the rows it rejects.
+        """
+        models.User.objects.create_user('existing@mst.edu')
+        rows = [
+            {'email': 'one@mst.edu', 'first_name': 'One', 'last_name': 'A'},
+            {'email': ' two@MST.EDU ', 'first_name': 'Two'},
+            {'email': 'one@mst.edu'},
+            {'email': 'existing@mst.edu'},
+            {'email': 'test@fail.com'},
+            {'email': ''},
+            {'email': 'three@mst.edu', 'first_name': 'x' * 31},
+            {'email': 'four@mst.edu'},
+        ]
+
+        # A SELECT, an INSERT and a COUNT inside a savepoint for each chunk.
+        with self.assertNumQueries(10):
+            result = models.User.objects.bulk_import(rows, batch_size=4)
+
+        self.assertEqual(result['created'], 3)
+        self.assertEqual(result['existing'], 1)
+        self.assertEqual(
+            [(number, reason) for number, _, reason in result['rejected']],
+            [
+                (3, 'duplicate email'),
+                (5, 'email not whitelisted in ENFORCED_DOMAINS'),
+                (6, 'email not whitelisted in ENFORCED_DOMAINS'),
+                (7, 'first_name is too long'),
+            ],
+        )
+
+        user = models.User.objects.get(email='two@mst.edu')
+        self.assertEqual(user.first_name, 'Two')
+        self.assertFalse(user.has_usable_password())
+        self.assertTrue(
+            models.User.objects.filter(email='four@mst.edu').exists()
+        )
+
+    def test_bulk_import_counts_conflicts_as_existing(self):
+        """
+        Ensures that a user created by someone else while bulk_import runs is
+        counted as existing rather than created.
+        """
+        bulk_create = models.User.objects.bulk_create
+
+        def create_conflicting_user(objs, **kwargs):
+            models.User.objects.create_user('racing@mst.edu')
+            return bulk_create(objs, **kwargs)
+
+        with mock.patch.object(
+            models.User.objects, 'bulk_create', create_conflicting_user
+        ):
+            result = models.User.objects.bulk_import([
+                {'email': 'racing@mst.edu'}, {'email': 'new@mst.edu'},
+            ])
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(result['existing'], 1)
+        self.assertEqual(
+            models.User.objects.filter(email__in=(
+                'racing@mst.edu', 'new@mst.edu'
+            )).count(),
+            2,
+        )
+
+    def test_import_users_command(self):
+        """
+        Ensures that the import_users command imports a CSV file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'roster.csv')
+            with open(path, 'w', newline='') as csv_file:
+                csv_file.write(
+                    'email,first_name,last_name\n'
+                    'one@mst.edu,One,A\n'
+                    'bad@fail.com,Bad,B\n'
+                )
+
+            out, err = StringIO(), StringIO()
+            call_command('import_users', path, stdout=out, stderr=err)
+
+        self.assertIn('Imported 1 user(s)', out.getvalue())
+        self.assertIn('Rejected line 3 (bad@fail.com)', err.getvalue())
+        self.assertTrue(
+            models.User.objects.filter(email='one@mst.edu').exists()
+        )
+
 
 class ViewTestCase(TestCase):
     """
@@ -269,6 +501,7 @@ class UserAuthBackendCase(TestCase):
         """
         super().setUp()
         self.backend = UserBackend()
+        user_cache.clear()
         models.User.objects.create_user("test@mst.edu")
         models.User.objects.create_user("test2@mst.edu", is_active=False)
 
@@ -314,6 +547,100 @@ class UserAuthBackendCase(TestCase):
             None
         )
 
+    def test_get_user_is_cached(self):
+        user = models.User.objects.create_user('test4@mst.edu')
+        self.backend.get_user(user.id)
+
+        with self.assertNumQueries(0):
+            cached = self.backend.get_user(str(user.id))
+        self.assertEqual(cached, user)
+        # Each request gets its own copy of the user.
+        self.assertIsNot(cached, self.backend.get_user(user.id))
+
+        user.first_name = 'Changed'
+        user.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.backend.get_user(user.id).first_name, 'Changed'
+            )
+
+        user.is_active = False
+        user.save()
+        self.assertIsNone(self.backend.get_user(user.id))
+
+        user_id = user.id
+        user.delete()
+        self.assertIsNone(self.backend.get_user(user_id))
+
+    def test_get_user_sees_extended_memberships(self):
+        user = models.User.objects.create_user('test4@mst.edu')
+        self.assertFalse(self.backend.get_user(user.id).is_member)
+
+        models.User.objects.filter(pk=user.pk).extend_memberships(
+            timezone.timedelta(weeks=1)
+        )
+        self.assertTrue(self.backend.get_user(user.id).is_member)
+
+        user.update_mem_expiration(timezone.timedelta(weeks=1))
+        self.assertTrue(user.membership_active)
+        self.assertEqual(
+            self.backend.get_user(user.id).membership_expiration,
+            user.membership_expiration,
+        )
+
+        models.User.objects.filter(pk=user.pk).update(
+            membership_expiration=timezone.now() - timezone.timedelta(days=1)
+        )
+        user_cache.invalidate(user.pk)
+        self.backend.get_user(user.id)
+        call_command('sweep_memberships', stdout=StringIO())
+        self.assertFalse(self.backend.get_user(user.id).membership_active)
+
+        models.User.objects.filter(pk=user.pk).update(
+            membership_expiration=timezone.now() + timezone.timedelta(days=1)
+        )
+        user_cache.invalidate(user.pk)
+        self.backend.get_user(user.id)
+        call_command('sweep_memberships', stdout=StringIO())
+        self.assertTrue(self.backend.get_user(user.id).membership_active)
+
+    def test_get_user_cache_expires(self):
+        user = models.User.objects.create_user('test4@mst.edu')
+
+        with self.settings(ACCOUNTS_USER_CACHE_TIMEOUT=0):
+            self.backend.get_user(user.id)
+            with self.assertNumQueries(1):
+                self.backend.get_user(user.id)
+
+    def test_get_user_shared_cache_versions(self):
+        caches = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+            'users': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'accounts-tests',
+            },
+        }
+        with self.settings(CACHES=caches, ACCOUNTS_USER_CACHE_ALIAS='users'):
+            user = models.User.objects.create_user('test4@mst.edu')
+            self.backend.get_user(user.id)
+
+            # Another process finds the user in the shared cache.
+            user_cache.clear()
+            with self.assertNumQueries(0):
+                self.assertEqual(self.backend.get_user(user.id), user)
+
+            # Another process invalidates the user.
+            version = user_cache.shared.get(
+                user_cache.get_version_key(user.id), 0
+            )
+            user_cache.shared.set(
+                user_cache.get_version_key(user.id), version + 1
+            )
+            with self.assertNumQueries(1):
+                self.backend.get_user(user.id)
+
 
 class PermissionModelTestCase(TestCase):
     """
@@ -9,11 +9,70 @@ import re
 # Django
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.dispatch import receiver
 from django import template
 from django.template.defaultfilters import stringfilter
+from django.test.signals import setting_changed
 
 register = template.Library()
 
+#: The lowercased domains of ENFORCED_EMAIL_DOMAINS, built on first use and
+#: dropped whenever the setting changes.
+_enforced_domains = None
+
+
+@receiver(setting_changed)
+def reset_enforced_domains(setting, **kwargs):
+    """
+    Drops the cached email domains when ``ENFORCED_EMAIL_DOMAINS`` is
+    changed, such as by ``override_settings``.
+
+    :param setting: The name of the setting which changed.
+    :type setting: str
+    """
+    global _enforced_domains
+    if setting == 'ENFORCED_EMAIL_DOMAINS':
+        _enforced_domains = None
+
+
+def get_enforced_domains():
+    """
+    Validates ``ENFORCED_EMAIL_DOMAINS`` and returns them as a set, so each
+    email is checked with a single lookup no matter how many domains are
+    allowed.
+
+    :return: The lowercased domains emails are allowed to use.
+    :rtype: frozenset
+
+    :raise ImproperlyConfigured: Raises when the setting is missing or one of
+                                 its domains is invalid.
+    """
+    global _enforced_domains
+    if _enforced_domains is not None:
+        return _enforced_domains
+
+    valid_domains = getattr(settings, 'ENFORCED_EMAIL_DOMAINS', None)
+
+    if valid_domains is None:
+        raise ImproperlyConfigured('ENFORCED_EMAIL_DOMAINS must be specified'
+                                   'in the Django configuration.')
+    for domain in valid_domains:
+        if re.fullmatch(r'.+\..+', domain) is None:
+            raise ImproperlyConfigured('Emails much match the pattern foo.foo')
+
+    _enforced_domains = frozenset(domain.lower() for domain in valid_domains)
+    return _enforced_domains
+
+
+def _matches_domains(email, domains):
+    """
+    Checks that an email has a non-empty local part and that the domain after
+    its last ``@`` is exactly one of the given domains.
+    """
+    local, _, domain = email.rpartition('@')
+    return bool(local) and domain.lower() in domains
+
+
 def is_valid_email(email):
     """
     Ensures the any email passed into it adheres to the email domains
@@ -28,15 +87,21 @@ def is_valid_email(email):
 
     :raise ImproperlyConfigured: Raises when encountering an invalid email.
     """
-    valid_domains = getattr(settings, 'ENFORCED_EMAIL_DOMAINS', None)
+    return _matches_domains(email, get_enforced_domains())
 
-    if valid_domains is None:
-        raise ImproperlyConfigured('ENFORCED_EMAIL_DOMAINS must be specified'
-                                   'in the Django configuration.')
-    for domain in valid_domains:
-        if re.fullmatch(r'.+\..+', domain) is None:
-            raise ImproperlyConfigured('Emails much match the pattern foo.foo')
-        if(re.fullmatch(r'.+@' + domain, email)):
-            return True
 
-    return False
+def validate_emails(emails):
+    """
+    Checks many emails against ``ENFORCED_EMAIL_DOMAINS`` at once, such as
+    when importing users in bulk.
+
+    :param emails: The emails to be validated.
+    :type emails: iterable
+
+    :return: Whether each email is valid, in the order they were given.
+    :rtype: list
+
+    :raise ImproperlyConfigured: Raises when encountering an invalid email.
+    """
+    domains = get_enforced_domains()
+    return [_matches_domains(email, domains) for email in emails]
@@ -3,6 +3,7 @@ Defines the app name for the core app.
 """
 # Django
 from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
 
 
 class CoreConfig(AppConfig):
@@ -10,3 +11,10 @@ class CoreConfig(AppConfig):
     Defines a global app name for the core app.
     """
     name = 'core'
+
+    def ready(self):
+        """
+        Imports the ``tasks`` module of every installed app so that their
+        background tasks are registered with the job queue.
+        """
+        autodiscover_modules('tasks')
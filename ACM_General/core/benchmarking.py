@@ -0,0 +1,71 @@
+"""
+Contains the dataset the management commands which measure the site's
+queries and pages are run against.
+"""
+# Django
+from django.utils import timezone
+
+# local Django
+from accounts.models import User
+from events.models import Event
+from products.models import Transaction, TransactionCategory
+from sigs.models import SIG
+
+
+def seed(rows):
+    """
+    Bulk inserts a dataset shaped like a few years of the site's usage.
+
+    :param rows: The number of users, events and transactions to create.
+    :type rows: int
+    """
+    now = timezone.now()
+    users = User.objects.bulk_create(
+        User(
+            email='seed{}@mst.edu'.format(i),
+            # Only a small fraction of users are current members.
+            membership_expiration=(
+                now + timezone.timedelta(days=i % 100) if i % 50 == 0
+                else now - timezone.timedelta(days=i % 1000)
+            ),
+        )
+        for i in range(rows)
+    )
+    sigs = SIG.objects.bulk_create(
+        SIG(
+            id='seed-{}'.format(i),
+            founder=users[i],
+            chair=users[i],
+            description='seed',
+        )
+        for i in range(max(1, rows // 100))
+    )
+    category = TransactionCategory.objects.create_category('seed')
+
+    Event.objects.bulk_create(
+        Event(
+            creator=users[i],
+            hosting_sig=sigs[i % len(sigs)],
+            title='seed',
+            description='seed',
+            location='seed',
+            # Only a small fraction of events have not yet expired.
+            date_hosted=now + timezone.timedelta(days=i - rows + 50),
+            date_expire=now + timezone.timedelta(days=i - rows + 51),
+            flier='seed.png',
+        )
+        for i in range(rows)
+    )
+    Transaction.objects.bulk_create(
+        Transaction(
+            description='seed',
+            category=category,
+            sig=sigs[i % len(sigs)],
+            cost=5,
+            user=users[i],
+            stripe_token='seed',
+            charge_id='seed',
+            customer_id='seed',
+        )
+        for i in range(rows)
+    )
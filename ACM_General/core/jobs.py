@@ -0,0 +1,96 @@
+"""
+Registry and runner for the tasks executed by the background job queue.
+"""
+# standard library
+import json
+import logging
+import traceback
+
+# local Django
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_tasks = {}
+_failure_handlers = {}
+
+
+def register(name, on_failure=None):
+    """
+    Decorator which registers a function as a task that can be enqueued
+    under the given name with :meth:`~core.managers.JobManager.enqueue`.
+
+    :param name: The unique name of the task.
+    :type name: str
+    :param on_failure: Called with the task's keyword arguments once a job
+                       of the task is marked as failed, whether its final
+                       attempt raised an exception or its worker died.
+    :type on_failure: function
+
+    :return: A decorator returning the function unchanged.
+    :rtype: function
+    """
+    def decorator(func):
+        _tasks[name] = func
+        if on_failure is not None:
+            _failure_handlers[name] = on_failure
+        return func
+    return decorator
+
+
+def run_failure_handler(job):
+    """
+    Runs the failure handler registered for the task of a failed job, if any.
+    An exception raised by the handler is logged rather than raised.
+
+    :param job: The job which was marked as failed.
+    :type job: :class:`~core.models.Job`
+    """
+    handler = _failure_handlers.get(job.task)
+    if handler is None:
+        return
+
+    try:
+        handler(**json.loads(job.payload))
+    except Exception:
+        logger.exception(
+            'The failure handler of job %s (%s) failed.', job.pk, job.task
+        )
+
+
+def run_next_job():
+    """
+    Claims and runs a single job. A job which raises an exception is retried
+    later, or has its task's failure handler run once it has used up its
+    attempts.
+
+    :return: True if a job was claimed, False if the queue was empty.
+    :rtype: bool
+    """
+    job = Job.objects.claim()
+    if job is None:
+        return False
+
+    try:
+        _tasks[job.task](**json.loads(job.payload))
+    except Exception:
+        logger.exception('Job %s (%s) failed.', job.pk, job.task)
+        if job.retry(traceback.format_exc()) and job.status == Job.FAILED:
+            run_failure_handler(job)
+    else:
+        job.complete()
+
+    return True
+
+
+def run_pending_jobs():
+    """
+    Runs jobs until none are ready to be claimed.
+
+    :return: The number of jobs which were claimed.
+    :rtype: int
+    """
+    count = 0
+    while run_next_job():
+        count += 1
+    return count
@@ -0,0 +1,200 @@
+"""
+Management command which measures the time taken to render each page with and
+without the production template mode.
+"""
+# standard library
+import copy
+import time
+
+# Django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+# local Django
+from accounts.models import User
+from core.benchmarking import seed
+
+
+class Command(BaseCommand):
+    """
+    Seeds the database, then times each page of the site rendered with
+    templates read on every render and no fragment caching, as while DEBUG is
+    on, against the same page rendered with the cached template loader and
+    ``{% cache %}`` fragments, and fails if the two pages differ by a byte.
+
+    Pages are requested by a signed-in user, so that they are rendered rather
+    than served from the anonymous page cache. Everything seeded by the
+    command is rolled back before it exits.
+    """
+    help = (
+        'Seeds a dataset inside a transaction which is rolled back and '
+        'compares the time taken to render each page with and without the '
+        'cached template loader and fragment caching.'
+    )
+
+    #: The names of the urls of the pages which are rendered.
+    pages = (
+        'home:index',
+        'home:sponsors',
+        'home:media',
+        'home:officers',
+        'home:sigs',
+        'events:events-list',
+        'events:events-archive',
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='The number of users, events and transactions to seed.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='The number of times each page is requested.',
+        )
+
+    def handle(self, *args, **options):
+        # The pages are requested for a host the site serves.
+        hosts = [host for host in settings.ALLOWED_HOSTS if host != '*']
+        client = Client(
+            HTTP_HOST=hosts[0].lstrip('.') if hosts else 'localhost'
+        )
+
+        with transaction.atomic():
+            seed(options['rows'])
+            client.force_login(User.objects.order_by('email').first())
+
+            mismatches = []
+            for name in self.pages:
+                url = reverse(name)
+                with self.development_mode():
+                    development, development_seconds = self.time_page(
+                        client, url, options['repeat']
+                    )
+                with self.production_mode():
+                    production, production_seconds = self.time_page(
+                        client, url, options['repeat']
+                    )
+
+                if development != production:
+                    mismatches.append(name)
+                self.stdout.write(
+                    '{}: development {:.1f}ms, production {:.1f}ms, {:.1f}x '
+                    'faster{}'.format(
+                        name,
+                        development_seconds * 1000,
+                        production_seconds * 1000,
+                        development_seconds / production_seconds,
+                        '' if development == production
+                        else ' (OUTPUT DIFFERS)',
+                    )
+                )
+
+            transaction.set_rollback(True)
+
+        if mismatches:
+            raise CommandError(
+                'The following pages differ between template modes: '
+                '{}'.format(', '.join(mismatches))
+            )
+
+    @staticmethod
+    def get_caches(fragment_backend):
+        """
+        :return: The configured caches, with ``template_fragments`` stored in
+                 the given backend.
+        :rtype: dict
+        """
+        caches = copy.deepcopy(getattr(settings, 'CACHES', {}))
+        caches.setdefault('default', {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        })
+        caches['template_fragments'] = {
+            'BACKEND': fragment_backend,
+            'LOCATION': 'benchmark_templates',
+        }
+        return caches
+
+    @staticmethod
+    def get_templates(loaders):
+        """
+        :return: The configured template engines, with the first one reading
+                 templates through the given loaders.
+        :rtype: list
+        """
+        templates = copy.deepcopy(settings.TEMPLATES)
+        templates[0]['APP_DIRS'] = False
+        templates[0]['OPTIONS']['loaders'] = loaders
+        return templates
+
+    def development_mode(self):
+        """
+        :return: Settings which read every template on each render and do not
+                 cache fragments, as while DEBUG is on.
+        :rtype: :class:`django.test.utils.override_settings`
+        """
+        return override_settings(
+            TEMPLATES=self.get_templates([
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
+            CACHES=self.get_caches(
+                'django.core.cache.backends.dummy.DummyCache'
+            ),
+        )
+
+    def production_mode(self):
+        """
+        :return: Settings which compile each template once and cache
+                 fragments, as when DEBUG is off.
+        :rtype: :class:`django.test.utils.override_settings`
+        """
+        return override_settings(
+            TEMPLATES=self.get_templates([
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ]),
+            CACHES=self.get_caches(
+                'django.core.cache.backends.locmem.LocMemCache'
+            ),
+        )
+
+    @staticmethod
+    def time_page(client, url, repeat):
+        """
+        Requests a page a number of times.
+
+        :param client: The client of the signed-in user.
+        :type client: :class:`django.test.Client`
+        :param url: The url of the page.
+        :type url: str
+        :param repeat: The number of times to request the page.
+        :type repeat: int
+
+        :return: The content of the page and the median number of seconds
+                 taken to render it.
+        :rtype: tuple
+        """
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = client.get(url)
+            timings.append(time.perf_counter() - start)
+
+        if response.status_code != 200:
+            raise CommandError('{} returned a {} response.'.format(
+                url, response.status_code
+            ))
+
+        timings.sort()
+        return response.content, timings[len(timings) // 2]
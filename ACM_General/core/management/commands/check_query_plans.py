@@ -0,0 +1,149 @@
+"""
+Management command which ensures the site's hot queries are served by indexes.
+"""
+# standard library
+import re
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+# local Django
+from accounts.models import User
+from core.benchmarking import seed
+from events.models import Event
+from products.models import Transaction
+from sigs.models import SIG
+
+
+class Command(BaseCommand):
+    """
+    Seeds the database with a large dataset, runs ``EXPLAIN`` on each of the
+    hot queries, and fails if any of them falls back to a sequential scan.
+
+    Everything seeded by the command is rolled back before it exits.
+    """
+    help = (
+        'Seeds a large dataset inside a transaction which is rolled back, '
+        'runs EXPLAIN on the hot queries, and fails if any of them uses a '
+        'sequential scan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=10000,
+            help='The number of users, events and transactions to seed.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            raise CommandError(
+                'check_query_plans does not support the {} database '
+                'backend.'.format(connection.vendor)
+            )
+
+        failures = []
+        with transaction.atomic():
+            seed(options['rows'])
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+            for label, queryset in self.get_hot_queries():
+                plan = queryset.explain()
+                if self.is_sequential_scan(plan):
+                    failures.append(label)
+                    self.stdout.write(
+                        self.style.ERROR('SEQUENTIAL SCAN  ' + label)
+                    )
+                else:
+                    self.stdout.write(self.style.SUCCESS('OK  ' + label))
+
+                if options['verbosity'] > 1 or label in failures:
+                    self.stdout.write(plan)
+
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(
+                'The following queries use a sequential scan: {}'.format(
+                    ', '.join(failures)
+                )
+            )
+
+    @staticmethod
+    def get_hot_queries():
+        """
+        Returns the queries the site relies on being fast.
+
+        :return: Pairs of a human-readable label and the queryset to explain.
+        :rtype: list
+        """
+        now = timezone.now()
+        user = User.objects.order_by('email').first()
+        sig = SIG.objects.order_by('id').first()
+
+        return [
+            (
+                'homepage upcoming events',
+                Event.objects.active().order_by('date_hosted')[:3],
+            ),
+            (
+                'past events archive',
+                Event.objects.past().order_by('-date_hosted')[:10],
+            ),
+            (
+                'event search',
+                Event.objects.search('seed').order_by('-date_created', 'id')[
+                    :100
+                ],
+            ),
+            (
+                'events rest_api page',
+                Event.objects.order_by('-date_created', 'id')[:100],
+            ),
+            (
+                'transactions rest_api page',
+                Transaction.objects.order_by('-date_created', 'id')[:100],
+            ),
+            (
+                'transactions of a user',
+                Transaction.objects.filter(
+                    user=user
+                ).order_by('-date_created'),
+            ),
+            (
+                'transactions of a SIG over a year',
+                Transaction.objects.filter(
+                    sig=sig,
+                    date_created__gte=now - timezone.timedelta(days=365),
+                ),
+            ),
+            (
+                'current members',
+                User.objects.filter(membership_expiration__gte=now),
+            ),
+        ]
+
+    @staticmethod
+    def is_sequential_scan(plan):
+        """
+        Checks whether an ``EXPLAIN`` plan reads any table sequentially.
+
+        :param plan: The plan returned by ``QuerySet.explain()``.
+        :type plan: str
+
+        :return: True if any table is read without the use of an index.
+        :rtype: bool
+        """
+        if connection.vendor == 'postgresql':
+            return 'Seq Scan' in plan
+
+        # SQLite reports 'SCAN <table>' for full table scans and
+        # 'SCAN <table> USING INDEX <index>' for full index scans.
+        return any(
+            re.search(r'\bSCAN (TABLE )?\w+$', line.strip())
+            for line in plan.splitlines()
+        )
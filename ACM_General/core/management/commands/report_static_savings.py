@@ -0,0 +1,104 @@
+"""
+Management command which reports the bytes saved by the static asset pipeline.
+"""
+# standard library
+import os
+
+# Django
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import (ManifestFilesMixin,
+                                                staticfiles_storage)
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Compares each collected static file with its source, and reports how many
+    bytes minification and precompression save when the file is served.
+
+    The files are read from the manifest written by ``collectstatic`` through
+    :class:`core.storage.CompressedManifestStaticFilesStorage`.
+    """
+    help = (
+        'Reports the bytes saved by minifying and precompressing the '
+        'collected static files.'
+    )
+
+    def handle(self, *args, **options):
+        if not isinstance(staticfiles_storage, ManifestFilesMixin):
+            raise CommandError(
+                'STATICFILES_STORAGE does not write a manifest; set it to '
+                'core.storage.CompressedManifestStaticFilesStorage.'
+            )
+
+        manifest = staticfiles_storage.load_manifest()
+        if not manifest:
+            raise CommandError(
+                'No static files manifest was found; run collectstatic first.'
+            )
+
+        totals = {'original': 0, 'minified': 0, 'gzip': 0, 'brotli': 0}
+        for name, hashed_name in sorted(manifest.items()):
+            source = finders.find(name)
+            if source is None or not staticfiles_storage.exists(hashed_name):
+                continue
+
+            sizes = self.get_sizes(source, hashed_name)
+            for coding, size in sizes.items():
+                totals[coding] += size
+
+            if options['verbosity'] > 1:
+                self.stdout.write('{}  {} -> {} bytes'.format(
+                    hashed_name, sizes['original'], min(sizes.values())
+                ))
+
+        original = totals['original']
+        for coding in ('minified', 'gzip', 'brotli'):
+            self.stdout.write('{:<9} {:>12} bytes  ({})'.format(
+                coding.capitalize() + ':', totals[coding],
+                self.format_saving(original, totals[coding]),
+            ))
+        self.stdout.write(self.style.SUCCESS(
+            'Total bytes saved: {} of {} ({})'.format(
+                original - totals['brotli'], original,
+                self.format_saving(original, totals['brotli']),
+            )
+        ))
+
+    @staticmethod
+    def get_sizes(source, hashed_name):
+        """
+        Measures a static file at each stage of the pipeline. A stage which
+        was skipped for the file, such as brotli when it is not installed,
+        has the size of the stage before it.
+
+        :param source: The path of the file's source.
+        :type source: str
+        :param hashed_name: The name the file was collected under.
+        :type hashed_name: str
+
+        :return: The ``original``, ``minified``, ``gzip`` and ``brotli`` size
+                 of the file in bytes.
+        :rtype: dict
+        """
+        sizes = {
+            'original': os.path.getsize(source),
+            'minified': staticfiles_storage.size(hashed_name),
+        }
+        sizes['gzip'] = sizes['minified']
+        if staticfiles_storage.exists(hashed_name + '.gz'):
+            sizes['gzip'] = staticfiles_storage.size(hashed_name + '.gz')
+        sizes['brotli'] = sizes['gzip']
+        if staticfiles_storage.exists(hashed_name + '.br'):
+            sizes['brotli'] = staticfiles_storage.size(hashed_name + '.br')
+        return sizes
+
+    @staticmethod
+    def format_saving(original, size):
+        """
+        :return: The share of the original bytes saved, as a percentage.
+        :rtype: str
+        """
+        if not original:
+            return '0.0% saved'
+        return '{:.1%} saved'.format(1 - size / original)
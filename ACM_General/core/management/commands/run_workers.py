@@ -0,0 +1,105 @@
+"""
+Management command which runs the background job queue.
+"""
+# standard library
+import logging
+import threading
+
+# Django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+
+# local Django
+from core.jobs import run_next_job, run_pending_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Runs the jobs enqueued in the database, such as processing uploaded
+    fliers, on a pool of worker threads until interrupted.
+
+    Each thread claims jobs independently, so several ``run_workers``
+    processes may be run side by side to make use of more CPU cores.
+    """
+    help = 'Runs the background job queue on a pool of worker threads.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=getattr(settings, 'JOB_WORKERS', 2),
+            help='The number of threads to run jobs on.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='The seconds a thread sleeps for when the queue is empty.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run every job which is ready and exit.',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            count = run_pending_jobs()
+            self.stdout.write('Ran {} job(s).'.format(count))
+            return
+
+        stop = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self.work,
+                args=(stop, options['poll_interval']),
+                daemon=True,
+            )
+            for _ in range(options['workers'])
+        ]
+        for thread in threads:
+            thread.start()
+
+        self.stdout.write(
+            'Running {} worker thread(s).'.format(options['workers'])
+        )
+        try:
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=1.0)
+        except KeyboardInterrupt:
+            self.stdout.write('Finishing the running jobs...')
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    @staticmethod
+    def work(stop, poll_interval):
+        """
+        Claims and runs jobs until the stop event is set. A database error
+        while claiming or finishing a job, such as a locked SQLite database,
+        is logged and the worker sleeps before trying again.
+
+        :param stop: Set when the worker should exit.
+        :type stop: :class:`threading.Event`
+        :param poll_interval: The seconds to sleep for when the queue is
+                              empty.
+        :type poll_interval: float
+        """
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                try:
+                    ran = run_next_job()
+                except DatabaseError:
+                    logger.exception('Could not claim the next job.')
+                    # The connection may be unusable after the error.
+                    connection.close()
+                    ran = False
+                if not ran:
+                    stop.wait(poll_interval)
+        finally:
+            connection.close()
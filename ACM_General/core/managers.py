@@ -0,0 +1,105 @@
+"""
+Custom managers for the Core app's models.
+"""
+# standard library
+import json
+
+# Django
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class JobManager(models.Manager):
+    """
+    Enqueues and claims background :class:`~core.models.Job` objects.
+
+    Jobs are claimed with a conditional ``UPDATE`` rather than row locks, so
+    the queue behaves the same on PostgreSQL and SQLite.
+    """
+
+    def enqueue(self, task, run_after=None, **kwargs):
+        """
+        Adds a job to the queue.
+
+        :param task: The registered name of the task to run.
+        :type task: str
+        :param run_after: The earliest time the job may run, now by default.
+        :type run_after: datetime.datetime
+        :param kwargs: The JSON serializable keyword arguments the task is
+                       called with.
+
+        :return: The enqueued job.
+        :rtype: :class:`~core.models.Job`
+        """
+        return self.create(
+            task=task,
+            payload=json.dumps(kwargs),
+            max_attempts=getattr(settings, 'JOB_MAX_ATTEMPTS', 5),
+            run_after=run_after or timezone.now(),
+        )
+
+    def fail_abandoned(self):
+        """
+        Marks the jobs whose worker died on their final attempt as failed,
+        rather than retrying them, and runs their tasks' failure handlers.
+
+        :return: The jobs which were marked as failed.
+        :rtype: list
+        """
+        # Imported here as the task registry imports the Job model.
+        from .jobs import run_failure_handler
+
+        abandoned = self.filter(
+            status=self.model.RUNNING,
+            run_after__lte=timezone.now(),
+            attempts__gte=models.F('max_attempts'),
+        )
+
+        failed = []
+        for job in abandoned:
+            # Only one worker fails a given job.
+            job.status = self.model.FAILED
+            job.last_error = (
+                'The visibility timeout passed on the final attempt.'
+            )
+            if job._owned().filter(status=self.model.RUNNING).update(
+                    status=job.status, last_error=job.last_error):
+                run_failure_handler(job)
+                failed.append(job)
+
+        return failed
+
+    def claim(self):
+        """
+        Claims the job which has waited the longest, hiding it from other
+        workers for ``JOB_VISIBILITY_TIMEOUT`` seconds.
+
+        :return: The claimed job, or None if no job is ready to run.
+        :rtype: :class:`~core.models.Job` or None
+        """
+        self.fail_abandoned()
+
+        now = timezone.now()
+        visible = self.filter(
+            status__in=(self.model.PENDING, self.model.RUNNING),
+            run_after__lte=now,
+        )
+        run_after = now + timezone.timedelta(
+            seconds=getattr(settings, 'JOB_VISIBILITY_TIMEOUT', 300)
+        )
+        candidates = visible.order_by('run_after').values_list(
+            'pk', 'attempts'
+        )[:10]
+
+        for pk, attempts in candidates:
+            # Only one worker can move a job past a given attempt.
+            claimed = visible.filter(pk=pk, attempts=attempts).update(
+                status=self.model.RUNNING,
+                attempts=attempts + 1,
+                run_after=run_after,
+            )
+            if claimed:
+                return self.get(pk=pk)
+
+        return None
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:41
+
+from django.db import migrations, models
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid1, editable=False, primary_key=True, serialize=False)),
+                ('task', models.CharField(help_text='The registered name of the task to run.', max_length=100, verbose_name='Task')),
+                ('payload', models.TextField(default='{}', help_text='The JSON encoded keyword arguments of the task.', verbose_name='Payload')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('failed', 'Failed')], default='pending', help_text='Where the job is in its lifecycle.', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='How many times the job has been claimed.', verbose_name='Attempts')),
+                ('max_attempts', models.PositiveIntegerField(default=5, help_text='How many times the job may be claimed.', verbose_name='Max Attempts')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='When the job may next be claimed.', verbose_name='Run After')),
+                ('date_created', models.DateTimeField(auto_now_add=True, help_text='When the job was enqueued.', verbose_name='Date Created')),
+                ('last_error', models.TextField(blank=True, help_text='The traceback of the last failed attempt.', verbose_name='Last Error')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'run_after'], name='job_status_run_after_idx'),
+        ),
+    ]
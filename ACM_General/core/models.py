@@ -0,0 +1,157 @@
+"""
+Contains the models shared by every app, such as the background job queue.
+"""
+# standard library
+import uuid
+
+# Django
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+# local Django
+from . import managers
+
+
+class Job(models.Model):
+    """
+    A unit of background work stored in the database, to be claimed and run
+    by a ``run_workers`` process rather than inside a request.
+
+    A claimed job is hidden from other workers until its visibility timeout
+    passes. If the worker running it dies, the job becomes visible again and
+    is retried by another worker.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, _('Pending')),
+        (RUNNING, _('Running')),
+        (FAILED, _('Failed')),
+    )
+
+    class Meta:
+        indexes = [
+            # Finds the jobs which are ready to be claimed.
+            models.Index(
+                fields=['status', 'run_after'],
+                name='job_status_run_after_idx',
+            ),
+        ]
+
+    objects = managers.JobManager()
+
+    #: The id of the Job; represented as a UUIDField.
+    id = models.UUIDField(primary_key=True, default=uuid.uuid1, editable=False)
+
+    #: The registered name of the task to run; represented as a CharField.
+    task = models.CharField(
+        verbose_name=_('Task'),
+        help_text=_('The registered name of the task to run.'),
+        max_length=100,
+    )
+
+    #: The JSON encoded keyword arguments of the task; represented as a
+    #: TextField.
+    payload = models.TextField(
+        verbose_name=_('Payload'),
+        help_text=_('The JSON encoded keyword arguments of the task.'),
+        default='{}',
+    )
+
+    #: Where the job is in its lifecycle; represented as a CharField.
+    status = models.CharField(
+        verbose_name=_('Status'),
+        help_text=_('Where the job is in its lifecycle.'),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=PENDING,
+    )
+
+    #: How many times the job has been claimed; represented as a
+    #: PositiveIntegerField.
+    attempts = models.PositiveIntegerField(
+        verbose_name=_('Attempts'),
+        help_text=_('How many times the job has been claimed.'),
+        default=0,
+    )
+
+    #: How many times the job may be claimed before it is marked as failed;
+    #: represented as a PositiveIntegerField.
+    max_attempts = models.PositiveIntegerField(
+        verbose_name=_('Max Attempts'),
+        help_text=_('How many times the job may be claimed.'),
+        default=5,
+    )
+
+    #: When the job may next be claimed; represented as a DateTimeField.
+    run_after = models.DateTimeField(
+        verbose_name=_('Run After'),
+        help_text=_('When the job may next be claimed.'),
+        default=timezone.now,
+    )
+
+    #: When the job was enqueued; represented as a DateTimeField.
+    date_created = models.DateTimeField(
+        verbose_name=_('Date Created'),
+        help_text=_('When the job was enqueued.'),
+        auto_now_add=True,
+        editable=False,
+    )
+
+    #: The traceback of the job's last failed attempt; represented as a
+    #: TextField.
+    last_error = models.TextField(
+        verbose_name=_('Last Error'),
+        help_text=_('The traceback of the last failed attempt.'),
+        blank=True,
+    )
+
+    def _owned(self):
+        """
+        Filters this job only while it has not been claimed again by another
+        worker since this instance claimed it.
+
+        :rtype: :class:`django.db.models.query.QuerySet`
+        """
+        return Job.objects.filter(pk=self.pk, attempts=self.attempts)
+
+    def complete(self):
+        """
+        Removes the job from the queue once it has run successfully.
+        """
+        self._owned().delete()
+
+    def retry(self, error):
+        """
+        Releases the job after a failed attempt. The job is made visible again
+        after an exponential backoff, or marked as failed once it has used up
+        its attempts.
+
+        :param error: The traceback of the failed attempt.
+        :type error: str
+
+        :return: False if another worker has claimed the job since, in which
+                 case it is left as it is.
+        :rtype: bool
+        """
+        if self.attempts >= self.max_attempts:
+            self.status = Job.FAILED
+        else:
+            self.status = Job.PENDING
+            self.run_after = timezone.now() + timezone.timedelta(
+                seconds=getattr(settings, 'JOB_RETRY_DELAY', 30) *
+                2 ** (self.attempts - 1)
+            )
+        self.last_error = error
+
+        return bool(self._owned().update(
+            status=self.status,
+            run_after=self.run_after,
+            last_error=self.last_error,
+        ))
+
+    def __str__(self):
+        return '{} ({})'.format(self.task, self.status)
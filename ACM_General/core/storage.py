@@ -0,0 +1,197 @@
+"""
+Contains the storage ``collectstatic`` writes static files through in
+production, which minifies, content-hashes and precompresses them so they can
+be cached by browsers forever.
+"""
+# standard library
+import gzip
+import logging
+import os
+import re
+
+# Django
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import rjsmin
+except ImportError:  # pragma: no cover
+    rjsmin = None
+
+logger = logging.getLogger(__name__)
+
+#: The extensions of the static files which are stored precompressed.
+COMPRESSED_EXTENSIONS = (
+    '.css', '.eot', '.html', '.ico', '.js', '.json', '.map', '.otf', '.svg',
+    '.ttf', '.txt', '.xml',
+)
+
+#: The smallest file, in bytes, which is stored precompressed.
+COMPRESSION_MIN_SIZE = 256
+
+#: The compressed size, as a fraction of the original, above which a
+#: compressed sibling is not worth storing.
+COMPRESSION_MAX_RATIO = 0.95
+
+#: Matches the strings and comments of a stylesheet.
+CSS_TOKEN_PATTERN = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)', re.DOTALL
+)
+
+#: Matches the whitespace around the punctuation of a stylesheet which never
+#: changes its meaning.
+CSS_SPACE_PATTERN = re.compile(r'\s*([{};,])\s*|(:)\s+')
+
+
+def minify_css(content):
+    """
+    Minifies a stylesheet by dropping its comments, except those starting
+    with ``/*!`` such as licences, and the whitespace which carries no
+    meaning. Strings are left as they are, and spaces which separate the
+    parts of a selector or a ``calc()`` are kept.
+
+    :param content: The stylesheet.
+    :type content: str
+
+    :return: The minified stylesheet.
+    :rtype: str
+    """
+    parts = []
+    position = 0
+    for match in CSS_TOKEN_PATTERN.finditer(content):
+        parts.append(_minify_css_code(content[position:match.start()]))
+        string, comment = match.groups()
+        if string is not None:
+            parts.append(string)
+        elif comment.startswith('/*!'):
+            parts.append(comment)
+        position = match.end()
+    parts.append(_minify_css_code(content[position:]))
+    return ''.join(parts).strip()
+
+
+def _minify_css_code(code):
+    """
+    Minifies a stretch of a stylesheet without strings or comments.
+    """
+    code = re.sub(r'\s+', ' ', code)
+    code = CSS_SPACE_PATTERN.sub(lambda match: match.group(1) or ':', code)
+    return code.replace(';}', '}')
+
+
+def minify(name, content):
+    """
+    Minifies a stylesheet or script, unless it is already minified.
+
+    :param name: The name of the static file.
+    :type name: str
+    :param content: The content of the file.
+    :type content: bytes
+
+    :return: The minified content, or None if the file is not minified.
+    :rtype: bytes or None
+    """
+    if '.min.' in os.path.basename(name):
+        return None
+    try:
+        if name.endswith('.css'):
+            return minify_css(content.decode('utf-8')).encode('utf-8')
+        if name.endswith('.js') and rjsmin is not None:
+            return rjsmin.jsmin(content.decode('utf-8')).encode('utf-8')
+    except UnicodeDecodeError:
+        logger.warning('Not minifying %s, which is not UTF-8.', name)
+    return None
+
+
+def compress(content):
+    """
+    Compresses the content of a static file with each supported coding.
+
+    :param content: The content of the file.
+    :type content: bytes
+
+    :return: The file extension and compressed content of each coding which
+             makes the file meaningfully smaller.
+    :rtype: list
+    """
+    compressed = [('.gz', gzip.compress(content, 9, mtime=0))]
+    if brotli is not None:
+        compressed.append(('.br', brotli.compress(content)))
+    return [
+        (extension, data) for extension, data in compressed
+        if len(data) < len(content) * COMPRESSION_MAX_RATIO
+    ]
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    A :class:`~django.contrib.staticfiles.storage.ManifestStaticFilesStorage`
+    which, as ``collectstatic`` post-processes the collected files:
+
+    1. minifies stylesheets, and scripts when ``rjsmin`` is installed, before
+       their names are hashed, so the hash is that of the served content;
+    2. content-hashes every file name and records it in the manifest;
+    3. stores a ``.gz`` sibling, and a ``.br`` sibling when ``brotli`` is
+       installed, next to each compressible file, for the web server to
+       serve to clients which accept them.
+
+    A stylesheet which references a missing file keeps the reference as it
+    is, and a warning is logged, rather than failing ``collectstatic``.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+
+        for name in paths:
+            with self.open(name) as original:
+                minified = minify(name, original.read())
+            if minified is not None:
+                self.delete(name)
+                self._save(name, ContentFile(minified))
+
+        # Files are hashed from the minified copies which were collected.
+        collected = {name: (self, name) for name in paths}
+        yield from super().post_process(collected, dry_run, **options)
+
+        for name in paths:
+            self.compress_file(name)
+            hashed_name = self.hashed_files.get(self.hash_key(name))
+            if hashed_name and hashed_name != name:
+                self.compress_file(hashed_name)
+
+    def compress_file(self, name):
+        """
+        Stores the precompressed siblings of a collected file.
+
+        :param name: The name of the file.
+        :type name: str
+        """
+        if not name.endswith(COMPRESSED_EXTENSIONS):
+            return
+        with self.open(name) as original:
+            content = original.read()
+        if len(content) < COMPRESSION_MIN_SIZE:
+            return
+
+        for extension, data in compress(content):
+            if self.exists(name + extension):
+                self.delete(name + extension)
+            self._save(name + extension, ContentFile(data))
+
+    def url_converter(self, name, hashed_files, template=None):
+        converter = super().url_converter(name, hashed_files, template)
+
+        def converter_ignoring_missing(matchobj):
+            try:
+                return converter(matchobj)
+            except ValueError as err:
+                logger.warning('Leaving a reference in %s as is: %s',
+                               name, err)
+                return matchobj.group(0)
+        return converter_ignoring_missing
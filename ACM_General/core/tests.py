@@ -1,13 +1,30 @@
 """
 All tests associated with the core model.
 """
+# standard library
+from io import StringIO
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
+
 # Django
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.test import TestCase
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import CommandError, call_command
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
 # local Django
-from . import actions
+from . import actions, jobs, storage
+from .management.commands.run_workers import Command as RunWorkers
+from .models import Job
+from accounts.models import User
 
 
 class ActionsTestCase(TestCase):
@@ -52,6 +69,35 @@ class ActionsTestCase(TestCase):
         with self.assertRaises(TypeError):
             actions.is_valid_email()
 
+    def test_domain_matching(self):
+        """
+        Tests that domains are matched exactly, ignoring case.
+        """
+        with self.settings(ENFORCED_EMAIL_DOMAINS=['mst.edu', 'umr.edu']):
+            self.assertTrue(actions.is_valid_email('test@MST.edu'))
+            self.assertTrue(actions.is_valid_email('test@umr.edu'))
+            # Dots are not wildcards.
+            self.assertFalse(actions.is_valid_email('test@mstxedu'))
+            self.assertFalse(actions.is_valid_email('test@sub.mst.edu'))
+            self.assertFalse(actions.is_valid_email('test@mst.edu.com'))
+
+        # The domains are rebuilt when the setting changes.
+        with self.settings(ENFORCED_EMAIL_DOMAINS=['umr.edu']):
+            self.assertFalse(actions.is_valid_email('test@mst.edu'))
+
+    def test_validate_emails(self):
+        """
+        Tests that emails are validated in bulk.
+        """
+        with self.settings(ENFORCED_EMAIL_DOMAINS=['mst.edu']):
+            self.assertEqual(
+                actions.validate_emails(
+                    ['test@mst.edu', '@mst.edu', 'test@test.com']
+                ),
+                [True, False, False],
+            )
+            self.assertEqual(actions.validate_emails([]), [])
+
 
 class ViewTestCase(TestCase):
     """
@@ -74,3 +120,246 @@ class ViewTestCase(TestCase):
         response = self.client.get('43214321432141')
         self.assertEqual(response.status_code, 404)
         self.assertTemplateUsed(response, '404.html')
+
+
+class CommandTestCase(TestCase):
+    """
+    Testing that the core management commands work as intended.
+    """
+
+    def test_check_query_plans(self):
+        """
+        Ensures every hot query is served by an index and that the seeded
+        dataset is rolled back.
+        """
+        out = StringIO()
+        call_command('check_query_plans', rows=500, stdout=out)
+        self.assertNotIn('SEQUENTIAL SCAN', out.getvalue())
+        self.assertFalse(
+            User.objects.filter(email__startswith='seed').exists()
+        )
+
+    def test_benchmark_templates(self):
+        """
+        Ensures every page renders the same with and without the production
+        template mode, and that the seeded dataset is rolled back.
+        """
+        out = StringIO()
+        call_command('benchmark_templates', rows=50, repeat=2, stdout=out)
+        self.assertNotIn('OUTPUT DIFFERS', out.getvalue())
+        self.assertIn('events:events-list: development ', out.getvalue())
+        self.assertFalse(
+            User.objects.filter(email__startswith='seed').exists()
+        )
+
+
+class StaticFilesTestCase(TestCase):
+    """
+    Testing that collectstatic minifies, hashes and precompresses static
+    files.
+    """
+
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.source)
+        self.addCleanup(shutil.rmtree, self.root)
+
+        stylesheet = (
+            '/* A comment. */\n'
+            '.card  a:hover ,\n.card > p {\n'
+            '    background: url("../img/logo.png") no-repeat;\n'
+            '    width: calc(100% - 2px);\n'
+            '    content: "a  ;  b";\n'
+            '}\n'
+        ) * 20
+        self.write('site/css/main.css', stylesheet.encode())
+        self.write('site/img/logo.png', b'png')
+
+        settings_override = override_settings(
+            STATICFILES_DIRS=[self.source],
+            STATICFILES_FINDERS=[
+                'django.contrib.staticfiles.finders.FileSystemFinder',
+            ],
+            STATIC_ROOT=self.root,
+            STATICFILES_STORAGE=(
+                'core.storage.CompressedManifestStaticFilesStorage'
+            ),
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def write(self, name, content):
+        path = os.path.join(self.source, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as source_file:
+            source_file.write(content)
+
+    def test_minify_css(self):
+        self.assertEqual(
+            storage.minify_css(
+                '/* x */ a :hover , b > i { margin : 0 ; '
+                'width: calc(1px + 2px); }\n/*! licence */'
+            ),
+            'a :hover,b > i{margin :0;width:calc(1px + 2px)}/*! licence */',
+        )
+
+    def test_collectstatic(self):
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+        with open(os.path.join(self.root, 'staticfiles.json')) as manifest:
+            hashed_names = json.load(manifest)['paths']
+        hashed_name = hashed_names['site/css/main.css']
+        self.assertRegex(hashed_name, r'^site/css/main\.[0-9a-f]{12}\.css$')
+        self.assertEqual(
+            staticfiles_storage.url('site/css/main.css'),
+            settings.STATIC_URL + hashed_name,
+        )
+
+        with staticfiles_storage.open(hashed_name) as stylesheet:
+            content = stylesheet.read()
+        self.assertNotIn(b'comment', content)
+        self.assertIn(b'"a  ;  b"', content)
+        self.assertIn(
+            'url("../img/{}")'.format(
+                os.path.basename(hashed_names['site/img/logo.png'])
+            ).encode(),
+            content,
+        )
+
+        with staticfiles_storage.open(hashed_name + '.gz') as compressed:
+            self.assertEqual(gzip.decompress(compressed.read()), content)
+        # Files too small to benefit are not compressed.
+        self.assertFalse(staticfiles_storage.exists(
+            hashed_names['site/img/logo.png'] + '.gz'
+        ))
+
+        out = StringIO()
+        call_command('report_static_savings', stdout=out)
+        self.assertIn('Total bytes saved: ', out.getvalue())
+        self.assertNotIn('Total bytes saved: 0 ', out.getvalue())
+
+    def test_report_requires_manifest(self):
+        with self.assertRaises(CommandError):
+            call_command('report_static_savings')
+
+
+def record_failure(value):
+    """
+    Records the values of the jobs which failed.
+    """
+    JobTestCase.recorded.append('failed: {}'.format(value))
+
+
+@jobs.register('core.tests.record', on_failure=record_failure)
+def record(value):
+    """
+    A task which records the values it is called with.
+    """
+    if value == 'fail':
+        raise ValueError(value)
+    JobTestCase.recorded.append(value)
+
+
+class JobTestCase(TestCase):
+    """
+    Testing that the background job queue claims, retries and completes jobs.
+    """
+    recorded = []
+
+    def setUp(self):
+        super().setUp()
+        JobTestCase.recorded = []
+
+    def test_jobs_are_run_and_removed(self):
+        Job.objects.enqueue('core.tests.record', value='first')
+        Job.objects.enqueue('core.tests.record', value='second')
+
+        out = StringIO()
+        call_command('run_workers', once=True, stdout=out)
+
+        self.assertEqual(self.recorded, ['first', 'second'])
+        self.assertIn('Ran 2 job(s).', out.getvalue())
+        self.assertFalse(Job.objects.exists())
+
+    def test_workers_survive_database_errors(self):
+        stop = threading.Event()
+        results = [OperationalError('database is locked'), True]
+
+        def run_next_job():
+            if not results:
+                stop.set()
+                return False
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        # The worker runs on a thread of its own, as it does in production.
+        with mock.patch(
+            'core.management.commands.run_workers.run_next_job',
+            run_next_job,
+        ), self.assertLogs(
+            'core.management.commands.run_workers', 'ERROR'
+        ):
+            worker = threading.Thread(
+                target=RunWorkers.work, args=(stop, 0)
+            )
+            worker.start()
+            worker.join(timeout=5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(results, [])
+
+    def test_claimed_jobs_are_hidden_until_visibility_timeout(self):
+        Job.objects.enqueue('core.tests.record', value='test')
+
+        job = Job.objects.claim()
+        self.assertEqual(job.status, Job.RUNNING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNone(Job.objects.claim())
+
+        # The worker died, so the job is claimed again once visible.
+        Job.objects.update(run_after=timezone.now())
+        reclaimed = Job.objects.claim()
+        self.assertEqual(reclaimed.attempts, 2)
+
+        # The first worker no longer owns the job.
+        job.complete()
+        self.assertTrue(Job.objects.exists())
+        reclaimed.complete()
+        self.assertFalse(Job.objects.exists())
+
+    def test_failed_jobs_are_retried_with_backoff(self):
+        with self.settings(JOB_MAX_ATTEMPTS=2, JOB_RETRY_DELAY=60):
+            Job.objects.enqueue('core.tests.record', value='fail')
+
+            self.assertEqual(jobs.run_pending_jobs(), 1)
+            job = Job.objects.get()
+            self.assertEqual(job.status, Job.PENDING)
+            self.assertIn('ValueError', job.last_error)
+            self.assertGreater(
+                job.run_after, timezone.now() + timezone.timedelta(seconds=50)
+            )
+
+            self.assertEqual(self.recorded, [])
+
+            Job.objects.update(run_after=timezone.now())
+            self.assertEqual(jobs.run_pending_jobs(), 1)
+            self.assertEqual(Job.objects.get().status, Job.FAILED)
+            self.assertEqual(self.recorded, ['failed: fail'])
+            self.assertEqual(jobs.run_pending_jobs(), 0)
+
+    def test_timed_out_final_attempts_are_failed(self):
+        with self.settings(JOB_MAX_ATTEMPTS=1):
+            Job.objects.enqueue('core.tests.record', value='test')
+            Job.objects.claim()
+
+            Job.objects.update(run_after=timezone.now())
+            self.assertIsNone(Job.objects.claim())
+            self.assertEqual(Job.objects.get().status, Job.FAILED)
+            self.assertEqual(self.recorded, ['failed: test'])
+
+            # The failure handler only runs once.
+            self.assertIsNone(Job.objects.claim())
+            self.assertEqual(self.recorded, ['failed: test'])
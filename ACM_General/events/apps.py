@@ -10,3 +10,9 @@ class EventsConfig(AppConfig):
     Defines a global app name for the Events app.
     """
     name = 'events'
+
+    def ready(self):
+        """
+        Connects the Events app's signal receivers.
+        """
+        from . import signals  # noqa: F401
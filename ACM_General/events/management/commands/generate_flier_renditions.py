@@ -0,0 +1,42 @@
+"""
+Management command which generates the resized renditions of existing fliers.
+"""
+# Django
+from django.core.management.base import BaseCommand
+
+# local Django
+from events.models import Event
+from events.renditions import generate_flier_renditions
+
+
+class Command(BaseCommand):
+    """
+    Generates the renditions of every flier which does not yet have them,
+    such as fliers uploaded before renditions were introduced.
+    """
+    help = 'Generates the resized renditions of event fliers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Regenerate the renditions of every flier.',
+        )
+
+    def handle(self, *args, **options):
+        events = Event.objects.exclude(flier='')
+        if not options['all']:
+            events = events.filter(flier_renditions='')
+
+        for event in events.iterator():
+            try:
+                widths = generate_flier_renditions(event.flier)
+            except (IOError, OSError) as err:
+                self.stderr.write(
+                    'Skipped {}: {}'.format(event.flier.name, err)
+                )
+                continue
+
+            event.flier_renditions = ','.join(str(width) for width in widths)
+            event.save(update_fields=['flier_renditions', 'date_modified'])
+            self.stdout.write('Generated {}'.format(event.flier.name))
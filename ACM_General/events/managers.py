@@ -2,10 +2,118 @@
 Custom Event Manager and helper functions.
 """
 # Django
-from django.db import models
+from django.db import connections, models
+from django.utils import timezone
 
+# local Django
+from . import search
+from core.models import Job
 
-class EventManager(models.Manager):
+
+class EventQuerySet(models.QuerySet):
+    """
+    Chainable filters which select Events by where they fall relative to the
+    current time. All of them are evaluated by the database.
+    """
+
+    def active(self):
+        """
+        Filters the Events which have not yet expired.
+
+        :return: The Events whose date_expire has not passed.
+        :rtype: :class:`~events.managers.EventQuerySet`
+        """
+        return self.filter(date_expire__gte=timezone.now())
+
+    def upcoming(self):
+        """
+        Filters the Events which have not yet been hosted.
+
+        :return: The Events whose date_hosted has not passed.
+        :rtype: :class:`~events.managers.EventQuerySet`
+        """
+        return self.filter(date_hosted__gte=timezone.now())
+
+    def past(self):
+        """
+        Filters the Events which have already expired.
+
+        :return: The Events whose date_expire has passed.
+        :rtype: :class:`~events.managers.EventQuerySet`
+        """
+        return self.filter(date_expire__lt=timezone.now())
+
+    def search(self, terms):
+        """
+        Filters the Events whose title, description, location or presenter
+        contain every one of the terms. PostgreSQL matches stemmed words
+        through a ``tsvector`` GIN index and SQLite through an FTS5 table;
+        other databases fall back to a scan for the whole phrase.
+
+        :param terms: The search terms.
+        :type terms: str
+
+        :return: The Events matching the terms.
+        :rtype: :class:`~events.managers.EventQuerySet`
+        """
+        vendor = connections[self.db].vendor
+        table = self.model._meta.db_table
+
+        if vendor == 'postgresql':
+            return self.filter(models.expressions.RawSQL(
+                "{} @@ plainto_tsquery('english', %s)".format(
+                    search.get_postgresql_vector(table)
+                ),
+                (terms,),
+                output_field=models.BooleanField(),
+            ))
+        if vendor == 'sqlite':
+            query = search.get_sqlite_query(terms)
+            if not query:
+                return self.none()
+            return self.filter(models.expressions.RawSQL(
+                '"{}"."id" IN (SELECT id FROM {} WHERE {} '
+                'MATCH %s)'.format(
+                    table, search.SQLITE_TABLE, search.SQLITE_TABLE
+                ),
+                (query,),
+                output_field=models.BooleanField(),
+            ))
+
+        condition = models.Q()
+        for column in search.SEARCHED_COLUMNS:
+            condition |= models.Q(**{column + '__icontains': terms})
+        return self.filter(condition)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Inserts many Events at once and, as
+        :meth:`~events.models.Event.save` does, enqueues the job which
+        processes each newly uploaded flier.
+
+        :param objs: The Events to insert.
+        :type objs: list
+
+        :return: The inserted Events.
+        :rtype: list
+        """
+        objs = list(objs)
+        new_fliers = [
+            event for event in objs
+            if event.flier and not event.flier._committed
+        ]
+        for event in new_fliers:
+            event.flier_renditions = ''
+            event.flier_processed = False
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+
+        for event in new_fliers:
+            Job.objects.enqueue('events.process_flier', event_id=str(event.pk))
+        return objs
+
+
+class EventManager(models.Manager.from_queryset(EventQuerySet)):
     """
     Used to automate the creation of events.
     """
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date_expire', 'date_hosted'], name='event_expire_hosted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['date_hosted'], name='event_hosted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-date_created', 'id'], name='event_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='flier_renditions',
+            field=models.CharField(blank=True, default='', editable=False, help_text='The widths of the resized renditions of the flier.', max_length=100, verbose_name='Flier Renditions'),
+        ),
+    ]
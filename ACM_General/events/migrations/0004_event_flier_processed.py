@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_flier_renditions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='flier_processed',
+            field=models.BooleanField(default=True, editable=False, help_text='Whether the flier has finished processing.', verbose_name='Flier Processed'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='date_modified',
+            field=models.DateTimeField(auto_now=True, help_text='When the event was last changed.', verbose_name='Date Modified'),
+        ),
+    ]
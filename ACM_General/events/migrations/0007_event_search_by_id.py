@@ -0,0 +1,21 @@
+from django.db import migrations
+
+from events import search
+
+
+def reinstall_search(apps, schema_editor):
+    # The FTS5 table of 0005 pointed at the rowid of events_event, which
+    # VACUUM may renumber; it is recreated keyed on the Event's id.
+    search.uninstall(schema_editor.connection)
+    search.install(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_event_date_modified'),
+    ]
+
+    operations = [
+        migrations.RunPython(reinstall_search, reinstall_search),
+    ]
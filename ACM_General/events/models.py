@@ -12,7 +12,9 @@ from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 # local Django
+from core.models import Job
 from . import managers
+from .renditions import get_rendition_name
 
 # To stop circular import errors and allow for djangos model resolution to
 # work as it should.
@@ -51,6 +53,26 @@ class Event(models.Model):
     """
     Class used to define what is needed when creating new events.
     """
+    class Meta:
+        indexes = [
+            # Finds the active events in the order they are hosted.
+            models.Index(
+                fields=['date_expire', 'date_hosted'],
+                name='event_expire_hosted_idx',
+            ),
+            # Finds the upcoming and past events in the order they are
+            # hosted.
+            models.Index(
+                fields=['date_hosted'],
+                name='event_hosted_idx',
+            ),
+            # Keys the cursor pagination of the events rest_api list.
+            models.Index(
+                fields=['-date_created', 'id'],
+                name='event_created_id_idx',
+            ),
+        ]
+
     objects = managers.EventManager()
 
     #: An ACM member's user id; represented as a UUIDField.
@@ -69,6 +91,14 @@ class Event(models.Model):
         editable=False,
     )
 
+    #: When the event was last changed; represented as a DateTimeField.
+    date_modified = models.DateTimeField(
+        verbose_name=_('Date Modified'),
+        help_text=_('When the event was last changed.'),
+        auto_now=True,
+        editable=False,
+    )
+
     #: When the event will be held; represented as a DateTimeField.
     date_hosted = models.DateTimeField(
         verbose_name=_('Date Hosted'),
@@ -147,6 +177,26 @@ class Event(models.Model):
         upload_to=get_path_for_flier,
     )
 
+    #: The comma separated widths which resized renditions of the flier have
+    #: been generated for; represented as a CharField.
+    flier_renditions = models.CharField(
+        verbose_name=_('Flier Renditions'),
+        help_text=_('The widths of the resized renditions of the flier.'),
+        max_length=100,
+        blank=True,
+        default='',
+        editable=False,
+    )
+
+    #: Whether the flier has been stripped of its metadata and its renditions
+    #: generated by a background job; represented as a BooleanField.
+    flier_processed = models.BooleanField(
+        verbose_name=_('Flier Processed'),
+        help_text=_('Whether the flier has finished processing.'),
+        default=True,
+        editable=False,
+    )
+
     #: An optional link for the event; represented as a URLField.
     link = models.URLField(
         verbose_name=_('Event Link'),
@@ -166,6 +216,68 @@ class Event(models.Model):
         """
         return self.date_expire >= timezone.now()
 
+    def get_flier_srcset(self, extension):
+        """
+        Builds a ``srcset`` attribute listing each rendition of the flier in
+        the given format.
+
+        :param extension: The file extension of the renditions to list.
+        :type extension: str
+
+        :return: The rendition urls and their widths, or an empty string if no
+                 renditions have been generated.
+        :rtype: str
+        """
+        srcset = []
+        for width in self.flier_renditions.split(','):
+            if not width:
+                continue
+
+            url = self.flier.storage.url(
+                get_rendition_name(self.flier.name, width, extension)
+            )
+            # Fliers are rendered from pages at different depths, so relative
+            # media urls are made absolute.
+            if not url.startswith(('/', 'http://', 'https://')):
+                url = '/' + url
+            srcset.append('{} {}w'.format(url, width))
+
+        return ', '.join(srcset)
+
+    @property
+    def flier_webp_srcset(self):
+        """
+        The ``srcset`` of the WebP renditions of the flier.
+
+        :rtype: str
+        """
+        return self.get_flier_srcset('webp')
+
+    @property
+    def flier_jpeg_srcset(self):
+        """
+        The ``srcset`` of the JPEG renditions of the flier.
+
+        :rtype: str
+        """
+        return self.get_flier_srcset('jpg')
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the event and, if a new flier was uploaded, enqueues the job
+        which processes it. The event is rendered with a placeholder flier
+        until the job has finished.
+        """
+        new_flier = bool(self.flier) and not self.flier._committed
+        if new_flier:
+            self.flier_renditions = ''
+            self.flier_processed = False
+
+        super(Event, self).save(*args, **kwargs)
+
+        if new_flier:
+            Job.objects.enqueue('events.process_flier', event_id=str(self.pk))
+
     def clean(self):
         """
         The clean function is used for making checks on the data posted to the
@@ -0,0 +1,109 @@
+"""
+Generates the resized renditions of Event fliers which are served to browsers
+in place of the original upload.
+"""
+# standard library
+from io import BytesIO
+import os
+
+# third-party
+from PIL import Image, ImageOps
+
+# Django
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+#: The file extension and Pillow format of each rendition generated per width.
+RENDITION_FORMATS = (
+    ('webp', 'WEBP'),
+    ('jpg', 'JPEG'),
+)
+
+#: The formats an uploaded flier is re-encoded in to strip its metadata. Other
+#: formats, such as animated GIFs, are left as they were uploaded.
+REENCODED_FORMATS = ('JPEG', 'PNG', 'WEBP')
+
+
+def get_rendition_name(name, width, extension):
+    """
+    Used to obtain the name a rendition of a flier is stored under, next to
+    the original flier.
+
+    :param name: The name of the original flier within the storage.
+    :type name: str
+    :param width: The width of the rendition in pixels.
+    :type width: int
+    :param extension: The file extension of the rendition's format.
+    :type extension: str
+
+    :return: The name of the rendition, such as
+             ``fliers/<date_hosted>/<filename>.w640.webp``.
+    :rtype: str
+    """
+    root, _ = os.path.splitext(name)
+    return '{}.w{}.{}'.format(root, width, extension)
+
+
+def strip_flier_metadata(flier):
+    """
+    Rotates a flier according to its EXIF orientation and re-encodes it in
+    place without its metadata, such as the location a photo was taken.
+
+    :param flier: The flier of an Event which has already been saved.
+    :type flier: :class:`django.db.models.fields.files.ImageFieldFile`
+    """
+    flier.open('rb')
+    try:
+        with Image.open(flier) as original:
+            image_format = original.format
+            if image_format not in REENCODED_FORMATS:
+                return
+            image = ImageOps.exif_transpose(original)
+    finally:
+        flier.close()
+
+    buffer = BytesIO()
+    image.save(buffer, image_format, quality=90)
+
+    flier.storage.delete(flier.name)
+    flier.storage.save(flier.name, ContentFile(buffer.getvalue()))
+
+
+def generate_flier_renditions(flier):
+    """
+    Resizes a flier to each of the widths in settings.FLIER_RENDITION_WIDTHS
+    which are smaller than the original and stores the result in each of the
+    :data:`RENDITION_FORMATS`.
+
+    :param flier: The flier of an Event which has already been saved.
+    :type flier: :class:`django.db.models.fields.files.ImageFieldFile`
+
+    :return: The widths which renditions were generated for.
+    :rtype: list
+    """
+    flier.open('rb')
+    try:
+        with Image.open(flier) as original:
+            image = original.convert('RGB')
+    finally:
+        flier.close()
+
+    widths = []
+    for width in sorted(getattr(settings, 'FLIER_RENDITION_WIDTHS', [])):
+        if width >= image.width:
+            break
+
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS)
+
+        for extension, image_format in RENDITION_FORMATS:
+            buffer = BytesIO()
+            resized.save(buffer, image_format, quality=80)
+
+            name = get_rendition_name(flier.name, width, extension)
+            flier.storage.delete(name)
+            flier.storage.save(name, ContentFile(buffer.getvalue()))
+
+        widths.append(width)
+
+    return widths
@@ -0,0 +1,158 @@
+"""
+Full-text search over Events, backed by a ``tsvector`` GIN index on PostgreSQL
+and an FTS5 table on SQLite.
+"""
+# standard library
+import re
+
+#: The columns of an Event which are searched.
+SEARCHED_COLUMNS = ('title', 'description', 'location', 'presenter')
+
+#: The name of the GIN index PostgreSQL searches Events through.
+POSTGRESQL_INDEX = 'event_search_idx'
+
+#: The name of the FTS5 table SQLite searches Events through.
+SQLITE_TABLE = 'events_event_fts'
+
+#: The triggers which copy every change to an Event into the FTS5 table. The
+#: table keeps its own copy of the searched columns along with the Event's
+#: id, as the implicit rowid of the Event table may be renumbered by VACUUM.
+SQLITE_TRIGGERS = {
+    'events_event_fts_insert': (
+        'AFTER INSERT ON events_event BEGIN '
+        'INSERT INTO {table}(id, {columns}) '
+        'VALUES (new.id, {new_columns}); END'
+    ),
+    'events_event_fts_delete': (
+        'AFTER DELETE ON events_event BEGIN '
+        'DELETE FROM {table} WHERE id = old.id; END'
+    ),
+    'events_event_fts_update': (
+        'AFTER UPDATE ON events_event BEGIN '
+        'DELETE FROM {table} WHERE id = old.id; '
+        'INSERT INTO {table}(id, {columns}) '
+        'VALUES (new.id, {new_columns}); END'
+    ),
+}
+
+
+def get_postgresql_vector(table='events_event'):
+    """
+    Returns the ``tsvector`` expression Events are indexed and searched by.
+    The expression used by a search must match the indexed one exactly for
+    PostgreSQL to use the index.
+
+    :param table: The name or alias of the Event table.
+    :type table: str
+
+    :return: The SQL of the expression.
+    :rtype: str
+    """
+    return "to_tsvector('english', {})".format(" || ' ' || ".join(
+        "coalesce(\"{}\".\"{}\", '')".format(table, column)
+        for column in SEARCHED_COLUMNS
+    ))
+
+
+def get_sqlite_query(terms):
+    """
+    Turns the terms typed by a user into an FTS5 query which matches the
+    Events containing every term, so that characters with a meaning in the
+    FTS5 query syntax are searched for rather than interpreted.
+
+    :param terms: The search terms.
+    :type terms: str
+
+    :return: The FTS5 query, or an empty string if there are no terms.
+    :rtype: str
+    """
+    return ' '.join(
+        '"{}"'.format(word.replace('"', '""'))
+        for word in re.findall(r'\w+', terms)
+    )
+
+
+def install(connection):
+    """
+    Creates the index Events are searched through, and on SQLite fills it
+    with the existing Events.
+
+    :param connection: The database connection to install the index on.
+    :type connection: :class:`django.db.backends.base.base.BaseDatabaseWrapper`
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS {} ON events_event '
+                'USING GIN ({})'.format(
+                    POSTGRESQL_INDEX, get_postgresql_vector()
+                )
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5('
+                "id UNINDEXED, {}, tokenize='porter unicode61')".format(
+                    SQLITE_TABLE, ', '.join(SEARCHED_COLUMNS)
+                )
+            )
+            install_sqlite_triggers(connection)
+
+
+def install_sqlite_triggers(connection):
+    """
+    Creates any of the triggers which keep the FTS5 table in step with the
+    Event table that are missing, and refills the FTS5 table if any were.
+
+    SQLite drops the triggers of a table when a migration rebuilds it, so
+    this runs again after every migration.
+
+    :param connection: The SQLite database connection.
+    :type connection: :class:`django.db.backends.base.base.BaseDatabaseWrapper`
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND "
+            'tbl_name = %s',
+            ['events_event'],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = set(SQLITE_TRIGGERS).difference(existing)
+
+        for name in sorted(missing):
+            cursor.execute(
+                'CREATE TRIGGER {} {}'.format(
+                    name,
+                    SQLITE_TRIGGERS[name].format(
+                        table=SQLITE_TABLE,
+                        columns=', '.join(SEARCHED_COLUMNS),
+                        new_columns=', '.join(
+                            'new.' + column for column in SEARCHED_COLUMNS
+                        ),
+                    ),
+                )
+            )
+
+        if missing:
+            cursor.execute('DELETE FROM {}'.format(SQLITE_TABLE))
+            cursor.execute(
+                'INSERT INTO {table}(id, {columns}) '
+                'SELECT id, {columns} FROM events_event'.format(
+                    table=SQLITE_TABLE, columns=', '.join(SEARCHED_COLUMNS)
+                )
+            )
+
+
+def uninstall(connection):
+    """
+    Drops the index Events are searched through.
+
+    :param connection: The database connection to drop the index from.
+    :type connection: :class:`django.db.backends.base.base.BaseDatabaseWrapper`
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('DROP INDEX IF EXISTS {}'.format(POSTGRESQL_INDEX))
+        elif connection.vendor == 'sqlite':
+            for name in SQLITE_TRIGGERS:
+                cursor.execute('DROP TRIGGER IF EXISTS {}'.format(name))
+            cursor.execute('DROP TABLE IF EXISTS {}'.format(SQLITE_TABLE))
@@ -0,0 +1,27 @@
+"""
+Signal receivers which keep the full-text search index of Events intact.
+"""
+# Django
+from django.db import connections
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+# local Django
+from . import search
+
+
+@receiver(post_migrate)
+def install_search_triggers(sender, using, **kwargs):
+    """
+    Restores the triggers which keep the SQLite search table up to date
+    after a migration, as rebuilding the Event table drops them.
+
+    :param sender: The config of the app which was migrated.
+    :type sender: :class:`django.apps.AppConfig`
+    :param using: The alias of the database which was migrated.
+    :type using: str
+    """
+    connection = connections[using]
+    if (sender.name == 'events' and connection.vendor == 'sqlite' and
+            search.SQLITE_TABLE in connection.introspection.table_names()):
+        search.install_sqlite_triggers(connection)
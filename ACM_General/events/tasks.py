@@ -0,0 +1,31 @@
+"""
+Contains the Events app's background tasks, which are run by the
+``run_workers`` management command.
+"""
+# local Django
+from core.jobs import register
+from .models import Event
+from .renditions import generate_flier_renditions, strip_flier_metadata
+
+
+@register('events.process_flier')
+def process_flier(event_id):
+    """
+    Re-encodes an Event's flier without its metadata and generates its resized
+    renditions, taking the image processing off of the request path.
+
+    :param event_id: The id of the Event whose flier was uploaded.
+    :type event_id: str
+    """
+    event = Event.objects.filter(pk=event_id).first()
+    if event is None or not event.flier:
+        return
+
+    strip_flier_metadata(event.flier)
+    event.flier_renditions = ','.join(
+        str(width) for width in generate_flier_renditions(event.flier)
+    )
+    event.flier_processed = True
+    event.save(update_fields=[
+        'flier_renditions', 'flier_processed', 'date_modified',
+    ])
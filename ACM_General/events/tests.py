@@ -6,23 +6,28 @@ from datetime import datetime
 from io import BytesIO
 import os
 import tempfile
+from unittest import skipUnless
 
 # Third-Party
 from PIL import Image
 
 # Django
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import transaction
+from django.db import connection, transaction
 # from django.db.utils import IntegrityError
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
 
 # local Django
-from . import models
+from . import models, search
 from .forms import EventForm
+from .renditions import get_rendition_name
 from accounts.models import User
+from core.jobs import run_pending_jobs
+from core.models import Job
 from sigs.models import SIG
 
 
@@ -94,6 +99,102 @@ class ManagerTestCase(TestCase):
 
         self.assertEqual(event.is_active, False)
 
+    def test_active_upcoming_and_past(self):
+        now = timezone.now()
+        past = models.Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='past',
+            date_hosted=now - timezone.timedelta(days=2),
+            date_expire=now - timezone.timedelta(days=1),
+        )
+        ongoing = models.Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='ongoing',
+            date_hosted=now - timezone.timedelta(hours=1),
+            date_expire=now + timezone.timedelta(hours=1),
+        )
+        upcoming = models.Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='upcoming',
+            date_hosted=now + timezone.timedelta(days=1),
+            date_expire=now + timezone.timedelta(days=2),
+        )
+
+        self.assertEqual(
+            set(models.Event.objects.active()), {ongoing, upcoming}
+        )
+        self.assertEqual(list(models.Event.objects.upcoming()), [upcoming])
+        self.assertEqual(list(models.Event.objects.past()), [past])
+        self.assertEqual(
+            list(models.Event.objects.filter(title='past').active()), []
+        )
+
+    def test_search(self):
+        workshop = models.Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='Git workshop',
+            description='Learn branching and rebasing.',
+            location='CS 209',
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+        )
+        talk = models.Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='Lightning talks',
+            presenter='Ada Lovelace',
+            location='CS 209',
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+        )
+
+        def search(terms):
+            return set(models.Event.objects.search(terms))
+
+        self.assertEqual(search('workshops'), {workshop})
+        self.assertEqual(search('lovelace'), {talk})
+        self.assertEqual(search('CS 209'), {workshop, talk})
+        self.assertEqual(search('git talks'), set())
+        # Characters with a meaning to the search engine are searched for.
+        self.assertEqual(search('"git" OR (talks*'), set())
+        self.assertEqual(search('   '), set())
+
+        # Changes to Events are searchable straight away.
+        talk.title = 'Lightning workshop'
+        talk.save()
+        self.assertEqual(search('workshop'), {workshop, talk})
+        models.Event.objects.filter(pk=workshop.pk).update(title='Meetup')
+        self.assertEqual(search('workshop'), {talk})
+        talk.delete()
+        self.assertEqual(search('workshop'), set())
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite only')
+    def test_sqlite_search_is_keyed_on_event_ids(self):
+        """
+        Ensures the FTS5 table refers to Events by their id, which unlike
+        the rowid of the Event table is not renumbered by VACUUM.
+        """
+        event = models.Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='Git workshop',
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER events_event_fts_insert')
+            search.install_sqlite_triggers(connection)
+            cursor.execute('SELECT id FROM {}'.format(search.SQLITE_TABLE))
+            self.assertEqual(cursor.fetchall(), [(event.pk.hex,)])
+
+        self.assertEqual(
+            list(models.Event.objects.search('workshop')), [event]
+        )
+
 
 class ModelTestCase(TestCase):
     def setUp(self):
@@ -188,6 +289,105 @@ class ModelTestCase(TestCase):
             )
         )
 
+    def test_flier_renditions_are_generated(self):
+        im_io = BytesIO()
+        Image.new(mode='RGB', size=(1000, 500)).save(im_io, 'PNG')
+        image = SimpleUploadedFile(
+            name='large_image.png',
+            content=im_io.getvalue(),
+            content_type='multipart/form-data'
+        )
+
+        # Overriding MEDIA_ROOT resets the storage's cached location.
+        with self.settings(
+            MEDIA_ROOT=self.temp_dir.name,
+            FLIER_RENDITION_WIDTHS=[320, 640, 1280],
+        ):
+            event = models.Event.objects.create(
+                creator=self.user,
+                hosting_sig=self.sig,
+                title='test',
+                date_hosted=timezone.now(),
+                date_expire=timezone.now(),
+                flier=image,
+                description='Here is a test description',
+                location='test location',
+            )
+
+            # The flier is processed by a background job.
+            self.assertFalse(event.flier_processed)
+            self.assertTrue(Job.objects.filter(
+                task='events.process_flier', payload__contains=str(event.pk)
+            ).exists())
+            self.assertEqual(run_pending_jobs(), 1)
+
+            event.refresh_from_db()
+            self.assertTrue(event.flier_processed)
+            self.assertEqual(event.flier_renditions, '320,640')
+            self.assertFalse(Job.objects.exists())
+
+            storage = event.flier.storage
+            for width in (320, 640):
+                for extension in ('webp', 'jpg'):
+                    name = get_rendition_name(
+                        event.flier.name, width, extension
+                    )
+                    self.assertTrue(storage.exists(name))
+                    with Image.open(storage.open(name)) as rendition:
+                        self.assertEqual(rendition.size, (width, width // 2))
+            self.assertFalse(storage.exists(
+                get_rendition_name(event.flier.name, 1280, 'jpg')
+            ))
+
+            self.assertIn('.w320.webp 320w', event.flier_webp_srcset)
+            self.assertIn('.w640.jpg 640w', event.flier_jpeg_srcset)
+            self.assertEqual(self.create_small_event().flier_webp_srcset, '')
+
+    def test_flier_metadata_is_stripped(self):
+        exif = Image.Exif()
+        # Sets the ImageDescription tag.
+        exif[0x010e] = 'secret'
+        im_io = BytesIO()
+        Image.new(mode='RGB', size=(50, 50)).save(im_io, 'JPEG', exif=exif)
+        image = SimpleUploadedFile(
+            name='exif_image.jpg',
+            content=im_io.getvalue(),
+            content_type='multipart/form-data'
+        )
+
+        with self.settings(MEDIA_ROOT=self.temp_dir.name):
+            event = models.Event.objects.create(
+                creator=self.user,
+                hosting_sig=self.sig,
+                title='test',
+                date_hosted=timezone.now(),
+                date_expire=timezone.now(),
+                flier=image,
+                description='Here is a test description',
+                location='test location',
+            )
+            with Image.open(event.flier.storage.open(event.flier.name)) as im:
+                self.assertEqual(im.getexif()[0x010e], 'secret')
+
+            run_pending_jobs()
+
+            event.refresh_from_db()
+            self.assertTrue(event.flier_processed)
+            with Image.open(event.flier.storage.open(event.flier.name)) as im:
+                self.assertEqual(len(im.getexif()), 0)
+
+    def create_small_event(self):
+        return models.Event.objects.create(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='test',
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+            flier=self.image,
+            description='Here is a test description',
+            location='test location',
+        )
+
 
 class ViewTestCase(TestCase):
     def setUp(self):
@@ -240,6 +440,63 @@ class ViewTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'events/listEvents.html')
 
+    def test_archive_view_integrity(self):
+        response = self.client.get(reverse('events:events-archive'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'events/listEvents.html')
+        self.assertTrue(response.context['archive'])
+
+    def test_list_view_only_lists_active_events(self):
+        self.client.login(email=self.email)
+        self.client.post(reverse('events:create-event'), self.data)
+        event = models.Event.objects.get()
+
+        response = self.client.get(reverse('events:events-list'))
+        self.assertEqual(list(response.context['eventsList']), [event])
+
+        response = self.client.get(reverse('events:events-archive'))
+        self.assertEqual(list(response.context['eventsList']), [])
+
+    def test_event_cards_are_cached(self):
+        """
+        Ensures an event's card is rendered once until the event is saved.
+        """
+        cache.clear()
+        self.client.login(email=self.email)
+        self.client.post(reverse('events:create-event'), self.data)
+        event = models.Event.objects.get()
+
+        response = self.client.get(reverse('events:events-list'))
+        self.assertContains(response, 'Test Title')
+
+        # Changes which bypass save() leave the card as it was cached.
+        models.Event.objects.update(title='Changed Title')
+        response = self.client.get(reverse('events:events-list'))
+        self.assertContains(response, 'Test Title')
+
+        event.refresh_from_db()
+        date_modified = event.date_modified
+        event.save()
+        self.assertGreater(event.date_modified, date_modified)
+        response = self.client.get(reverse('events:events-list'))
+        self.assertContains(response, 'Changed Title')
+
+    def test_event_cards_are_not_cached_while_debugging(self):
+        """
+        Ensures an event's card shows every change while DEBUG is on.
+        """
+        cache.clear()
+        self.client.login(email=self.email)
+        self.client.post(reverse('events:create-event'), self.data)
+
+        with self.settings(DEBUG=True):
+            response = self.client.get(reverse('events:events-list'))
+            self.assertContains(response, 'Test Title')
+
+            models.Event.objects.update(title='Changed Title')
+            response = self.client.get(reverse('events:events-list'))
+            self.assertContains(response, 'Changed Title')
+
     def test_access_create_event_page_with_non_superuser(self):
         response = self.client.get(reverse('events:create-event'))
         self.assertEqual(response.status_code, 200)
@@ -13,6 +13,9 @@ urlpatterns = [
     # acm.mst.edu/events/
     path('', views.list_events, name='events-list'),
 
+    # acm.mst.edu/events/past/
+    path('past/', views.past_events, name='events-archive'),
+
     # acm.mst.edu/events/create/
     path('create/', views.create_event, name='create-event'),
 ]
@@ -2,6 +2,8 @@
 Contains the views for the Events app.
 """
 # Django
+from django.conf import settings
+from django.core.paginator import Paginator
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
 
@@ -12,23 +14,73 @@ from .models import Event
 # from accounts.backends import UserBackend
 
 
+def paginate_events(request, events):
+    """
+    Splits the given events into pages of settings.EVENTS_PER_PAGE events and
+    returns the page requested through the ``page`` GET parameter.
+
+    :param request: Request object that contains information from the user's
+                    POST/GET request.
+    :type request: :class:`django.http.request.HttpRequest`
+    :param events: The ordered events to paginate.
+    :type events: :class:`~events.managers.EventQuerySet`
+
+    :returns: The requested page of events, or the last page if the page
+              requested is out of range.
+    :rtype: :class:`django.core.paginator.Page`
+    """
+    paginator = Paginator(
+        events, getattr(settings, 'EVENTS_PER_PAGE', 10)
+    )
+    return paginator.get_page(request.GET.get('page'))
+
+
 def list_events(request):
     """
     This function is used for creating a view that lists out all of the events
-    in an organized manner.
+    which have not yet expired in an organized manner.
+
+    :type request: :class:`django.http.request.HttpRequest`
+    :param request: Request object that contains information from the user's
+                    POST/GET request.
+
+    :returns: An HTML rendered page of 'listEvents.html' that has a page of
+              the active Event objects, soonest first, passed into it.
+    :rtype: `django.shortcuts.render`
+    """
+    return render(
+        request,
+        'events/listEvents.html',
+        {
+            'eventsList': paginate_events(
+                request, Event.objects.active().order_by('date_hosted')
+            ),
+        }
+    )
+
+
+def past_events(request):
+    """
+    This function is used for creating a view that lists out all of the events
+    which have already expired, most recent first.
 
     :type request: :class:`django.http.request.HttpRequest`
     :param request: Request object that contains information from the user's
                     POST/GET request.
 
-    :returns: An HTML rendered page of 'listEvents.html' that has all of the
-             Event objects passed into it.
+    :returns: An HTML rendered page of 'listEvents.html' that has a page of
+              the expired Event objects passed into it.
     :rtype: `django.shortcuts.render`
     """
     return render(
         request,
         'events/listEvents.html',
-        {'eventsList': Event.objects.all()}
+        {
+            'eventsList': paginate_events(
+                request, Event.objects.past().order_by('-date_hosted')
+            ),
+            'archive': True,
+        }
     )
 
 
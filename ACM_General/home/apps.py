@@ -10,3 +10,9 @@ class HomeConfig(AppConfig):
     Defines a global app name for the Home app.
     """
     name = 'home'
+
+    def ready(self):
+        """
+        Connects the Home app's signal receivers.
+        """
+        from . import signals  # noqa: F401
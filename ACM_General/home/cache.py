@@ -0,0 +1,212 @@
+"""
+Caches the whole responses of the Home app's public pages for anonymous
+visitors, so that a warm page is served without rendering its template.
+"""
+# standard library
+import functools
+import hashlib
+import os
+
+# Django
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.contrib.staticfiles.storage import (ManifestFilesMixin,
+                                                staticfiles_storage)
+from django.core.cache import caches
+from django.template import engines
+from django.template.utils import get_app_template_dirs
+from django.utils.cache import patch_vary_headers
+
+#: The cache key holding the generation of the cached pages, which is
+#: incremented to purge every page at once.
+GENERATION_CACHE_KEY = 'home:page-generation'
+
+#: The content codings which are part of the key of a cached page.
+KEYED_ENCODINGS = ('br', 'gzip')
+
+
+def get_page_cache():
+    """
+    :return: The cache named by ``HOME_PAGE_CACHE_ALIAS``.
+    :rtype: :class:`django.core.cache.backends.base.BaseCache`
+    """
+    return caches[getattr(settings, 'HOME_PAGE_CACHE_ALIAS', 'default')]
+
+
+def get_template_version():
+    """
+    Fingerprints the templates of every template engine, and the manifest
+    of hashed static files, by the name, size and modification time of each
+    file, so that pages cached by an older deploy are never served by a newer
+    one. The fingerprint is taken once per process, or on every call while
+    DEBUG is on, when templates may be edited at any time.
+
+    :return: A short hash of the files.
+    :rtype: str
+    """
+    if settings.DEBUG:
+        return _fingerprint_templates()
+    return _get_deployed_template_version()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_deployed_template_version():
+    """
+    Fingerprints the templates once per process.
+    """
+    return _fingerprint_templates()
+
+
+def _fingerprint_templates():
+    """
+    Hashes the name, size and modification time of every template and of
+    the static files manifest.
+    """
+    # The app directories are listed even when the cached loader is
+    # configured in place of APP_DIRS.
+    directories = {str(path) for path in get_app_template_dirs('templates')}
+    for engine in engines.all():
+        directories.update(str(path) for path in engine.dirs)
+
+    paths = []
+    for directory in sorted(directories):
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            paths.extend(os.path.join(root, name) for name in sorted(files))
+    if isinstance(staticfiles_storage, ManifestFilesMixin):
+        paths.append(
+            staticfiles_storage.path(staticfiles_storage.manifest_name)
+        )
+
+    digest = hashlib.sha1()
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update('{}:{}:{}\n'.format(
+                path, stat.st_size, stat.st_mtime_ns
+            ).encode())
+    return digest.hexdigest()[:12]
+
+
+def get_page_key(request, generation):
+    """
+    Used to obtain the key a page is cached under.
+
+    :param request: The request for the page.
+    :type request: :class:`~django.http.request.HttpRequest`
+    :param generation: The current generation of the cached pages.
+    :type generation: int
+
+    :return: A key made of the generation, the template version, the content
+             codings accepted by the client, and the URL of the page.
+    :rtype: str
+    """
+    accepted = {
+        coding.split(';')[0].strip().lower()
+        for coding in request.META.get('HTTP_ACCEPT_ENCODING', '').split(',')
+    }
+    return 'home:page:{}:{}:{}:{}'.format(
+        generation,
+        get_template_version(),
+        ','.join(coding for coding in KEYED_ENCODINGS if coding in accepted),
+        hashlib.md5(request.build_absolute_uri().encode()).hexdigest(),
+    )
+
+
+def is_cacheable_request(request):
+    """
+    Checks whether a request may be answered from the page cache. Requests
+    carrying a session or pending messages may be shown content meant for
+    one visitor only, so they always reach the view.
+
+    :param request: The request for a page.
+    :type request: :class:`~django.http.request.HttpRequest`
+
+    :rtype: bool
+    """
+    return (
+        request.method in ('GET', 'HEAD') and
+        settings.SESSION_COOKIE_NAME not in request.COOKIES and
+        CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def is_cacheable_response(response):
+    """
+    Checks whether a rendered page may be stored in the page cache.
+
+    :param response: The response of the view.
+    :type response: :class:`~django.http.HttpResponse`
+
+    :return: False if the response is not a complete ``200 OK``, sets a
+             cookie, or asks not to be cached.
+    :rtype: bool
+    """
+    cache_control = response.get('Cache-Control', '').lower()
+    return (
+        response.status_code == 200 and
+        not response.streaming and
+        not response.cookies and
+        'private' not in cache_control and
+        'no-store' not in cache_control and
+        'no-cache' not in cache_control
+    )
+
+
+def cache_anonymous_page(view):
+    """
+    Decorates a view so that its responses to anonymous ``GET`` and ``HEAD``
+    requests are cached whole in the ``HOME_PAGE_CACHE_ALIAS`` cache for up
+    to ``HOME_PAGE_CACHE_TIMEOUT`` seconds. A view may cache a response for
+    less time by setting its ``page_cache_timeout``.
+
+    Every cached page is purged by :func:`purge_pages`, which runs whenever an
+    Event, SIG or Product is saved or deleted; see :mod:`home.signals`. With a
+    cache shared by every process, such as a file-based cache, a purge is
+    seen by all of them; with a local-memory cache, other processes serve
+    their copy until it expires.
+
+    :param view: The view function to decorate.
+    :type view: function
+
+    :return: The decorated view.
+    :rtype: function
+    """
+    @functools.wraps(view)
+    def wrapped_view(request, *args, **kwargs):
+        if not is_cacheable_request(request):
+            return view(request, *args, **kwargs)
+
+        page_cache = get_page_cache()
+        key = get_page_key(request, page_cache.get(GENERATION_CACHE_KEY, 0))
+        response = page_cache.get(key)
+        if response is not None:
+            return response
+
+        response = view(request, *args, **kwargs)
+        if hasattr(response, 'render') and callable(response.render):
+            response.render()
+        # The page differs between visitors with and without a session.
+        patch_vary_headers(response, ('Cookie',))
+
+        if is_cacheable_response(response):
+            timeout = getattr(
+                response, 'page_cache_timeout',
+                getattr(settings, 'HOME_PAGE_CACHE_TIMEOUT', 300),
+            )
+            page_cache.set(key, response, timeout)
+        return response
+    return wrapped_view
+
+
+def purge_pages():
+    """
+    Drops every cached page by moving on to the next generation of keys.
+    """
+    page_cache = get_page_cache()
+    page_cache.add(GENERATION_CACHE_KEY, 0, None)
+    try:
+        page_cache.incr(GENERATION_CACHE_KEY)
+    except ValueError:
+        # The key was evicted between add() and incr().
+        page_cache.set(GENERATION_CACHE_KEY, 1, None)
@@ -0,0 +1,32 @@
+"""
+Contains the context processors of the Home app.
+"""
+# Django
+from django.conf import settings
+
+# local Django
+from .cache import get_template_version
+
+
+def fragment_cache(request):
+    """
+    Adds what the ``{% cache %}`` fragments of the site's templates are keyed
+    and timed on to the context of every template.
+
+    :param request: Request object that contains information from the user's
+                    POST/GET request.
+    :type request: :class:`~django.http.request.HttpRequest`
+
+    :return: The ``fragment_cache_timeout`` in seconds, which is 0 while
+             DEBUG is on so that template edits show up at once, and the
+             ``template_version`` which keeps fragments cached by an older
+             deploy from being served by a newer one.
+    :rtype: dict
+    """
+    timeout = 0
+    if not settings.DEBUG:
+        timeout = getattr(settings, 'TEMPLATE_FRAGMENT_CACHE_TIMEOUT', 3600)
+    return {
+        'fragment_cache_timeout': timeout,
+        'template_version': get_template_version(),
+    }
@@ -0,0 +1,37 @@
+"""
+Contains the ACM membership types sold on the membership page and the
+messages shown to users as their purchase is processed.
+"""
+# Django
+from django.utils import timezone
+
+#: The memberships which can be bought, keyed by the ``type`` posted by the
+#: membership page.
+MEMBERSHIP_TYPES = {
+    "semester": {
+        "tag": "membership-semester",
+        "delta": timezone.timedelta(weeks=24)
+    },
+    "year": {
+        "tag": "membership-year",
+        "delta": timezone.timedelta(weeks=52)
+    }
+}
+
+SUCCESS_MESSAGE = 'Successfully applied ACM Membership to account.'
+CARD_ERROR_MESSAGE = 'Received a card error from the Stripe payment server.'
+AUTHENTICATION_ERROR_MESSAGE = (
+    "Unexpected error occurred. Invalid Stripe API key specified "
+    "by the backend. Please contact the administrator."
+)
+PAYMENT_ERROR_MESSAGE = (
+    'The Stripe payment server could not process the payment. Please try '
+    'again later.'
+)
+
+#: The session key listing the purchases whose outcome has been added to the
+#: user's messages, so that later polls do not add it again.
+NOTIFIED_SESSION_KEY = 'home:membership-notified'
+
+#: The number of purchases remembered under ``NOTIFIED_SESSION_KEY``.
+NOTIFIED_SESSION_LIMIT = 20
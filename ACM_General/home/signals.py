@@ -0,0 +1,47 @@
+"""
+Signal receivers which keep the caches used by the Home app up to date.
+"""
+# Django
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# local Django
+from events.models import Event
+from products.models import Product
+from sigs.models import SIG
+from .cache import purge_pages
+
+#: The cache key under which the homepage's upcoming events are stored.
+UPCOMING_EVENTS_CACHE_KEY = 'home:upcoming-events'
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_upcoming_events(sender, **kwargs):
+    """
+    Drops the cached upcoming events whenever an
+    :class:`~events.models.Event` is saved or deleted.
+
+    :param sender: The model class which sent the signal.
+    :type sender: :class:`~events.models.Event`
+    """
+    cache.delete(UPCOMING_EVENTS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=SIG)
+@receiver(post_delete, sender=SIG)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def purge_cached_pages(sender, **kwargs):
+    """
+    Purges the pages cached for anonymous visitors whenever an
+    :class:`~events.models.Event`, :class:`~sigs.models.SIG` or
+    :class:`~products.models.Product` is saved or deleted.
+
+    :param sender: The model class which sent the signal.
+    :type sender: :class:`django.db.models.Model`
+    """
+    purge_pages()
@@ -0,0 +1,101 @@
+"""
+Contains the Home app's background tasks, which are run by the
+``run_workers`` management command.
+"""
+# third-party
+import stripe
+
+# Django
+from django.conf import settings
+from django.db import transaction
+
+# local Django
+from core.jobs import register
+from products.gateway import gateway
+from products.models import Transaction
+from .memberships import (AUTHENTICATION_ERROR_MESSAGE, CARD_ERROR_MESSAGE,
+                          MEMBERSHIP_TYPES, PAYMENT_ERROR_MESSAGE)
+
+
+def fail_membership(transaction_id, membership_type):
+    """
+    Marks a membership purchase as failed once the job charging it has used
+    up its attempts, so that the membership page stops polling its status.
+
+    :param transaction_id: The id of the pending Transaction.
+    :type transaction_id: str
+    :param membership_type: The key of the membership in
+                            :data:`~home.memberships.MEMBERSHIP_TYPES`.
+    :type membership_type: str
+    """
+    Transaction.objects.filter(
+        pk=transaction_id, status=Transaction.PENDING
+    ).update(status=Transaction.FAILED, failure_message=PAYMENT_ERROR_MESSAGE)
+
+
+@register('home.charge_membership', on_failure=fail_membership)
+def charge_membership(transaction_id, membership_type):
+    """
+    Charges a pending membership purchase through Stripe and, if the charge
+    succeeds, extends the buyer's membership.
+
+    The charge is made with the id of the Transaction as its idempotency key,
+    so a job which is retried after a connection error or a worker crash
+    never charges the card twice.
+
+    :param transaction_id: The id of the pending Transaction.
+    :type transaction_id: str
+    :param membership_type: The key of the membership in
+                            :data:`~home.memberships.MEMBERSHIP_TYPES`.
+    :type membership_type: str
+
+    :raises stripe.error.StripeError: if Stripe could not be reached or did
+                                      not process the charge, so that the job
+                                      is retried. Once the job has used up its
+                                      attempts, :func:`fail_membership` marks
+                                      the purchase as failed.
+    """
+    purchase = Transaction.objects.select_related('user').filter(
+        pk=transaction_id, status=Transaction.PENDING
+    ).first()
+    if purchase is None:
+        return
+
+    pending = Transaction.objects.filter(
+        pk=purchase.pk, status=Transaction.PENDING
+    )
+    try:
+        charge = gateway.create_charge(
+            currency="usd",
+            amount=int(purchase.cost * 100),
+            description=purchase.description,
+            receipt_email=purchase.user.email,
+            source=purchase.stripe_token,
+            api_key=getattr(settings, 'STRIPE_PRIV_KEY', None),
+            idempotency_key=str(purchase.pk),
+        )
+    except stripe.error.CardError:
+        pending.update(
+            status=Transaction.FAILED, failure_message=CARD_ERROR_MESSAGE
+        )
+        return
+    except stripe.error.AuthenticationError:
+        pending.update(
+            status=Transaction.FAILED,
+            failure_message=AUTHENTICATION_ERROR_MESSAGE,
+        )
+        return
+    except stripe.error.InvalidRequestError:
+        pending.update(
+            status=Transaction.FAILED, failure_message=PAYMENT_ERROR_MESSAGE
+        )
+        return
+
+    with transaction.atomic():
+        completed = pending.update(
+            status=Transaction.SUCCEEDED, charge_id=charge.id
+        )
+        if completed:
+            purchase.user.update_mem_expiration(
+                MEMBERSHIP_TYPES[membership_type]["delta"]
+            )
@@ -3,12 +3,13 @@ Contains all unit tests for the Home app.
 """
 # Standard Library
 from io import BytesIO
+import shutil
+import tempfile
 
-# Third-party
-import stripe
 # Django
 from django.conf import settings
 from django.contrib import messages
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase, override_settings
 from django.urls import reverse
@@ -17,9 +18,14 @@ from PIL import Image
 
 # local Django
 from accounts.models import User
+from core.jobs import run_pending_jobs
+from core.models import Job
 from events.forms import EventForm
 from events.models import Event
+from home.memberships import PAYMENT_ERROR_MESSAGE, SUCCESS_MESSAGE
+from products.gateway import gateway
 from products.models import Product, Transaction
+from products.testing import StripeStandIn
 from sigs.models import SIG
 
 
@@ -33,6 +39,13 @@ class HomeViewCase(TestCase):
         """
         Sets up an testing event with test data and a super user.
         """
+        # Uploaded fliers are written to a temporary media directory.
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
         self.user = User.objects.create_superuser('test@mst.edu')
         self.sig = SIG.objects.create_sig(
             founder=self.user,
@@ -67,8 +80,26 @@ class HomeViewCase(TestCase):
         }
 
         self.image_data = {'flier': self.image}
+        cache.clear()
         super().setUp()
 
+    def create_event(self, title, days):
+        """
+        Creates an event through the EventForm hosted a number of days from
+        now.
+        """
+        self.data['title'] = title
+        self.data['date_hosted'] = (
+            timezone.now() + timezone.timedelta(days=days)
+        )
+        form = EventForm(self.data, self.image_data)
+        self.assertTrue(form.is_valid())
+        event = form.save(commit=False)
+        event.creator = self.user
+        event.save()
+        self.image.seek(0)
+        return event
+
     def test_view_responses(self):
         """
         Makes requests to each page of the site and asserts a 200 response code
@@ -142,11 +173,109 @@ class HomeViewCase(TestCase):
 
         self.assertEqual(num_events, settings.MAX_HOME_FLIER_COUNT)
 
+    def test_upcoming_events_are_cached(self):
+        """
+        Ensures a warm homepage does not query the database for events and
+        that saving or deleting an event refreshes the upcoming events.
+        """
+        with self.settings(MAX_HOME_FLIER_COUNT=1):
+            self.create_event('Test Title 1', 1)
+
+            response = self.client.get(reverse('home:index'))
+            self.assertEqual(len(response.context['upcoming_events']), 1)
+            self.assertFalse(response.context['more_events'])
+
+            with self.assertNumQueries(0):
+                self.client.get(reverse('home:index'))
+
+            event = self.create_event('Test Title 2', 2)
+            response = self.client.get(reverse('home:index'))
+            self.assertEqual(len(response.context['upcoming_events']), 1)
+            self.assertTrue(response.context['more_events'])
+
+            event.delete()
+            response = self.client.get(reverse('home:index'))
+            self.assertFalse(response.context['more_events'])
+
+
+class PageCacheTestCase(TestCase):
+    """
+    Tests that the public pages are cached whole for anonymous visitors.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email="testuser@mst.edu")
+        cache.clear()
+
+    def assertCached(self, url, **headers):
+        """
+        Asserts that a page is served without rendering its template.
+        """
+        with self.assertNumQueries(0):
+            response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.templates, [])
+        return response
+
+    def test_anonymous_pages_are_cached(self):
+        for name in ('index', 'sponsors', 'media', 'officers', 'sigs'):
+            url = reverse('home:' + name)
+            response = self.client.get(url)
+            self.assertTemplateUsed(response, 'home/{}.html'.format(name))
+            self.assertIn('Cookie', response['Vary'])
+
+            cached = self.assertCached(url)
+            self.assertEqual(cached.content, response.content)
+            self.assertIn('Cookie', cached['Vary'])
+
+    def test_pages_are_keyed_on_accept_encoding(self):
+        url = reverse('home:media')
+        self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertCached(url, HTTP_ACCEPT_ENCODING='deflate, gzip;q=0.9')
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertTemplateUsed(response, 'home/media.html')
+
+    def test_sessions_bypass_the_cache(self):
+        url = reverse('home:media')
+        self.client.get(url)
+        self.client.force_login(self.user)
+
+        response = self.client.get(url)
+        self.assertTemplateUsed(response, 'home/media.html')
+        self.assertContains(response, 'Logout')
+
+    def test_pages_are_purged(self):
+        url = reverse('home:sigs')
+        self.client.get(url)
+        self.assertCached(url)
+
+        SIG.objects.create_sig(
+            founder=self.user, chair=self.user, description='test'
+        )
+        response = self.client.get(url)
+        self.assertTemplateUsed(response, 'home/sigs.html')
+        self.assertCached(url)
+
+        Product.objects.first().save()
+        response = self.client.get(url)
+        self.assertTemplateUsed(response, 'home/sigs.html')
+
 
 class MembershipViewTests(TestCase):
     def setUp(self):
         self.user = User.objects.create(email="testuser@mst.edu")
 
+        # Charges are made against a local stand-in for the Stripe API.
+        self.stripe = StripeStandIn().start()
+        self.addCleanup(self.stripe.stop)
+        stripe_settings = override_settings(
+            STRIPE_API_BASE=self.stripe.url,
+            STRIPE_PRIV_KEY="sk_test_standin",
+        )
+        stripe_settings.enable()
+        self.addCleanup(stripe_settings.disable)
+
     def post_data(self, user=None, stripeToken=None, mem_type=None, **kwargs):
         """
         Creates a POST request to the membership url with specified paramters.
@@ -202,6 +331,41 @@ class MembershipViewTests(TestCase):
         )
         self.assertTemplateUsed(response, 'home/membership.html')
 
+    def purchase(self, token, mem_type):
+        """
+        Buys a membership, runs the background job which charges it and polls
+        its status until it completes.
+
+        :param str token: The tokenized credit card information
+        :param str mem_type: The type of membership to buy
+
+        :return: The final status of the purchase and the response of the
+                 page it redirects to.
+        :rtype: tuple
+        """
+        response = self.post_data(
+            user=self.user, stripeToken=token, mem_type=mem_type
+        )
+        self.assertEqual(response.status_code, 302)
+
+        purchase = Transaction.objects.get(
+            pk=response.url.split("?transaction=")[1]
+        )
+        self.assertEqual(purchase.status, Transaction.PENDING)
+        status_url = reverse("home:membership-status", args=[purchase.pk])
+        self.assertEqual(
+            self.client.get(status_url).json(), {"status": "pending"}
+        )
+
+        # The redirect polls the status of the purchase.
+        response = self.client.get(response.url)
+        self.assertContains(response, status_url)
+
+        run_pending_jobs()
+
+        status = self.client.get(status_url).json()
+        return status, self.client.get(status["redirect"])
+
     def check_response_messages(self, message, response):
         user_messages = messages.get_messages(response.wsgi_request)
         message_list = list(user_messages)
@@ -270,77 +434,48 @@ class MembershipViewTests(TestCase):
         self.assertContains(response, error_response, status_code=400)
 
     @override_settings(STRIPE_PRIV_KEY="fake_key")
-    def test_500_error_on_invalid_api_key_with_proper_initials(self):
+    def test_failed_purchase_on_invalid_api_key(self):
         error_response = (
             "Unexpected error occurred. Invalid Stripe API key "
             "specified by the backend. Please contact the administrator."
         )
-        # Semester
-        response = self.post_data(
-            user=self.user, stripeToken="fake_token", mem_type="semester",
-            follow=True
-        )
-        self.assertEquals(response.status_code, 500)
-        self.assertContains(response, error_response, status_code=500)
+        for mem_type in ("semester", "year"):
+            status, response = self.purchase("tok_visa", mem_type)
+            self.assertEqual(status["status"], "failed")
+            self.check_response_messages(error_response, response)
+            self.assertTemplateUsed(response, 'home/membership.html')
 
-        # Year
-        response = self.post_data(
-            user=self.user, stripeToken="fake_token", mem_type="year",
-            follow=True
-        )
-        self.assertEquals(response.status_code, 500)
-        self.assertContains(response, error_response, status_code=500)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_member)
 
     def test_card_error_on_charge_declined(self):
         """
         See https://stripe.com/docs/testing for more information.
         """
-        stripe.api_key = settings.STRIPE_PRIV_KEY
         token = "tok_chargeDeclined"
         message_str = "Received a card error from the Stripe payment server."
 
-        # Semester
-        response = self.post_data(
-            user=self.user, stripeToken=token,
-            mem_type="semester", follow=True
-        )
-        self.check_response_messages(message_str, response)
-        self.assertTemplateUsed(response, 'home/membership.html')
-
-        # Year
-        response = self.post_data(
-            user=self.user, stripeToken=token,
-            mem_type="year", follow=True
-        )
+        for mem_type in ("semester", "year"):
+            status, response = self.purchase(token, mem_type)
+            self.assertEqual(status["status"], "failed")
+            self.check_response_messages(message_str, response)
+            self.assertTemplateUsed(response, 'home/membership.html')
 
-        self.check_response_messages(message_str, response)
-        self.assertTemplateUsed(response, 'home/membership.html')
+        self.assertFalse(self.stripe.charges)
 
     def test_card_error_on_failed_cvc_check(self):
-        stripe.api_key = settings.STRIPE_PRIV_KEY
         token = "tok_cvcCheckFail"
         message_str = "Received a card error from the Stripe payment server."
 
-        # Semester
-        response = self.post_data(
-            user=self.user, stripeToken=token,
-            mem_type="semester", follow=True
-        )
-
-        self.check_response_messages(message_str, response)
-        self.assertTemplateUsed(response, 'home/membership.html')
-
-        # Year
-        response = self.post_data(
-            user=self.user, stripeToken=token,
-            mem_type="year", follow=True
-        )
+        for mem_type in ("semester", "year"):
+            status, response = self.purchase(token, mem_type)
+            self.assertEqual(status["status"], "failed")
+            self.check_response_messages(message_str, response)
+            self.assertTemplateUsed(response, 'home/membership.html')
 
-        self.check_response_messages(message_str, response)
-        self.assertTemplateUsed(response, 'home/membership.html')
+        self.assertFalse(self.stripe.charges)
 
     def test_successful_charge_on_semester_type(self):
-        stripe.api_key = settings.STRIPE_PRIV_KEY
         tag = "membership-semester"
         delta_months = 6
         message_str = "Successfully applied ACM Membership to account."
@@ -350,11 +485,8 @@ class MembershipViewTests(TestCase):
         ]
 
         for index, token in enumerate(tokens):
-            # Post
-            response = self.post_data(
-                user=self.user, stripeToken=token,
-                mem_type="semester", follow=True
-            )
+            status, response = self.purchase(token, "semester")
+            self.assertEqual(status["status"], "succeeded")
             self.user.refresh_from_db()
 
             # Backend Check
@@ -379,7 +511,6 @@ class MembershipViewTests(TestCase):
             self.assertTemplateUsed(response, 'home/index.html')
 
     def test_successful_charge_on_year_type(self):
-        stripe.api_key = settings.STRIPE_PRIV_KEY
         tag = "membership-year"
         delta_months = 12
         message_str = "Successfully applied ACM Membership to account."
@@ -389,11 +520,8 @@ class MembershipViewTests(TestCase):
         ]
 
         for index, token in enumerate(tokens):
-            # Post
-            response = self.post_data(
-                user=self.user, stripeToken=token,
-                mem_type="year", follow=True
-            )
+            status, response = self.purchase(token, "year")
+            self.assertEqual(status["status"], "succeeded")
             self.user.refresh_from_db()
 
             # Backend Check
@@ -415,10 +543,91 @@ class MembershipViewTests(TestCase):
             self.assertIsNotNone(transaction.charge_id)
 
             # Ensure the charge has the same values
-            ch = stripe.Charge.retrieve(transaction.charge_id)
+            ch = gateway.retrieve_charge(transaction.charge_id)
             self.assertEqual(ch.amount / 100, transaction.cost)
             self.assertEqual(ch.description, transaction.description)
 
             # Template + Messages
             self.check_response_messages(message_str, response)
             self.assertTemplateUsed(response, 'home/index.html')
+
+    def test_purchase_fails_once_retries_run_out(self):
+        """
+        Ensures a purchase whose charge keeps failing is marked as failed
+        once its job has used up its attempts, so polling ends.
+        """
+        self.stripe.failures = 100
+        with self.settings(JOB_MAX_ATTEMPTS=2, STRIPE_MAX_RETRIES=0):
+            self.post_data(
+                user=self.user, stripeToken="tok_visa", mem_type="year"
+            )
+            purchase = Transaction.objects.get(stripe_token="tok_visa")
+
+            run_pending_jobs()
+            purchase.refresh_from_db()
+            self.assertEqual(purchase.status, Transaction.PENDING)
+
+            Job.objects.update(run_after=timezone.now())
+            run_pending_jobs()
+
+        purchase.refresh_from_db()
+        self.assertEqual(purchase.status, Transaction.FAILED)
+        self.assertEqual(purchase.failure_message, PAYMENT_ERROR_MESSAGE)
+        self.assertEqual(Job.objects.get().status, Job.FAILED)
+        self.assertFalse(self.stripe.charges)
+
+        response = self.client.get(
+            reverse("home:membership-status", args=[purchase.pk])
+        )
+        self.assertEqual(response.json()["status"], Transaction.FAILED)
+
+    def test_retried_charge_is_not_duplicated(self):
+        self.post_data(
+            user=self.user, stripeToken="tok_visa", mem_type="year"
+        )
+        purchase = Transaction.objects.get(stripe_token="tok_visa")
+
+        # A worker charged the card but died before recording the charge.
+        charge = gateway.create_charge(
+            currency="usd",
+            amount=int(purchase.cost * 100),
+            source="tok_visa",
+            idempotency_key=str(purchase.pk),
+        )
+        run_pending_jobs()
+
+        purchase.refresh_from_db()
+        self.assertEqual(purchase.status, Transaction.SUCCEEDED)
+        self.assertEqual(purchase.charge_id, charge.id)
+        self.assertEqual(len(self.stripe.charges), 1)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_member)
+
+    def test_outcome_message_is_added_once(self):
+        """
+        Ensures polling a completed purchase again does not add its outcome
+        to the user's messages a second time.
+        """
+        status, response = self.purchase("tok_visa", "year")
+        self.check_response_messages(SUCCESS_MESSAGE, response)
+
+        purchase = Transaction.objects.get(stripe_token="tok_visa")
+        status_url = reverse("home:membership-status", args=[purchase.pk])
+        self.assertEqual(self.client.get(status_url).json(), status)
+        self.assertEqual(self.client.get(status_url).json(), status)
+
+        response = self.client.get(status["redirect"])
+        self.assertEqual(
+            list(messages.get_messages(response.wsgi_request)), []
+        )
+
+    def test_membership_status_is_private(self):
+        self.post_data(user=self.user, stripeToken="tok_visa", mem_type="year")
+        purchase = Transaction.objects.get(stripe_token="tok_visa")
+        status_url = reverse("home:membership-status", args=[purchase.pk])
+
+        self.client.force_login(User.objects.create(email="other@mst.edu"))
+        self.assertEqual(self.client.get(status_url).status_code, 404)
+
+        self.client.logout()
+        self.assertEqual(self.client.get(status_url).status_code, 404)
@@ -23,6 +23,12 @@ urlpatterns = [
     path('media/', views.media, name="media"),
     # https://acm.mst.edu/membership/
     path('membership/', views.Membership.as_view(), name="membership"),
+    # https://acm.mst.edu/membership/<transaction_id>/
+    path(
+        'membership/<uuid:transaction_id>/',
+        views.membership_status,
+        name="membership-status",
+    ),
     # https://acm.mst.edu/officers/
     path('officers/', views.officers, name="officers"),
     # https://acm.mst.edu/sigs/
@@ -1,23 +1,72 @@
 """
 Contains all of the view for the Home app.
 """
-# Third-party
-import stripe
+# standard library
+import uuid
+
 # Django
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import (HttpResponse, HttpResponseBadRequest,
-                         HttpResponseNotFound, HttpResponseRedirect)
+from django.core.cache import cache
+from django.db import transaction
+from django.http import (Http404, HttpResponse, HttpResponseBadRequest,
+                         HttpResponseNotFound, HttpResponseRedirect,
+                         JsonResponse)
 from django.shortcuts import redirect, render, reverse
 from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.views import View
 
 # local Django
 import products.models
+from core.models import Job
 from events.models import Event
+from .cache import cache_anonymous_page
+from .memberships import (MEMBERSHIP_TYPES, NOTIFIED_SESSION_KEY,
+                          NOTIFIED_SESSION_LIMIT, SUCCESS_MESSAGE)
+from .signals import UPCOMING_EVENTS_CACHE_KEY
+
+
+def get_upcoming_events():
+    """
+    Fetches the next events, the number of which depends on
+    settings.MAX_HOME_FLIER_COUNT, that aren't past expiry.
 
+    The events are read with a single ``LIMIT MAX_HOME_FLIER_COUNT + 1`` query
+    and cached until the first of them expires (or at most
+    settings.HOME_EVENTS_CACHE_TIMEOUT seconds). The cache is dropped whenever
+    an Event is saved or deleted; see :mod:`home.signals`.
+
+    :return: A dictionary holding the ``upcoming_events`` to display and
+             whether or not there are ``more_events`` after them.
+    :rtype: dict
+    """
+    upcoming = cache.get(UPCOMING_EVENTS_CACHE_KEY)
+    if upcoming is not None:
+        return upcoming
+
+    now = timezone.now()
+    max_count = settings.MAX_HOME_FLIER_COUNT
+    events = list(
+        Event.objects.active().order_by('date_hosted')[:max_count + 1]
+    )
 
+    upcoming = {
+        "upcoming_events": events[:max_count],
+        "more_events": len(events) > max_count,
+    }
+
+    timeout = getattr(settings, 'HOME_EVENTS_CACHE_TIMEOUT', 300)
+    if events:
+        first_expiry = min(event.date_expire for event in events) - now
+        timeout = max(1, min(timeout, int(first_expiry.total_seconds())))
+
+    cache.set(UPCOMING_EVENTS_CACHE_KEY, upcoming, timeout)
+    return upcoming
+
+
+@cache_anonymous_page
 def index(request):
     """
     Renders the template for the index page. With that is also grabs next
@@ -28,29 +77,31 @@ def index(request):
                     POST/GET request.
     :type request: :class:`~django.http.request.HttpRequest`
 
+    The page is cached until the first of the upcoming events expires, at
+    most.
+
     :return: The render template of the index page.
     :rtype: `django.shortcut.render`
     """
-    events = Event.objects.filter(
-        date_expire__gte=timezone.now()
-    ).order_by('date_hosted')
-
-    num_events = len(events)
-    if len(events) >= settings.MAX_HOME_FLIER_COUNT:
-        events = events[:settings.MAX_HOME_FLIER_COUNT]
-
-    return (
-        render(
-            request,
-            'home/index.html',
-            {
-                "upcoming_events": events,
-                "num_events": num_events
-            }
-        )
+    upcoming = get_upcoming_events()
+    response = render(
+        request,
+        'home/index.html',
+        upcoming,
     )
 
+    if upcoming['upcoming_events']:
+        first_expiry = min(
+            event.date_expire for event in upcoming['upcoming_events']
+        ) - timezone.now()
+        response.page_cache_timeout = max(1, min(
+            getattr(settings, 'HOME_PAGE_CACHE_TIMEOUT', 300),
+            int(first_expiry.total_seconds()),
+        ))
+    return response
+
 
+@method_decorator(cache_anonymous_page, name='dispatch')
 class Sponsors(View):
     def get(self, request):
         """
@@ -92,6 +143,7 @@ def calendar(request):
     )
 
 
+@cache_anonymous_page
 def media(request):
     """
     Handles a request to see the media page.
@@ -111,6 +163,7 @@ def media(request):
     )
 
 
+@cache_anonymous_page
 def officers(request):
     """
     Handles a request to see the officers page.
@@ -133,20 +186,14 @@ def officers(request):
 class Membership(LoginRequiredMixin, View):
     def __init__(self):
         self.login_url = reverse("thirdparty_auth:google")
-        self.membership_types = {
-            "semester": {
-                "tag": "membership-semester",
-                "delta": timezone.timedelta(weeks=24)
-            },
-            "year": {
-                "tag": "membership-year",
-                "delta": timezone.timedelta(weeks=52)
-            }
-        }
+        self.membership_types = MEMBERSHIP_TYPES
 
     def get(self, request):
         """
-        Handles a request to see the membership page.
+        Handles a request to see the membership page. If the page is
+        displayed after a purchase, the ``transaction`` whose status should be
+        polled is passed to the template.
+
         :param request: Request object that contains information from the
                         user's POST/GET request.
         :type request: django.http.request.HttpRequest
@@ -154,6 +201,11 @@ class Membership(LoginRequiredMixin, View):
         :return: The render template of the officers page.
         :rtype: django.shortcut.render
         """
+        try:
+            pending_transaction = uuid.UUID(request.GET.get("transaction"))
+        except (TypeError, ValueError):
+            pending_transaction = None
+
         return (
             render(
                 request,
@@ -162,11 +214,25 @@ class Membership(LoginRequiredMixin, View):
                     "stripe_public_key": getattr(
                         settings, "STRIPE_PUB_KEY", ""
                     ),
+                    "pending_transaction": pending_transaction,
                 },
             )
         )
 
     def post(self, request):
+        """
+        Records a pending membership purchase and hands its charge to the
+        background job queue, so that the worker is not held for the Stripe
+        round-trip. The user is redirected back to the membership page, which
+        polls :func:`membership_status` until the charge completes.
+
+        :param request: Request object that contains information from the
+                        user's POST/GET request.
+        :type request: django.http.request.HttpRequest
+
+        :return: A redirect to the membership page.
+        :rtype: django.http.HttpResponseRedirect
+        """
         if not request.user.is_authenticated: # pragma: no cover
             return HttpResponseNotFound("Invalid User")
 
@@ -178,8 +244,8 @@ class Membership(LoginRequiredMixin, View):
                 " token in the POST request."
             )
 
-        stripe.api_key = getattr(settings, 'STRIPE_PRIV_KEY', None)
-        if stripe.api_key == "" or not stripe.api_key:
+        api_key = getattr(settings, 'STRIPE_PRIV_KEY', None)
+        if api_key == "" or not api_key:
             raise ValueError(
                 "Invalid stripe.api_key specified."
             )
@@ -190,8 +256,8 @@ class Membership(LoginRequiredMixin, View):
         if mem_attributes is None:
             return HttpResponseBadRequest("Invalid membership type specified.")
 
-        product = products.models.Product.objects.get(
-            tag=mem_attributes["tag"]
+        product = products.models.Product.objects.get_cached(
+            mem_attributes["tag"]
         )
 
         # This case will only occur if self.membership_types is improperly set
@@ -202,52 +268,72 @@ class Membership(LoginRequiredMixin, View):
                 status=500
             )
 
-        try:
-            charge = stripe.Charge.create(
-                currency="usd",
-                amount=int(product.cost * 100),
+        with transaction.atomic():
+            purchase = products.models.Transaction.objects.create_transaction(
+                token, user=request.user,
+                cost=product.cost,
+                sig=product.sig,
+                category=product.category,
                 description=product.description,
-                receipt_email=request.user.email,
-                source=token,
+                status=products.models.Transaction.PENDING,
             )
-        except stripe.error.APIConnectionError as con_err:  # pragma: no cover
-            messages.error(
-                request,
-                'Could not connect to Stripe payment server. Please try again'
-                ' later.'
+            Job.objects.enqueue(
+                'home.charge_membership',
+                transaction_id=str(purchase.pk),
+                membership_type=mem_requested,
             )
-            return HttpResponseRedirect(reverse("home:membership"))
-        except stripe.error.CardError as card_err:
-            messages.error(
-                request,
-                'Received a card error from the Stripe payment server.'
-            )
-            return HttpResponseRedirect(reverse("home:membership"))
-        except stripe.error.AuthenticationError as auth_err:
-            return HttpResponse(
-                "Unexpected error occurred. Invalid Stripe API key specified "
-                "by the backend. Please contact the administrator.",
-                status=500
-            )
-        else:
-            request.user.update_mem_expiration(mem_attributes["delta"])
-
-        products.models.Transaction.objects.create_transaction(
-            token, user=request.user,
-            charge_id=charge.id,
-            cost=product.cost,
-            sig=product.sig,
-            category=product.category,
-            description=product.description
-        )
 
-        messages.success(
-            request,
-            'Successfully applied ACM Membership to account.'
+        return HttpResponseRedirect(
+            '{}?transaction={}'.format(reverse("home:membership"), purchase.pk)
         )
-        return HttpResponseRedirect(reverse("home:index"))
 
 
+def membership_status(request, transaction_id):
+    """
+    Reports the status of one of the user's membership purchases, to be polled
+    by the membership page while the charge is processed. Once the charge has
+    completed, the outcome is added to the user's messages, once per
+    purchase, and the page to show them on is returned as ``redirect``.
+
+    :param request: Request object that contains information from the user's
+                    POST/GET request.
+    :type request: :class:`~django.http.request.HttpRequest`
+    :param transaction_id: The id of the Transaction recording the purchase.
+    :type transaction_id: uuid.UUID
+
+    :return: The ``status`` of the purchase as JSON.
+    :rtype: :class:`django.http.JsonResponse`
+    """
+    if not request.user.is_authenticated:
+        raise Http404
+
+    purchase = products.models.Transaction.objects.filter(
+        pk=transaction_id, user=request.user
+    ).values('status', 'failure_message').first()
+    if purchase is None:
+        raise Http404
+
+    data = {"status": purchase['status']}
+    if purchase['status'] == products.models.Transaction.SUCCEEDED:
+        data["redirect"] = reverse("home:index")
+    elif purchase['status'] == products.models.Transaction.FAILED:
+        data["redirect"] = reverse("home:membership")
+
+    # The outcome is only added to the messages by the first poll to see it.
+    notified = request.session.get(NOTIFIED_SESSION_KEY, [])
+    if "redirect" in data and str(transaction_id) not in notified:
+        if purchase['status'] == products.models.Transaction.SUCCEEDED:
+            messages.success(request, SUCCESS_MESSAGE)
+        else:
+            messages.error(request, purchase['failure_message'])
+        request.session[NOTIFIED_SESSION_KEY] = (
+            notified + [str(transaction_id)]
+        )[-NOTIFIED_SESSION_LIMIT:]
+
+    return JsonResponse(data)
+
+
+@cache_anonymous_page
 def sigs(request):
     """
     Handles a request to see the sigs page.
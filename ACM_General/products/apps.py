@@ -1,6 +1,41 @@
+"""
+Defines the app name for the Products app.
+"""
+# third-party
+import stripe
+
 # Django
 from django.apps import AppConfig
+from django.conf import settings
+from django.test.signals import setting_changed
+
+
+def configure_stripe(setting=None, **kwargs):
+    """
+    Points the ``stripe`` module at ``STRIPE_API_BASE``, once on start up and
+    again whenever the setting is changed.
+
+    :param setting: The name of the setting which changed.
+    :type setting: str
+    """
+    if setting in (None, 'STRIPE_API_BASE'):
+        stripe.api_base = getattr(
+            settings, 'STRIPE_API_BASE', 'https://api.stripe.com'
+        )
 
 
 class ProductsConfig(AppConfig):
+    """
+    Defines a global app name for the Products app.
+    """
     name = 'products'
+
+    def ready(self):
+        """
+        Configures the ``stripe`` module and connects the Products app's
+        signal receivers.
+        """
+        from . import signals  # noqa: F401
+
+        configure_stripe()
+        setting_changed.connect(configure_stripe)
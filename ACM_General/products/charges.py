@@ -0,0 +1,132 @@
+"""
+Caches the Stripe charges behind ``Transaction.stripe_data`` so that listing
+transactions does not make a Stripe call per row.
+"""
+# standard library
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+# third-party
+import stripe
+
+# Django
+from django.conf import settings
+from django.core.cache import cache
+
+# local Django
+from .gateway import gateway
+
+logger = logging.getLogger(__name__)
+
+
+def get_charge_cache_key(charge_id):
+    """
+    :return: The cache key under which a charge is stored.
+    :rtype: str
+    """
+    return 'products:charge:{}'.format(charge_id)
+
+
+def is_terminal(charge):
+    """
+    Checks whether a charge can no longer change. Charges which succeeded can
+    still be refunded or disputed, so only failed and fully refunded charges
+    are terminal.
+
+    :param charge: The charge data returned by Stripe.
+    :type charge: dict
+
+    :rtype: bool
+    """
+    return charge.get('status') == 'failed' or bool(charge.get('refunded'))
+
+
+def cache_charge(charge):
+    """
+    Caches a charge forever if it is terminal, and otherwise for
+    ``STRIPE_CHARGE_CACHE_TIMEOUT`` seconds.
+
+    :param charge: The charge data returned by Stripe.
+    :type charge: dict
+    """
+    timeout = None if is_terminal(charge) else getattr(
+        settings, 'STRIPE_CHARGE_CACHE_TIMEOUT', 300
+    )
+    cache.set(get_charge_cache_key(charge['id']), charge, timeout)
+
+
+def fetch_charge(charge_id):
+    """
+    Retrieves a charge from Stripe and caches it.
+
+    :param charge_id: The identifier of the charge.
+    :type charge_id: str
+
+    :return: The charge data returned by Stripe.
+    :rtype: dict
+    """
+    charge = gateway.request('GET', '/v1/charges/{}'.format(charge_id))
+    cache_charge(charge)
+    return charge
+
+
+def get_charge(charge_id):
+    """
+    Returns a charge from the cache, retrieving it from Stripe if it is not
+    cached.
+
+    :param charge_id: The identifier of the charge.
+    :type charge_id: str
+
+    :return: The charge.
+    :rtype: :class:`stripe.Charge`
+
+    :raises stripe.error.StripeError: if the charge could not be retrieved.
+    """
+    charge = cache.get(get_charge_cache_key(charge_id))
+    if charge is None:
+        charge = fetch_charge(charge_id)
+    return stripe.Charge.construct_from(charge, None)
+
+
+def get_charges(charge_ids):
+    """
+    Returns many charges, retrieving the ones which are not cached from
+    Stripe concurrently on at most ``STRIPE_PREFETCH_WORKERS`` threads.
+
+    Charges which could not be retrieved are logged and left out.
+
+    :param charge_ids: The identifiers of the charges.
+    :type charge_ids: iterable
+
+    :return: The charges, keyed by their identifier.
+    :rtype: dict
+    """
+    charge_ids = set(charge_ids)
+    cached = cache.get_many(
+        [get_charge_cache_key(charge_id) for charge_id in charge_ids]
+    )
+    charges = {charge['id']: charge for charge in cached.values()}
+    missing = [
+        charge_id for charge_id in charge_ids if charge_id not in charges
+    ]
+
+    if missing:
+        workers = min(
+            len(missing), getattr(settings, 'STRIPE_PREFETCH_WORKERS', 8)
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                charge_id: executor.submit(fetch_charge, charge_id)
+                for charge_id in missing
+            }
+        for charge_id, future in futures.items():
+            try:
+                charges[charge_id] = future.result()
+            except stripe.error.StripeError as err:
+                logger.warning('Could not retrieve %s: %s', charge_id, err)
+
+    return {
+        charge_id: stripe.Charge.construct_from(charge, None)
+        for charge_id, charge in charges.items()
+    }
@@ -0,0 +1,294 @@
+"""
+Contains the gateway through which every call to the Stripe API is made.
+"""
+# standard library
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+
+# third-party
+import requests
+import stripe
+
+# Django
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+#: The status codes of responses which are retried, as Stripe did not
+#: process the request.
+RETRIED_STATUS_CODES = (409, 429, 500, 502, 503, 504)
+
+
+class StripeGateway(object):
+    """
+    Makes calls to the Stripe API over a ``requests.Session`` which is shared
+    by every thread of the process, so connections are pooled and kept alive
+    rather than paying for a TLS handshake on every charge.
+
+    The API key is passed on each call instead of being set on the global
+    ``stripe.api_key``, which is not thread-safe. Requests which fail to
+    connect or are answered with a :data:`RETRIED_STATUS_CODES` are retried
+    up to ``STRIPE_MAX_RETRIES`` times with exponential backoff; every
+    ``POST`` is sent with an idempotency key so that retrying it is safe.
+
+    Errors are raised as the matching ``stripe.error`` exception, and charges
+    are returned as :class:`stripe.Charge` objects.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session = None
+        self._pid = None
+        self._metrics = {}
+
+    @property
+    def session(self):
+        """
+        The session of the current process. A new session is created after a
+        fork, so that processes never share connections.
+
+        :rtype: :class:`requests.Session`
+        """
+        with self._lock:
+            if self._session is None or self._pid != os.getpid():
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_maxsize=getattr(settings, 'STRIPE_POOL_SIZE', 10)
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+                self._session = session
+                self._pid = os.getpid()
+            return self._session
+
+    def request(self, method, path, params=None, api_key=None,
+                idempotency_key=None):
+        """
+        Calls the Stripe API, retrying the call if it could not be processed.
+
+        :param method: The HTTP method of the call.
+        :type method: str
+        :param path: The path of the API resource, such as ``/v1/charges``.
+        :type path: str
+        :param params: The parameters of the call.
+        :type params: dict
+        :param api_key: The secret key to authenticate with. Defaults to
+                        ``STRIPE_PRIV_KEY``.
+        :type api_key: str
+        :param idempotency_key: The idempotency key of a ``POST``. A random
+                                key is used if none is given.
+        :type idempotency_key: str
+
+        :return: The decoded JSON body of the response.
+        :rtype: dict
+
+        :raises stripe.error.StripeError: if the call failed.
+        """
+        if api_key is None:
+            api_key = getattr(settings, 'STRIPE_PRIV_KEY', None)
+        if not api_key:
+            raise stripe.error.AuthenticationError(
+                'No API key provided. Set STRIPE_PRIV_KEY in the Django '
+                'configuration.'
+            )
+
+        headers = {'Authorization': 'Bearer {}'.format(api_key)}
+        if method == 'POST':
+            headers['Idempotency-Key'] = idempotency_key or str(uuid.uuid4())
+
+        url = getattr(
+            settings, 'STRIPE_API_BASE', 'https://api.stripe.com'
+        ) + path
+        timeout = (
+            getattr(settings, 'STRIPE_CONNECT_TIMEOUT', 5),
+            getattr(settings, 'STRIPE_READ_TIMEOUT', 30),
+        )
+        max_retries = getattr(settings, 'STRIPE_MAX_RETRIES', 2)
+        # Calls to the same kind of resource share their metrics.
+        parts = path.split('/')
+        if len(parts) > 3:
+            parts[3:] = [':id']
+        name = '{} {}'.format(method, '/'.join(parts))
+
+        for attempt in range(max_retries + 1):
+            start = time.monotonic()
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params if method == 'GET' else None,
+                    data=params if method != 'GET' else None,
+                    timeout=timeout,
+                )
+            except requests.RequestException as err:
+                self.record(name, time.monotonic() - start, failed=True)
+                if attempt == max_retries:
+                    raise stripe.error.APIConnectionError(
+                        'Could not connect to Stripe: {}'.format(err)
+                    )
+            else:
+                self.record(
+                    name, time.monotonic() - start,
+                    failed=response.status_code >= 400,
+                )
+                if (response.status_code not in RETRIED_STATUS_CODES or
+                        attempt == max_retries):
+                    return self.handle_response(response)
+
+            self.backoff(attempt)
+
+    @staticmethod
+    def backoff(attempt):
+        """
+        Sleeps before a retry, for ``STRIPE_RETRY_BACKOFF`` seconds doubled
+        with each attempt and with jitter.
+
+        :param attempt: The number of the attempt which failed, from 0.
+        :type attempt: int
+        """
+        delay = getattr(settings, 'STRIPE_RETRY_BACKOFF', 0.5) * 2 ** attempt
+        time.sleep(delay * random.uniform(0.5, 1.0))
+
+    @staticmethod
+    def handle_response(response):
+        """
+        Decodes a response from Stripe, raising the ``stripe.error``
+        exception which matches an error response.
+
+        :param response: The response to a call.
+        :type response: :class:`requests.Response`
+
+        :return: The decoded JSON body of the response.
+        :rtype: dict
+
+        :raises stripe.error.StripeError: if the response is an error.
+        """
+        try:
+            body = response.json()
+        except ValueError:
+            raise stripe.error.APIError(
+                'Invalid response from Stripe.',
+                http_body=response.text,
+                http_status=response.status_code,
+            )
+
+        if response.status_code < 400:
+            return body
+
+        error = body.get('error', {})
+        message = error.get('message', 'Unknown Stripe error.')
+        options = {
+            'http_body': response.text,
+            'http_status': response.status_code,
+            'json_body': body,
+            'headers': dict(response.headers),
+        }
+
+        if response.status_code == 401:
+            raise stripe.error.AuthenticationError(message, **options)
+        if response.status_code == 402:
+            raise stripe.error.CardError(
+                message, error.get('param'), error.get('code'), **options
+            )
+        if response.status_code == 403:
+            raise stripe.error.PermissionError(message, **options)
+        if response.status_code in (400, 404):
+            raise stripe.error.InvalidRequestError(
+                message, error.get('param'), error.get('code'), **options
+            )
+        if response.status_code == 429:
+            raise stripe.error.RateLimitError(message, **options)
+        raise stripe.error.APIError(message, **options)
+
+    def record(self, name, seconds, failed=False):
+        """
+        Records the latency of a call to the Stripe API.
+
+        :param name: The method and resource of the call.
+        :type name: str
+        :param seconds: How long the call took.
+        :type seconds: float
+        :param failed: Whether the call failed.
+        :type failed: bool
+        """
+        logger.info('Stripe %s took %.3fs', name, seconds)
+        with self._lock:
+            metric = self._metrics.setdefault(name, {
+                'count': 0, 'errors': 0, 'total_seconds': 0.0,
+                'max_seconds': 0.0,
+            })
+            metric['count'] += 1
+            metric['errors'] += int(failed)
+            metric['total_seconds'] += seconds
+            metric['max_seconds'] = max(metric['max_seconds'], seconds)
+
+    def get_metrics(self):
+        """
+        Returns the latency of the calls made by this process, such as for an
+        officer to check how long charges take.
+
+        :return: The ``count``, ``errors``, ``total_seconds`` and
+                 ``max_seconds`` of each kind of call.
+        :rtype: dict
+        """
+        with self._lock:
+            return {name: dict(metric)
+                    for name, metric in self._metrics.items()}
+
+    def reset_metrics(self):
+        """
+        Clears the recorded latency of every call.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def create_charge(self, api_key=None, idempotency_key=None, **params):
+        """
+        Creates a charge.
+
+        :param api_key: The secret key to authenticate with.
+        :type api_key: str
+        :param idempotency_key: The key which makes retrying the charge safe.
+        :type idempotency_key: str
+        :param params: The parameters of the charge, such as ``amount``,
+                       ``currency`` and ``source``.
+
+        :return: The created charge.
+        :rtype: :class:`stripe.Charge`
+        """
+        return stripe.Charge.construct_from(
+            self.request(
+                'POST', '/v1/charges', params, api_key=api_key,
+                idempotency_key=idempotency_key,
+            ),
+            api_key,
+        )
+
+    def retrieve_charge(self, charge_id, api_key=None):
+        """
+        Retrieves a charge.
+
+        :param charge_id: The identifier of the charge.
+        :type charge_id: str
+        :param api_key: The secret key to authenticate with.
+        :type api_key: str
+
+        :return: The charge.
+        :rtype: :class:`stripe.Charge`
+        """
+        return stripe.Charge.construct_from(
+            self.request(
+                'GET', '/v1/charges/{}'.format(charge_id), api_key=api_key
+            ),
+            api_key,
+        )
+
+
+#: The gateway shared by every thread of the process.
+gateway = StripeGateway()
@@ -1,10 +1,18 @@
 """
 Custom managers for handling different Payments models.
 """
+# standard library
+import copy
+import threading
+import time
 
 # Django
+from django.conf import settings
 from django.db import models
 
+# local Django
+from .charges import get_charges
+
 
 class TransactionCategoryManager(models.Manager):
     """
@@ -68,6 +76,65 @@ class ProductManager(models.Manager):
         """
         return self.get(name=name)
 
+    #: The catalogue of products cached by this process, keyed by tag, and
+    #: when it expires.
+    _catalogue = None
+    _catalogue_expires = 0
+    _catalogue_lock = threading.Lock()
+
+    def get_catalogue(self):
+        """
+        Returns every product, with its category and SIG, from a catalogue
+        kept in the memory of the process. The catalogue is loaded with a
+        single query, dropped whenever a product, category or SIG is saved or
+        deleted (see :mod:`products.signals`), and reloaded at least every
+        ``PRODUCT_CACHE_TIMEOUT`` seconds so that changes made by other
+        processes are picked up.
+
+        :returns: The cached products, keyed by tag.
+        :rtype: dict
+        """
+        manager = ProductManager
+        with manager._catalogue_lock:
+            if (manager._catalogue is None or
+                    manager._catalogue_expires <= time.monotonic()):
+                manager._catalogue = {
+                    product.tag: product for product in
+                    self.select_related('category', 'sig')
+                }
+                manager._catalogue_expires = time.monotonic() + getattr(
+                    settings, 'PRODUCT_CACHE_TIMEOUT', 300
+                )
+            return manager._catalogue
+
+    def get_cached(self, tag):
+        """
+        Returns a copy of a product from the cached catalogue, so that looking
+        up a product does not query the database.
+
+        :param tag: The tag of the Product.
+        :type tag: str
+
+        :returns: The Product with its category and SIG loaded.
+        :rtype: :class:`~products.models.Product`
+
+        :raises Product.DoesNotExist: if no Product has the given tag.
+        """
+        try:
+            return copy.deepcopy(self.get_catalogue()[tag])
+        except KeyError:
+            raise self.model.DoesNotExist(
+                'No Product has the tag {}.'.format(tag)
+            )
+
+    @staticmethod
+    def clear_cache():
+        """
+        Drops the catalogue cached by this process.
+        """
+        with ProductManager._catalogue_lock:
+            ProductManager._catalogue = None
+
     def _create_product(self, tag, name, **kwargs):
         """
         Used to create a Product and save it to the database.
@@ -96,7 +163,37 @@ class ProductManager(models.Manager):
         return self._create_product(tag, name, **kwargs)
 
 
-class TransactionManager(models.Manager):
+class TransactionQuerySet(models.QuerySet):
+    """
+    Bulk operations on :class:`~products.models.Transaction` objects.
+    """
+
+    def prefetch_stripe_data(self):
+        """
+        Evaluates the queryset and retrieves the Stripe charge of every
+        transaction at once, so that reading ``stripe_data`` in a loop does
+        not make a Stripe call per transaction. Charges which are not cached
+        are retrieved concurrently; see :func:`products.charges.get_charges`.
+
+        :returns: The transactions, with their ``stripe_data`` loaded.
+        :rtype: list
+        """
+        transactions = list(self)
+        charges = get_charges(
+            transaction.charge_id for transaction in transactions
+            if transaction.charge_id
+        )
+
+        for transaction in transactions:
+            if not transaction.charge_id:
+                transaction._stripe_data = None
+            elif transaction.charge_id in charges:
+                transaction._stripe_data = charges[transaction.charge_id]
+
+        return transactions
+
+
+class TransactionManager(models.Manager.from_queryset(TransactionQuerySet)):
     """
     Used to automate the creation of Transactions.
     """
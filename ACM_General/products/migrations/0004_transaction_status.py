@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 14:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0003_transaction_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='failure_message',
+            field=models.CharField(blank=True, help_text='Why the charge of the transaction failed.', max_length=255, verbose_name='Transaction Failure Message'),
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='succeeded', help_text='Whether the charge succeeded, failed or is pending.', max_length=10, verbose_name='Transaction Status'),
+        ),
+    ]
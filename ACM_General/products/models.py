@@ -4,17 +4,14 @@ Contains all of the models for the Payments app.
 # standard library
 import uuid as uuid
 
-# third-party
-import stripe
-
 # Django
-from django.conf import settings
 from django.db import models
 # from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 # local Django
 from . import managers
+from .charges import get_charge
 from accounts.models import User
 from sigs.models import SIG
 
@@ -123,6 +120,35 @@ class Transaction(models.Model):
     transaction including but not limited to ACM Memberships, Sponsorships,
     etc.
     """
+    PENDING = 'pending'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, _('Pending')),
+        (SUCCEEDED, _('Succeeded')),
+        (FAILED, _('Failed')),
+    )
+
+    class Meta:
+        indexes = [
+            # Keys the cursor pagination of the transactions rest_api list.
+            models.Index(
+                fields=['-date_created', 'id'],
+                name='transaction_created_id_idx',
+            ),
+            # Finds a user's transactions in the order they were made.
+            models.Index(
+                fields=['user', 'date_created'],
+                name='transaction_user_created_idx',
+            ),
+            # Finds a SIG's transactions over a range of time, as used by
+            # per-SIG finance reports.
+            models.Index(
+                fields=['sig', 'date_created'],
+                name='transaction_sig_created_idx',
+            ),
+        ]
+
     objects = managers.TransactionManager()
 
     #: The id of the Transaction; represented as a UUIDField.
@@ -218,6 +244,25 @@ class Transaction(models.Model):
         blank=True,
     )
 
+    #: Whether the charge of the transaction is still being processed, or
+    #: whether it succeeded or failed; represented as a CharField.
+    status = models.CharField(
+        verbose_name=_('Transaction Status'),
+        help_text=_('Whether the charge succeeded, failed or is pending.'),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=SUCCEEDED,
+    )
+
+    #: Why the charge of the transaction failed, as shown to the user;
+    #: represented as a CharField.
+    failure_message = models.CharField(
+        verbose_name=_('Transaction Failure Message'),
+        help_text=_('Why the charge of the transaction failed.'),
+        max_length=255,
+        blank=True,
+    )
+
     @property
     def stripe_data(self):
         """
@@ -228,14 +273,19 @@ class Transaction(models.Model):
         Retrieves data related to the stripe charge made.
         More info `here <stripe-charge-link_>`_.
 
+        The charge is cached; see :mod:`products.charges`. Use
+        :meth:`~products.managers.TransactionQuerySet.prefetch_stripe_data`
+        to retrieve the charges of many transactions at once.
+
         :rtype: stripe.Charge
-        :returns: A charge if a valid identifier was provided, and raises an
-                  error otherwise.
+        :returns: A charge if a valid identifier was provided, None if the
+                  transaction has no charge, and raises an error otherwise.
         """
-        return stripe.Charge.retrieve(
-            self.stripe_token,
-            api_key=getattr(settings, 'STRIPE_PRIV_KEY', None)
-        )
+        if not hasattr(self, '_stripe_data'):
+            self._stripe_data = (
+                get_charge(self.charge_id) if self.charge_id else None
+            )
+        return self._stripe_data
 
     def __str__(self):
         return self.stripe_token
@@ -0,0 +1,29 @@
+"""
+Signal receivers which keep the product catalogue cached by the Products app
+up to date.
+"""
+# Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# local Django
+from .models import Product, TransactionCategory
+from sigs.models import SIG
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=TransactionCategory)
+@receiver(post_delete, sender=TransactionCategory)
+@receiver(post_save, sender=SIG)
+@receiver(post_delete, sender=SIG)
+def invalidate_catalogue(sender, **kwargs):
+    """
+    Drops the cached product catalogue whenever a
+    :class:`~products.models.Product`, or a category or SIG which products
+    are cached with, is saved or deleted.
+
+    :param sender: The model class which sent the signal.
+    :type sender: :class:`~products.models.Product`
+    """
+    Product.objects.clear_cache()
@@ -0,0 +1,185 @@
+"""
+A local stand-in for the parts of the Stripe API used by the site, so that
+payments can be tested without network access or real Stripe keys.
+"""
+# standard library
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+import json
+import threading
+import time
+import uuid
+
+#: The test tokens which are declined, and the error code each is declined
+#: with. See https://stripe.com/docs/testing for the tokens Stripe accepts.
+DECLINED_TOKENS = {
+    'tok_chargeDeclined': 'card_declined',
+    'tok_cvcCheckFail': 'incorrect_cvc',
+}
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StripeStandIn(object):
+    """
+    Serves ``POST /v1/charges`` and ``GET /v1/charges/<id>`` from memory on a
+    local port, following Stripe's behaviour for the test tokens:
+
+    * Keys which do not start with ``sk_test_`` are rejected with a 401.
+    * The tokens in :data:`DECLINED_TOKENS` are declined with a 402.
+    * Other tokens which do not start with ``tok_`` are rejected with a 400.
+    * Requests sent with an ``Idempotency-Key`` which has been seen before
+      are answered with the original response.
+    * While ``failures`` is above zero, each request is answered with a 500
+      and decrements it, to test retries.
+
+    Used as a context manager::
+
+        with StripeStandIn() as stand_in:
+            with self.settings(STRIPE_API_BASE=stand_in.url):
+                ...
+    """
+
+    def __init__(self):
+        self.charges = {}
+        self.requests = []
+        self.failures = 0
+        self._responses = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def url(self):
+        """
+        The base url of the stand-in, to be used in place of
+        ``https://api.stripe.com``.
+
+        :rtype: str
+        """
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.handle(self, 'GET')
+
+            def do_POST(self):
+                stand_in.handle(self, 'POST')
+
+            def log_message(self, *args):
+                pass
+
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, request, method):
+        """
+        Answers a single request made to the stand-in.
+        """
+        length = int(request.headers.get('Content-Length') or 0)
+        params = {
+            key: values[0] for key, values in
+            parse_qs(request.rfile.read(length).decode()).items()
+        }
+        key = request.headers.get('Idempotency-Key')
+
+        with self._lock:
+            self.requests.append((method, request.path, params))
+            if self.failures > 0:
+                self.failures -= 1
+                status, body = 500, self.error('api_error', 'Try again.')
+            elif key and (method, key) in self._responses:
+                status, body = self._responses[(method, key)]
+            else:
+                status, body = self.respond(
+                    method, request.path, request.headers, params
+                )
+                if key:
+                    self._responses[(method, key)] = (status, body)
+
+        payload = json.dumps(body).encode()
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(payload)))
+        request.send_header('Request-Id', 'req_' + uuid.uuid4().hex)
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def respond(self, method, path, headers, params):
+        """
+        Builds the status code and body of Stripe's response to a request.
+        """
+        api_key = headers.get('Authorization', '')[len('Bearer '):]
+        if not api_key.startswith('sk_test_'):
+            return 401, self.error(
+                'invalid_request_error', 'Invalid API Key provided.'
+            )
+
+        if method == 'POST' and path == '/v1/charges':
+            return self.create_charge(params)
+        if method == 'GET' and path.startswith('/v1/charges/'):
+            charge = self.charges.get(path[len('/v1/charges/'):])
+            if charge is not None:
+                return 200, charge
+            return 404, self.error(
+                'invalid_request_error', 'No such charge.', 'resource_missing'
+            )
+
+        return 404, self.error(
+            'invalid_request_error', 'Unrecognized request URL.'
+        )
+
+    def create_charge(self, params):
+        source = params.get('source', '')
+        if source in DECLINED_TOKENS:
+            return 402, self.error(
+                'card_error', 'Your card was declined.',
+                DECLINED_TOKENS[source],
+            )
+        if not source.startswith('tok_'):
+            return 400, self.error(
+                'invalid_request_error', 'No such token.', 'resource_missing'
+            )
+
+        charge = {
+            'id': 'ch_' + uuid.uuid4().hex[:24],
+            'object': 'charge',
+            'amount': int(params.get('amount', 0)),
+            'currency': params.get('currency', 'usd'),
+            'description': params.get('description'),
+            'receipt_email': params.get('receipt_email'),
+            'created': int(time.time()),
+            'captured': True,
+            'paid': True,
+            'refunded': False,
+            'status': 'succeeded',
+            'livemode': False,
+        }
+        self.charges[charge['id']] = charge
+        return 200, charge
+
+    @staticmethod
+    def error(error_type, message, code=None):
+        error = {'type': error_type, 'message': message}
+        if code:
+            error['code'] = code
+        return {'error': error}
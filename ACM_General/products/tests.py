@@ -13,13 +13,17 @@ import stripe
 
 # Django
 from django.conf import settings
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 # from django.test import LiveServerTestCase
 
 # from django.urls import reverse
 
 # local Django
 from . import models
+from .charges import is_terminal
+from .gateway import StripeGateway, gateway
+from .testing import StripeStandIn
 from accounts.models import User
 from sigs.models import SIG
 
@@ -104,6 +108,50 @@ class PaymentsManagerCase(TestCase):
         with self.assertRaises(models.Product.DoesNotExist):
             models.Product.objects.get_by_natural_key('thisdoesntexist')
 
+    def test_get_cached(self):
+        category = models.TransactionCategory.objects.create_category('test')
+        models.Product.objects.create_product(
+            'test',
+            'test',
+            cost=3.00,
+            category=category,
+            sig=self.sig,
+        )
+
+        models.Product.objects.get_cached('test')
+        with self.assertNumQueries(0):
+            product = models.Product.objects.get_cached('test')
+            self.assertEqual(product.category, category)
+            self.assertEqual(product.sig, self.sig)
+
+            with self.assertRaises(models.Product.DoesNotExist):
+                models.Product.objects.get_cached('thisdoesntexist')
+
+        # Changes to a cached product must not leak into the catalogue.
+        product.name = 'changed'
+        self.assertEqual(
+            models.Product.objects.get_cached('test').name, 'test'
+        )
+
+        # Saving a product drops the catalogue.
+        saved = models.Product.objects.get(tag='test')
+        saved.cost = 5
+        saved.save()
+        with self.assertNumQueries(1):
+            product = models.Product.objects.get_cached('test')
+        self.assertEqual(product.cost, 5)
+
+        # As does deleting one.
+        models.Product.objects.get(tag='test').delete()
+        with self.assertRaises(models.Product.DoesNotExist):
+            models.Product.objects.get_cached('test')
+
+    @override_settings(PRODUCT_CACHE_TIMEOUT=0)
+    def test_get_cached_expires(self):
+        models.Product.objects.get_cached('membership-semester')
+        with self.assertNumQueries(1):
+            models.Product.objects.get_cached('membership-semester')
+
 
 class PaymentsModelCase(TestCase):
     def setUp(self):
@@ -127,6 +175,7 @@ class PaymentsModelCase(TestCase):
         )
         transaction = models.Transaction.objects.create_transaction(
             '3232',
+            charge_id='ch_3232',
             cost=3.00,
             category=category,
             sig=self.sig,
@@ -174,6 +223,188 @@ class PaymentsViewCase(TestCase):
         self.assertIsNotNone(getattr(settings, 'STRIPE_PRIV_KEY', None))
 
 
+class StripeGatewayCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.stripe = StripeStandIn().start()
+        self.addCleanup(self.stripe.stop)
+        stripe_settings = override_settings(
+            STRIPE_API_BASE=self.stripe.url,
+            STRIPE_PRIV_KEY='sk_test_standin',
+            STRIPE_RETRY_BACKOFF=0,
+        )
+        stripe_settings.enable()
+        self.addCleanup(stripe_settings.disable)
+        self.gateway = StripeGateway()
+
+    def test_create_and_retrieve_charge(self):
+        charge = self.gateway.create_charge(
+            amount=500, currency='usd', source='tok_visa'
+        )
+        self.assertIsInstance(charge, stripe.Charge)
+        self.assertEqual(charge.amount, 500)
+
+        session = self.gateway.session
+        self.assertEqual(
+            self.gateway.retrieve_charge(charge.id).id, charge.id
+        )
+        # Connections are pooled by one session per process.
+        self.assertIs(self.gateway.session, session)
+
+        metrics = self.gateway.get_metrics()
+        self.assertEqual(metrics['POST /v1/charges']['count'], 1)
+        self.assertEqual(metrics['GET /v1/charges/:id']['count'], 1)
+        self.assertEqual(metrics['GET /v1/charges/:id']['errors'], 0)
+
+    def test_api_key_is_passed_per_call(self):
+        with self.assertRaises(stripe.error.AuthenticationError):
+            self.gateway.create_charge(
+                api_key='fake_key', amount=500, currency='usd',
+                source='tok_visa',
+            )
+        with self.settings(STRIPE_PRIV_KEY=''):
+            with self.assertRaises(stripe.error.AuthenticationError):
+                self.gateway.retrieve_charge('ch_test')
+        self.assertIsNone(stripe.api_key)
+
+    def test_errors_are_raised(self):
+        with self.assertRaises(stripe.error.CardError) as context:
+            self.gateway.create_charge(
+                amount=500, currency='usd', source='tok_chargeDeclined'
+            )
+        self.assertEqual(context.exception.code, 'card_declined')
+
+        with self.assertRaises(stripe.error.InvalidRequestError):
+            self.gateway.retrieve_charge('ch_missing')
+
+    def test_failed_calls_are_retried(self):
+        self.stripe.failures = 2
+        charge = self.gateway.create_charge(
+            amount=500, currency='usd', source='tok_visa'
+        )
+        self.assertEqual(len(self.stripe.requests), 3)
+        # Every attempt is sent with the same idempotency key.
+        self.assertEqual(list(self.stripe.charges), [charge.id])
+        self.assertEqual(
+            self.gateway.get_metrics()['POST /v1/charges']['errors'], 2
+        )
+
+        self.stripe.failures = 3
+        with self.assertRaises(stripe.error.APIError):
+            self.gateway.retrieve_charge(charge.id)
+
+        with self.settings(STRIPE_API_BASE='http://127.0.0.1:1'):
+            with self.assertRaises(stripe.error.APIConnectionError):
+                self.gateway.retrieve_charge(charge.id)
+
+
+class ChargeCacheCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.stripe = StripeStandIn().start()
+        self.addCleanup(self.stripe.stop)
+        stripe_settings = override_settings(
+            STRIPE_API_BASE=self.stripe.url,
+            STRIPE_PRIV_KEY='sk_test_standin',
+        )
+        stripe_settings.enable()
+        self.addCleanup(stripe_settings.disable)
+
+        user = User.objects.create_user('ksyh3@mst.edu')
+        self.sig = SIG.objects.create_sig(
+            id='test', chair=user, founder=user, description='test',
+        )
+        self.category = models.TransactionCategory.objects.create_category(
+            'test'
+        )
+
+    def create_transaction(self, charge_id=''):
+        return models.Transaction.objects.create_transaction(
+            'tok_visa',
+            charge_id=charge_id,
+            cost=3.00,
+            category=self.category,
+            sig=self.sig,
+        )
+
+    def create_charged_transaction(self):
+        charge = gateway.create_charge(
+            amount=300, currency='usd', source='tok_visa'
+        )
+        return self.create_transaction(charge.id)
+
+    def count_retrievals(self):
+        return sum(method == 'GET' for method, _, _ in self.stripe.requests)
+
+    def test_stripe_data_is_cached(self):
+        transaction = self.create_charged_transaction()
+
+        self.assertEqual(transaction.stripe_data.id, transaction.charge_id)
+        self.assertEqual(transaction.stripe_data.amount, 300)
+        fresh = models.Transaction.objects.get(pk=transaction.pk)
+        self.assertEqual(fresh.stripe_data.id, transaction.charge_id)
+        self.assertEqual(self.count_retrievals(), 1)
+
+        self.assertIsNone(self.create_transaction().stripe_data)
+
+    def test_terminal_charges_are_cached_forever(self):
+        self.assertFalse(is_terminal({'status': 'succeeded'}))
+        self.assertTrue(is_terminal({'status': 'failed'}))
+        self.assertTrue(
+            is_terminal({'status': 'succeeded', 'refunded': True})
+        )
+
+        succeeded = self.create_charged_transaction()
+        refunded = self.create_charged_transaction()
+        self.stripe.charges[refunded.charge_id]['refunded'] = True
+
+        with self.settings(STRIPE_CHARGE_CACHE_TIMEOUT=0):
+            for _ in range(2):
+                for transaction in models.Transaction.objects.all():
+                    transaction.stripe_data
+
+        # Only the charge which can still change was retrieved again.
+        retrieved = [
+            path for method, path, _ in self.stripe.requests
+            if method == 'GET'
+        ]
+        self.assertEqual(
+            retrieved.count('/v1/charges/' + succeeded.charge_id), 2
+        )
+        self.assertEqual(
+            retrieved.count('/v1/charges/' + refunded.charge_id), 1
+        )
+
+    def test_prefetch_stripe_data(self):
+        transactions = [self.create_charged_transaction() for _ in range(5)]
+        self.create_transaction()
+        missing = self.create_transaction('ch_missing')
+        # One of the charges is already cached.
+        transactions[0].stripe_data
+        self.stripe.requests.clear()
+
+        with self.assertNumQueries(1):
+            prefetched = models.Transaction.objects.order_by(
+                'date_created'
+            ).prefetch_stripe_data()
+        # Each uncached charge was retrieved once.
+        self.assertEqual(self.count_retrievals(), 5)
+
+        for transaction in prefetched[:5]:
+            self.assertEqual(
+                transaction.stripe_data.id, transaction.charge_id
+            )
+        self.assertIsNone(prefetched[5].stripe_data)
+        self.assertEqual(self.count_retrievals(), 5)
+
+        # The cached charges are not retrieved again.
+        models.Transaction.objects.exclude(
+            pk=missing.pk
+        ).prefetch_stripe_data()
+        self.assertEqual(self.count_retrievals(), 5)
+
+
 # Dropping selenium for now, will revisit
 '''
 class PaymentsIntegrationTestCase(LiveServerTestCase):
@@ -0,0 +1,199 @@
+"""
+Contains the encoders which turn the columns returned by ``.values()`` into
+the same primitives a serializer would return for them, so that list views
+can skip building a model instance and running every serializer field per
+row.
+"""
+# standard library
+import decimal
+import functools
+
+# third-party
+from rest_framework import fields, relations
+from rest_framework.settings import api_settings
+
+# Django
+from django.conf import settings
+from django.utils import timezone
+
+
+def get_uuid_encoder():
+    """
+    Returns an encoder for UUIDs which matches
+    :class:`rest_framework.fields.UUIDField`.
+
+    :return: A function which encodes a UUID in its hyphenated form.
+    :rtype: function
+    """
+    return str
+
+
+def get_datetime_encoder():
+    """
+    Returns an encoder for datetimes which matches
+    :class:`rest_framework.fields.DateTimeField` with the ISO 8601 format.
+    The current time zone is looked up once, rather than once per value.
+
+    :return: A function which encodes a datetime in ISO 8601 form in the
+             current time zone, ending in ``Z`` if it is in UTC.
+    :rtype: function
+    """
+    use_tz = settings.USE_TZ
+    current_timezone = timezone.get_current_timezone() if use_tz else None
+
+    def encode_datetime(value):
+        if use_tz:
+            if timezone.is_aware(value):
+                value = value.astimezone(current_timezone)
+            else:
+                value = timezone.make_aware(value, current_timezone)
+        elif timezone.is_aware(value):
+            value = timezone.make_naive(value, timezone.utc)
+
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return encode_datetime
+
+
+def get_decimal_encoder(field):
+    """
+    Returns an encoder for the decimals of a
+    :class:`rest_framework.fields.DecimalField` which matches the field.
+
+    :param field: The serializer field of the decimal column.
+    :type field: :class:`rest_framework.fields.DecimalField`
+
+    :return: A function which encodes a decimal the way the field does.
+    :rtype: function
+    """
+    if field.decimal_places is None:
+        return '{:f}'.format
+
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    rounding = field.rounding
+    max_digits = field.max_digits
+
+    def encode_decimal(value):
+        context = decimal.getcontext().copy()
+        if max_digits is not None:
+            context.prec = max_digits
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return '{:f}'.format(
+            value.quantize(exponent, rounding=rounding, context=context)
+        )
+    return encode_decimal
+
+
+#: The serializer fields whose representation of a column is the column
+#: itself.
+IDENTITY_FIELDS = (
+    fields.BooleanField,
+    fields.CharField,
+    fields.EmailField,
+    fields.IntegerField,
+    fields.SlugField,
+    fields.URLField,
+)
+
+
+def get_field_encoder(field):
+    """
+    Compiles the encoder of the column of a serializer field.
+
+    :param field: The serializer field of the column.
+    :type field: :class:`rest_framework.fields.Field`
+
+    :return: ``(True, factory)`` if the field is supported, where
+             ``factory`` returns the encoder of the column when called, or is
+             None if columns are returned as they are read. Otherwise
+             ``(False, None)``.
+    :rtype: tuple
+    """
+    field_class = type(field)
+
+    if field_class is fields.UUIDField:
+        return field.uuid_format == 'hex_verbose', get_uuid_encoder
+    if field_class is fields.DateTimeField:
+        output_format = getattr(
+            field, 'format', api_settings.DATETIME_FORMAT
+        )
+        supported = (
+            output_format is not None and
+            output_format.lower() == fields.ISO_8601 and
+            not hasattr(field, 'timezone')
+        )
+        return supported, get_datetime_encoder
+    if field_class is fields.DecimalField:
+        coerce_to_string = getattr(
+            field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING
+        )
+        supported = coerce_to_string and not field.localize
+        return supported, functools.partial(get_decimal_encoder, field)
+    if field_class is fields.ChoiceField:
+        # Choices which are strings are represented as they are stored.
+        return all(
+            isinstance(choice, str) for choice in field.choices
+        ), None
+    if field_class is relations.PrimaryKeyRelatedField:
+        return field.pk_field is None, None
+    if field_class in IDENTITY_FIELDS:
+        return True, None
+    return False, None
+
+
+@functools.lru_cache(maxsize=None)
+def get_row_encoders(serializer_class):
+    """
+    Compiles the encoders of every field of a serializer, once per serializer
+    class.
+
+    :param serializer_class: The class of a model serializer.
+    :type serializer_class: :class:`rest_framework.serializers.Serializer`
+
+    :return: The name, model column and encoder factory of each readable
+             field, or None if any field can not be read from ``.values()``.
+    :rtype: tuple
+    """
+    encoders = []
+    for name, field in serializer_class().fields.items():
+        if field.write_only:
+            continue
+        supported, factory = get_field_encoder(field)
+        if not supported or '.' in field.source or field.source == '*':
+            return None
+        encoders.append((name, field.source, factory))
+    return tuple(encoders)
+
+
+def encode_rows(rows, encoders):
+    """
+    Encodes rows read with ``.values()`` into the dictionaries the serializer
+    would have returned for them.
+
+    :param rows: The rows to encode.
+    :type rows: list
+    :param encoders: The name, model column and encoder factory of each
+                     field to return, as compiled by
+                     :func:`get_row_encoders`.
+    :type encoders: tuple
+
+    :return: The representation of each row.
+    :rtype: list
+    """
+    encoders = [
+        (name, column, factory and factory())
+        for name, column, factory in encoders
+    ]
+    return [
+        {
+            name: (
+                row[column] if encoder is None or row[column] is None
+                else encoder(row[column])
+            )
+            for name, column, encoder in encoders
+        }
+        for row in rows
+    ]
@@ -7,7 +7,7 @@ import django_filters
 
 # local Django
 from accounts.models import User
-# from events.models import Event
+from events.models import Event
 from sigs.models import SIG
 
 
@@ -15,6 +15,9 @@ class UserFilter(django_filters.FilterSet):
     """
     Allows for Users to be filtered based on specified filtering options.
     """
+    #: Filters the users whose ACM membership is or is not current.
+    is_member = django_filters.BooleanFilter(method='filter_is_member')
+
     class Meta:
         """
         Defines for which model and fields the filter set applies to. Generates
@@ -31,21 +34,95 @@ class UserFilter(django_filters.FilterSet):
             'last_login'
         ]
 
+    @staticmethod
+    def filter_is_member(queryset, name, value):
+        """
+        Filters the current members, or everyone else, in SQL.
+
+        :param queryset: The users being filtered.
+        :type queryset: :class:`~accounts.managers.UserQuerySet`
+        :param name: The name of the filter.
+        :type name: str
+        :param value: Whether to keep the members or the non-members.
+        :type value: bool
+
+        :return: The filtered users.
+        :rtype: :class:`~accounts.managers.UserQuerySet`
+        """
+        return queryset.members() if value else queryset.non_members()
+
 
-# TODO: Implement Filter for Events that allows ImageField
-'''
 class EventFilter(django_filters.FilterSet):
     """
-    Allows for Events to be filtered based on specified
-    filtering options.
+    Allows for Events to be filtered by when they are hosted, who hosts and
+    created them, and the words they contain.
     """
+    #: Filters the Events hosted at or after a date and time.
+    hosted_after = django_filters.IsoDateTimeFilter(
+        field_name='date_hosted', lookup_expr='gte'
+    )
+
+    #: Filters the Events hosted at or before a date and time.
+    hosted_before = django_filters.IsoDateTimeFilter(
+        field_name='date_hosted', lookup_expr='lte'
+    )
+
+    #: Filters the Events which have or have not yet expired.
+    active = django_filters.BooleanFilter(method='filter_active')
+
+    #: Filters the Events hosted by a SIG. Filtering on the id alone, rather
+    #: than a choice of SIGs, saves looking the SIG up.
+    hosting_sig = django_filters.CharFilter(field_name='hosting_sig')
+
+    #: Filters the Events created by a user.
+    creator = django_filters.UUIDFilter(field_name='creator')
+
+    #: Filters the Events whose title, description, location or presenter
+    #: contain every one of the given words.
+    search = django_filters.CharFilter(method='filter_search')
+
     class Meta:
         """
-        Defines for which model and fields the filter set
-        applies to. Generates filters for all Event fields.
+        Defines for which model the filter set applies to. No filters are
+        generated from the Event fields, as the flier can not be filtered.
         """
         model = Event
-'''
+        fields = []
+
+    @staticmethod
+    def filter_active(queryset, name, value):
+        """
+        Filters the Events which have not yet expired, or the ones which
+        have.
+
+        :param queryset: The Events being filtered.
+        :type queryset: :class:`~events.managers.EventQuerySet`
+        :param name: The name of the filter.
+        :type name: str
+        :param value: Whether to keep the active or the expired Events.
+        :type value: bool
+
+        :return: The filtered Events.
+        :rtype: :class:`~events.managers.EventQuerySet`
+        """
+        return queryset.active() if value else queryset.past()
+
+    @staticmethod
+    def filter_search(queryset, name, value):
+        """
+        Filters the Events through the full-text search index.
+
+        :param queryset: The Events being filtered.
+        :type queryset: :class:`~events.managers.EventQuerySet`
+        :param name: The name of the filter.
+        :type name: str
+        :param value: The search terms.
+        :type value: str
+
+        :return: The Events matching the terms.
+        :rtype: :class:`~events.managers.EventQuerySet`
+        """
+        return queryset.search(value)
 
 
 class SIGFilter(django_filters.FilterSet):
@@ -0,0 +1,127 @@
+"""
+Management command which measures the speedup of reading list views with
+``.values()`` over running their serializers.
+"""
+# standard library
+import time
+
+# third-party
+from rest_framework.test import APIRequestFactory
+
+# Django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+# local Django
+from core.benchmarking import seed
+from rest_api import views
+
+
+class Command(BaseCommand):
+    """
+    Seeds the database, then times the largest page of each list view which
+    reads rows with ``.values()`` against the same page rendered by the
+    view's serializer, and fails if the two responses differ by a byte.
+
+    Everything seeded by the command is rolled back before it exits.
+    """
+    help = (
+        'Seeds a dataset inside a transaction which is rolled back and '
+        'compares the time taken to list it with .values() and with the '
+        'serializers.'
+    )
+
+    #: The list views which read rows with ``.values()``.
+    list_views = (views.UserList, views.TransactionList)
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=10000,
+            help='The number of users and transactions to seed.',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=10,
+            help='The number of times each page is requested.',
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=1000,
+            help='The number of rows on each page.',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            seed(options['rows'])
+
+            mismatches = []
+            for view in self.list_views:
+                name = view.__name__
+                path = '/?page_size={}'.format(options['page_size'])
+                serialized, serialized_seconds = self.time_view(
+                    view.as_view(values_serialization=False),
+                    path, options['repeat'],
+                )
+                values, values_seconds = self.time_view(
+                    view.as_view(values_serialization=True),
+                    path, options['repeat'],
+                )
+
+                if serialized != values:
+                    mismatches.append(name)
+                self.stdout.write(
+                    '{}: serializer {:.1f}ms, values {:.1f}ms, {:.1f}x '
+                    'faster{}'.format(
+                        name,
+                        serialized_seconds * 1000,
+                        values_seconds * 1000,
+                        serialized_seconds / values_seconds,
+                        '' if serialized == values else ' (OUTPUT DIFFERS)',
+                    )
+                )
+
+            transaction.set_rollback(True)
+
+        if mismatches:
+            raise CommandError(
+                'The output of the following views differs: {}'.format(
+                    ', '.join(mismatches)
+                )
+            )
+
+    @staticmethod
+    def time_view(view, path, repeat):
+        """
+        Renders a page of a view a number of times.
+
+        :param view: The view function to request.
+        :type view: function
+        :param path: The path and query string of the request.
+        :type path: str
+        :param repeat: The number of times to request the page.
+        :type repeat: int
+
+        :return: The content of the response and the median number of
+                 seconds taken to render it.
+        :rtype: tuple
+        """
+        # The cursors of the neighbouring pages are absolute URLs, so the
+        # request must be for a host the site serves.
+        hosts = [host for host in settings.ALLOWED_HOSTS if host != '*']
+        host = hosts[0].lstrip('.') if hosts else 'localhost'
+
+        factory = APIRequestFactory()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = view(factory.get(path, HTTP_HOST=host))
+            response.render()
+            timings.append(time.perf_counter() - start)
+
+        timings.sort()
+        return response.content, timings[len(timings) // 2]
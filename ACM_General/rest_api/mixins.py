@@ -0,0 +1,668 @@
+"""
+Contains mixins which extend the generic ``rest_api`` views.
+"""
+# standard library
+import hashlib
+import json
+
+# third-party
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import FileField
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+# Django
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+# local Django
+from .encoders import encode_rows, get_row_encoders
+
+
+class NotModified(Exception):
+    """
+    Raised to stop a view once the client is known to hold the current
+    representation, so that nothing is serialized.
+    """
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class ConditionalGetMixin(object):
+    """
+    Tags each page and row read through a view with an ``ETag`` and answers
+    requests whose ``If-None-Match`` header names the current tag with an
+    empty 304 response.
+
+    The tag is a hash of the columns of the rows being returned, taken as
+    soon as they are read and before any of them is serialized, so a client
+    polling for changes costs the view a single query. Hashing the rows
+    themselves, rather than keeping a version number per table, keeps the
+    tag correct for changes made with ``QuerySet.update()`` and by other
+    processes.
+
+    A single row whose model records when it was last changed in a
+    ``date_modified`` field, such as an Event, is also sent with a
+    ``Last-Modified`` header. Pages are not, as a row leaving a page does not
+    change the time any of the remaining rows were modified. Clients which
+    send ``If-None-Match`` are answered by the entity tag alone.
+    """
+
+    def get_etag(self, rows):
+        """
+        Hashes the rows being returned, along with everything else the
+        response depends on.
+
+        :param rows: The model instances, or the dictionaries read with
+                     ``.values()``, being returned.
+        :type rows: list
+
+        :return: The quoted entity tag of the response.
+        :rtype: str
+        """
+        request = self.request
+        paginator = getattr(self, 'paginator', None)
+        digest = hashlib.sha1(repr((
+            request.build_absolute_uri(),
+            getattr(request, 'accepted_media_type', None),
+            getattr(paginator, 'has_next', None),
+            getattr(paginator, 'has_previous', None),
+        )).encode())
+
+        for row in rows:
+            if isinstance(row, dict):
+                values = sorted(row.items())
+            else:
+                deferred = row.get_deferred_fields()
+                values = [
+                    getattr(row, field.attname)
+                    for field in row._meta.concrete_fields
+                    if field.attname not in deferred
+                ]
+            digest.update(repr(values).encode())
+
+        return quote_etag(digest.hexdigest())
+
+    @staticmethod
+    def get_last_modified(instance):
+        """
+        :param instance: The single row being returned.
+        :type instance: :class:`django.db.models.Model`
+
+        :return: When the row was last changed, or None if its model does not
+                 record it or the column was not read.
+        :rtype: datetime.datetime or None
+        """
+        if 'date_modified' in instance.get_deferred_fields():
+            return None
+        return getattr(instance, 'date_modified', None)
+
+    def check_not_modified(self, rows, last_modified=None):
+        """
+        Tags the response with the entity tag of the rows, and stops the view
+        with a 304 response if the client already holds them.
+
+        :param rows: The rows being returned.
+        :type rows: list
+        :param last_modified: When the rows were last changed, if known.
+        :type last_modified: datetime.datetime
+
+        :raises NotModified: if the client's ``If-None-Match`` header names
+                             the current entity tag.
+        """
+        if self.request.method not in ('GET', 'HEAD'):
+            return
+
+        self.etag = self.get_etag(rows)
+        self.last_modified = last_modified
+        response = get_conditional_response(
+            self.request,
+            etag=self.etag,
+            last_modified=last_modified and int(last_modified.timestamp()),
+        )
+        if response is not None:
+            raise NotModified(response)
+
+    def paginate_queryset(self, queryset):
+        """
+        Reads a page of rows and checks whether the client already holds it.
+
+        :return: The rows of the page, or None if the view is not paginated.
+        :rtype: list
+        """
+        page = super().paginate_queryset(queryset)
+        if page is not None:
+            self.check_not_modified(page)
+        return page
+
+    def get_object(self):
+        """
+        Reads the requested row and checks whether the client already holds
+        it.
+
+        :return: The requested row.
+        :rtype: :class:`django.db.models.Model`
+        """
+        instance = super().get_object()
+        self.check_not_modified(
+            [instance], self.get_last_modified(instance)
+        )
+        return instance
+
+    def handle_exception(self, exc):
+        """
+        Answers with a 304 response when the view was stopped because the
+        client already holds the rows.
+        """
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Adds the entity tag of the rows, and when they were last modified,
+        to the response.
+        """
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        etag = getattr(self, 'etag', None)
+        if etag is not None and response.status_code in (200, 304):
+            response['ETag'] = etag
+            patch_vary_headers(response, ('Accept',))
+            last_modified = getattr(self, 'last_modified', None)
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(
+                    last_modified.timestamp()
+                )
+        return response
+
+
+class SparseFieldsetMixin(object):
+    """
+    Lets clients choose which fields are returned through the ``fields`` and
+    ``exclude`` query parameters, such as ``?fields=id,title,date_hosted``.
+
+    The fields are removed from the serializer and deferred in the queryset
+    with ``.only()``, so that unrequested columns are neither read from the
+    database nor serialized. Only reads are narrowed; writes always use every
+    field.
+    """
+
+    #: The query parameter listing the only fields to return.
+    fields_query_param = 'fields'
+
+    #: The query parameter listing the fields to leave out.
+    exclude_query_param = 'exclude'
+
+    def get_sparse_fields(self):
+        """
+        Returns the names of the fields the client asked for, in the order
+        the serializer declares them.
+
+        :return: The names of the requested fields, or None if every field
+                 is to be returned.
+        :rtype: list
+
+        :raises rest_framework.exceptions.ValidationError: if a field the
+                serializer does not have is named.
+        """
+        if hasattr(self, '_sparse_fields'):
+            return self._sparse_fields
+
+        self._sparse_fields = None
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in ('GET', 'HEAD'):
+            return None
+
+        params = request.query_params
+        if not (self.fields_query_param in params or
+                self.exclude_query_param in params):
+            return None
+
+        available = list(self.get_serializer_class()().fields)
+        errors = {}
+        requested = {}
+        for param in (self.fields_query_param, self.exclude_query_param):
+            if param not in params:
+                continue
+            names = {name.strip() for name in params[param].split(',')}
+            names.discard('')
+            unknown = names.difference(available)
+            if unknown:
+                errors[param] = 'Unknown field(s): {}.'.format(
+                    ', '.join(sorted(unknown))
+                )
+            requested[param] = names
+
+        if errors:
+            raise ValidationError(errors)
+
+        fields = requested.get(self.fields_query_param, set(available))
+        fields = fields.difference(
+            requested.get(self.exclude_query_param, ())
+        )
+        self._sparse_fields = [name for name in available if name in fields]
+        return self._sparse_fields
+
+    def get_queryset(self):
+        """
+        Defers the columns of every field the client did not ask for.
+
+        :return: The queryset of the view, narrowed with ``.only()`` if the
+                 client asked for a subset of the fields.
+        :rtype: :class:`django.db.models.query.QuerySet`
+        """
+        queryset = super().get_queryset()
+        names = self.get_sparse_fields()
+        if names is None:
+            return queryset
+
+        model_fields = {
+            field.name: field for field in queryset.model._meta.concrete_fields
+        }
+        # The primary key and the columns the cursor is keyed on are always
+        # read, as building the cursor of the next page relies on them.
+        columns = {queryset.model._meta.pk.name}
+        columns.update(
+            name.lstrip('-')
+            for name in getattr(self, 'cursor_ordering', ())
+        )
+        columns.update(name for name in names if name in model_fields)
+
+        # A relation which is deferred can not also be joined in.
+        related = queryset.query.select_related
+        if isinstance(related, dict):
+            queryset = queryset.select_related(None)
+            related = [name for name in related if name in columns]
+            if related:
+                queryset = queryset.select_related(*related)
+        return queryset.only(*columns)
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        Removes every field the client did not ask for from the serializer.
+
+        :return: The serializer of the view.
+        :rtype: :class:`rest_framework.serializers.Serializer`
+        """
+        serializer = super().get_serializer(*args, **kwargs)
+        names = self.get_sparse_fields()
+        if names is not None:
+            fields = getattr(serializer, 'child', serializer).fields
+            for name in list(fields):
+                if name not in names:
+                    fields.pop(name)
+        return serializer
+
+
+class ValuesListMixin(object):
+    """
+    Lists rows read with ``.values()`` and encoded by the precompiled
+    encoders of :mod:`rest_api.encoders`, rather than building a model
+    instance and running each serializer field per row.
+
+    The response is identical to the one the serializer would give. Views
+    whose serializers have a field which can not be encoded from a column,
+    such as a file, fall back to the serializer.
+    """
+
+    #: Whether lists are read with ``.values()`` when the serializer allows.
+    values_serialization = True
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists a page of rows.
+
+        :param request: Request for a page of rows.
+        :type request: :class:`rest_framework.request.Request`
+
+        :return: A page of rows, the cursors of the neighbouring pages, and
+                 a 200 response.
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        encoders = None
+        if self.values_serialization:
+            encoders = get_row_encoders(self.get_serializer_class())
+        if encoders is None:
+            return super().list(request, *args, **kwargs)
+
+        names = getattr(self, 'get_sparse_fields', lambda: None)()
+        if names is not None:
+            encoders = tuple(
+                encoder for encoder in encoders if encoder[0] in names
+            )
+
+        # The cursor of the next page is built from the ordering columns.
+        columns = {column for _, column, _ in encoders}
+        columns.update(
+            name.lstrip('-')
+            for name in getattr(self, 'cursor_ordering', ())
+        )
+        queryset = self.filter_queryset(self.get_queryset()).values(*columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(encode_rows(queryset, encoders))
+        return self.get_paginated_response(encode_rows(page, encoders))
+
+
+class ExportModelMixin(object):
+    """
+    Streams every row of a queryset to the client as newline delimited JSON.
+
+    Rows are read from the database with a server-side cursor and serialized
+    one at a time, so neither the time to first byte nor the memory used by
+    the worker depend on the size of the table being exported.
+    """
+
+    #: The name the exported file is given when downloaded.
+    export_filename = 'export'
+
+    def get_export_queryset(self):
+        """
+        Returns the filtered queryset to export, ordered the same way as the
+        list view pages through it.
+
+        :return: The queryset to be exported.
+        :rtype: :class:`django.db.models.query.QuerySet`
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = getattr(self, 'cursor_ordering', None)
+
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
+    def stream_rows(self, queryset):
+        """
+        Lazily serializes each row of the queryset into a line of JSON.
+
+        :param queryset: The queryset to serialize.
+        :type queryset: :class:`django.db.models.query.QuerySet`
+
+        :return: A generator which yields one JSON document per row.
+        :rtype: generator
+        """
+        serializer = self.get_serializer()
+        encoder = JSONEncoder(ensure_ascii=False)
+        chunk_size = getattr(settings, 'REST_API_EXPORT_CHUNK_SIZE', 2000)
+
+        for instance in queryset.iterator(chunk_size=chunk_size):
+            yield encoder.encode(serializer.to_representation(instance))
+            yield '\n'
+
+    def export(self, request, *args, **kwargs):
+        """
+        Exports every row matched by the request as newline delimited JSON.
+
+        :param request: Request to export the rows of a table.
+        :type request: :class:`rest_framework.request.Request`
+
+        :return: A streaming response with one JSON document per line.
+        :rtype: :class:`django.http.StreamingHttpResponse`
+        """
+        response = StreamingHttpResponse(
+            self.stream_rows(self.get_export_queryset()),
+            content_type='application/x-ndjson',
+        )
+        response['Content-Disposition'] = (
+            'attachment; filename="{}.ndjson"'.format(self.export_filename)
+        )
+        return response
+
+
+class BulkModelMixin(object):
+    """
+    Creates, updates or deletes many rows in a single request and a single
+    transaction.
+
+    Requests carry a JSON array of items, or for creates with files, a
+    multipart form whose ``items`` field holds the array and whose file
+    fields name the uploaded files. Every item is validated before anything
+    is written; if any item is invalid, nothing is written and a 400
+    response lists the errors of each item, with an empty object for the
+    items which were valid. Otherwise the rows are written with
+    ``bulk_create``, ``bulk_update`` or a single ``DELETE`` and the result of
+    each item is returned in the order the items were sent.
+
+    ``post_save`` is sent for every row written, as ``bulk_create`` and
+    ``bulk_update`` do not send it, so that the caches kept up to date by
+    signal receivers see the change.
+    """
+
+    @property
+    def max_bulk_size(self):
+        """
+        The most items accepted in one request, as set by
+        ``REST_API_MAX_BULK_SIZE``.
+
+        :rtype: int
+        """
+        return getattr(settings, 'REST_API_MAX_BULK_SIZE', 1000)
+
+    def get_bulk_items(self):
+        """
+        Returns the items of the request.
+
+        :return: The items sent by the client.
+        :rtype: list
+
+        :raises rest_framework.exceptions.ValidationError: if the request
+                does not hold a list of items, or holds too many.
+        """
+        data = self.request.data
+        if not isinstance(data, list) and 'items' in data:
+            try:
+                data = json.loads(data['items'])
+            except ValueError:
+                raise ValidationError({'items': ['Invalid JSON.']})
+
+            # The file fields of an item name one of the uploaded files.
+            file_fields = [
+                name for name, field in self.get_serializer().fields.items()
+                if isinstance(field, FileField)
+            ]
+            files = self.request.FILES
+            for item in data if isinstance(data, list) else ():
+                for name in file_fields:
+                    if isinstance(item, dict) and item.get(name) in files:
+                        item[name] = files[item[name]]
+
+        if not isinstance(data, list):
+            raise ValidationError({
+                'non_field_errors': ['Expected a list of items.']
+            })
+        if len(data) > self.max_bulk_size:
+            raise ValidationError({
+                'non_field_errors': [
+                    'No more than {} items may be sent at once.'.format(
+                        self.max_bulk_size
+                    )
+                ]
+            })
+        return data
+
+    def get_bulk_instances(self, items, get_id=lambda item: item):
+        """
+        Looks up the row of each item in a single query.
+
+        :param items: The items sent by the client.
+        :type items: list
+        :param get_id: Returns the primary key named by an item.
+        :type get_id: function
+
+        :return: The row of each item, and the errors of each item, which
+                 are empty for the items whose row was found.
+        :rtype: tuple
+        """
+        pk_field = self.get_queryset().model._meta.pk
+        pks = []
+        seen = set()
+        errors = []
+        for item in items:
+            pk = None
+            try:
+                pk = pk_field.to_python(get_id(item))
+            except (DjangoValidationError, TypeError):
+                pass
+            if pk is None:
+                errors.append({pk_field.name: ['A valid id is required.']})
+            elif pk in seen:
+                errors.append({pk_field.name: ['Duplicate id.']})
+            else:
+                errors.append({})
+            pks.append(pk)
+            seen.add(pk)
+
+        rows = self.get_queryset().in_bulk(
+            [pk for pk, error in zip(pks, errors) if not error]
+        )
+        for pk, error in zip(pks, errors):
+            if not error and pk not in rows:
+                error[pk_field.name] = ['Not found.']
+        return [rows.get(pk) for pk in pks], errors
+
+    def bulk_create(self, request, *args, **kwargs):
+        """
+        Creates a row for each item.
+
+        :param request: Request holding the items to create.
+        :type request: :class:`rest_framework.request.Request`
+
+        :return: The created rows and a 201 response, or the errors of each
+                 item and a 400 response.
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        serializer = self.get_serializer(
+            data=self.get_bulk_items(), many=True
+        )
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        model = self.get_queryset().model
+        instances = [
+            model(**attrs) for attrs in serializer.validated_data
+        ]
+        with transaction.atomic():
+            self.perform_bulk_create(instances)
+            for instance in instances:
+                post_save.send(
+                    sender=model, instance=instance, created=True,
+                    update_fields=None, raw=False, using=instance._state.db,
+                )
+
+        return Response(
+            self.get_serializer(instances, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    def perform_bulk_create(self, instances):
+        """
+        Inserts the new rows.
+
+        :param instances: The rows to insert.
+        :type instances: list
+        """
+        self.get_queryset().model.objects.bulk_create(instances)
+
+    def bulk_update(self, request, *args, **kwargs):
+        """
+        Partially updates the row named by the ``id`` of each item.
+
+        :param request: Request holding the items to update.
+        :type request: :class:`rest_framework.request.Request`
+
+        :return: The updated rows and a 200 response, or the errors of each
+                 item and a 400 response.
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        items = self.get_bulk_items()
+        model = self.get_queryset().model
+        pk_name = model._meta.pk.name
+        instances, errors = self.get_bulk_instances(
+            items,
+            lambda item: item.get(pk_name) if isinstance(item, dict) else None,
+        )
+
+        # Each item is validated against its own row, so that validators
+        # which compare against the stored row see the right one.
+        fields = set()
+        for index, item in enumerate(items):
+            if errors[index]:
+                continue
+            serializer = self.get_serializer(
+                instances[index], data=item, partial=True
+            )
+            if not serializer.is_valid():
+                errors[index] = serializer.errors
+                continue
+
+            for name, value in serializer.validated_data.items():
+                if isinstance(serializer.fields[name], FileField):
+                    errors[index] = {
+                        name: ['Files can not be changed in bulk.']
+                    }
+                    break
+                setattr(instances[index], name, value)
+                fields.add(name)
+
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        if fields:
+            # bulk_update() does not touch auto_now fields, such as the
+            # modification time fragment caches are keyed on.
+            for field in model._meta.concrete_fields:
+                if getattr(field, 'auto_now', False):
+                    for instance in instances:
+                        field.pre_save(instance, False)
+                    fields.add(field.name)
+
+        with transaction.atomic():
+            if fields:
+                model.objects.bulk_update(instances, sorted(fields))
+            for instance in instances:
+                post_save.send(
+                    sender=model, instance=instance, created=False,
+                    update_fields=frozenset(fields), raw=False,
+                    using=instance._state.db,
+                )
+
+        return Response(self.get_serializer(instances, many=True).data)
+
+    def bulk_destroy(self, request, *args, **kwargs):
+        """
+        Deletes the row named by each item, which is an id.
+
+        :param request: Request holding the ids of the rows to delete.
+        :type request: :class:`rest_framework.request.Request`
+
+        :return: The id of each deleted row and a 200 response, or the errors
+                 of each item and a 400 response.
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        items = self.get_bulk_items()
+        instances, errors = self.get_bulk_instances(items)
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        pk_name = self.get_queryset().model._meta.pk.name
+        with transaction.atomic():
+            self.get_queryset().model.objects.filter(
+                pk__in=[instance.pk for instance in instances]
+            ).delete()
+
+        return Response([
+            {pk_name: str(instance.pk)} for instance in instances
+        ])
@@ -0,0 +1,57 @@
+"""
+Contains the pagination classes used by the ``rest_api`` list views.
+"""
+# third-party
+from rest_framework import pagination
+
+# Django
+from django.conf import settings
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset (cursor) paginator shared by every ``rest_api`` list view.
+
+    Pages are located by filtering on the ordering columns rather than by an
+    ``OFFSET``, and no ``COUNT(*)`` query is issued, so the cost of fetching a
+    page does not depend on the size of the underlying table. Cursors are
+    opaque, base64 encoded positions generated by Django REST Framework.
+
+    Each view selects the columns it is keyed on through a ``cursor_ordering``
+    attribute; views which do not declare one fall back to ``ordering``.
+    """
+    #: The ordering used by views which do not declare ``cursor_ordering``.
+    ordering = ('-date_created', 'id')
+
+    #: The query parameter clients may use to request a smaller page.
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self):
+        """
+        The largest page a client is allowed to request, as set by
+        ``REST_API_MAX_PAGE_SIZE``.
+
+        :rtype: int
+        """
+        return getattr(settings, 'REST_API_MAX_PAGE_SIZE', 1000)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the ordering the cursor is keyed on for the given view.
+
+        :param request: The request being paginated.
+        :type request: :class:`rest_framework.request.Request`
+        :param queryset: The queryset being paginated.
+        :type queryset: :class:`django.db.models.query.QuerySet`
+        :param view: The view which is paginating the queryset.
+        :type view: :class:`rest_framework.generics.GenericAPIView`
+
+        :return: The fields the queryset is ordered by.
+        :rtype: tuple
+        """
+        ordering = getattr(view, 'cursor_ordering', self.ordering)
+
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
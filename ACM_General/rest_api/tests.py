@@ -4,22 +4,34 @@ Contains all of the unit tests for the rest_api app.
 # standard library
 from io import BytesIO
 import json
+import shutil
+import tempfile
+from unittest import mock
 
 # third-party
 from PIL import Image
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 
 # Django
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import http_date
 
 # local Django
+from . import views
+from .encoders import get_row_encoders
 from accounts.models import User
+from core.models import Job
 from events.models import Event
-# from events.serializers import EventSerializer
+from events.serializers import EventSerializer
+from home.signals import UPCOMING_EVENTS_CACHE_KEY
 from products.models import TransactionCategory, Product, Transaction
+from products.serializers import TransactionSerializer
 from sigs.models import SIG
 
 
@@ -123,7 +135,7 @@ class AccountsTestCase(TestCase):
         ##
         user_id = response.json()['id']
         response = self.client.get(reverse('rest_api:user-list'))
-        self.assertIsNotNone(response.json()[1])
+        self.assertIsNotNone(response.json()['results'][1])
 
         response = self.client.delete(
             reverse(
@@ -145,8 +157,8 @@ class AccountsTestCase(TestCase):
         ##
         response = self.client.get(reverse('rest_api:user-list'))
         with self.assertRaises(IndexError):
-            self.assertEqual(response.json()[2], None)
-        self.assertIsNotNone(response.json()[1])
+            self.assertEqual(response.json()['results'][2], None)
+        self.assertIsNotNone(response.json()['results'][1])
 
     def test_serializer_validation(self):
         """
@@ -158,6 +170,27 @@ class AccountsTestCase(TestCase):
         response = self.client.post(reverse('rest_api:user-list'), user)
         self.assertEqual(response.status_code, 400)
 
+    def test_is_member_filter(self):
+        """
+        Ensures that users can be filtered by whether they are members.
+        """
+        self.user.update_mem_expiration(timezone.timedelta(days=30))
+
+        response = self.client.get(
+            reverse('rest_api:user-list'), {'is_member': 'true'}
+        )
+        self.assertEqual(
+            [user['email'] for user in response.json()['results']],
+            [self.user.email],
+        )
+
+        response = self.client.get(
+            reverse('rest_api:user-list'), {'is_member': 'false'}
+        )
+        emails = [user['email'] for user in response.json()['results']]
+        self.assertNotIn(self.user.email, emails)
+        self.assertIn('acm@mst.edu', emails)
+
 
 class EventsTestCase(TestCase):
     """
@@ -171,6 +204,13 @@ class EventsTestCase(TestCase):
         """
         super().setUp()
         self.client = APIClient()
+        # Uploaded fliers are written to a temporary media directory.
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
         self.user = User.objects.create_user('ksyh3@mst.edu')
         self.sig = SIG.objects.create_sig(
             id='test',
@@ -274,7 +314,7 @@ class EventsTestCase(TestCase):
         ##
         event_id = response.json()['id']
         response = self.client.get(reverse('rest_api:event-list'))
-        self.assertIsNotNone(response.json()[1])
+        self.assertIsNotNone(response.json()['results'][1])
 
         response = self.client.delete(
             reverse(
@@ -296,8 +336,8 @@ class EventsTestCase(TestCase):
         ##
         response = self.client.get(reverse('rest_api:event-list'))
         with self.assertRaises(IndexError):
-            self.assertEqual(response.json()[1], None)
-        self.assertIsNotNone(response.json()[0])
+            self.assertEqual(response.json()['results'][1], None)
+        self.assertIsNotNone(response.json()['results'][0])
 
 
 class SigsTestCase(TestCase):
@@ -398,7 +438,7 @@ class SigsTestCase(TestCase):
         ##
         sig_id = response.json()['id']
         response = self.client.get(reverse('rest_api:sig-list'))
-        self.assertIsNotNone(response.json()[1])
+        self.assertIsNotNone(response.json()['results'][1])
 
         response = self.client.delete(
             reverse(
@@ -420,8 +460,8 @@ class SigsTestCase(TestCase):
         ##
         response = self.client.get(reverse('rest_api:sig-list'))
         with self.assertRaises(IndexError):
-            self.assertEqual(response.json()[2], None)
-        self.assertIsNotNone(response.json()[1])
+            self.assertEqual(response.json()['results'][2], None)
+        self.assertIsNotNone(response.json()['results'][1])
 
 
 class TransactionsTestCase(TestCase):
@@ -531,7 +571,7 @@ class TransactionsTestCase(TestCase):
         ##
         transaction_id = response.json()['id']
         response = self.client.get(reverse('rest_api:transaction-list'))
-        self.assertIsNotNone(response.json()[1])
+        self.assertIsNotNone(response.json()['results'][1])
 
         response = self.client.delete(
             reverse(
@@ -553,8 +593,8 @@ class TransactionsTestCase(TestCase):
         ##
         response = self.client.get(reverse('rest_api:transaction-list'))
         with self.assertRaises(IndexError):
-            self.assertEqual(response.json()[1], None)
-        self.assertIsNotNone(response.json()[0])
+            self.assertEqual(response.json()['results'][1], None)
+        self.assertIsNotNone(response.json()['results'][0])
 
 
 class CategoryTestCase(TestCase):
@@ -656,7 +696,7 @@ class CategoryTestCase(TestCase):
         ##
         category_id = response.json()['id']
         response = self.client.get(reverse('rest_api:category-list'))
-        self.assertIsNotNone(response.json()[1])
+        self.assertIsNotNone(response.json()['results'][1])
 
         response = self.client.delete(
             reverse(
@@ -678,8 +718,8 @@ class CategoryTestCase(TestCase):
         ##
         response = self.client.get(reverse('rest_api:category-list'))
         with self.assertRaises(IndexError):
-            self.assertEqual(response.json()[2], None)
-        self.assertIsNotNone(response.json()[1])
+            self.assertEqual(response.json()['results'][2], None)
+        self.assertIsNotNone(response.json()['results'][1])
 
 
 class ProductTestCase(TestCase):
@@ -786,7 +826,7 @@ class ProductTestCase(TestCase):
         ##
         product_id = response.json()['tag']
         response = self.client.get(reverse('rest_api:product-list'))
-        self.assertIsNotNone(response.json()[1])
+        self.assertIsNotNone(response.json()['results'][1])
 
         response = self.client.delete(
             reverse(
@@ -808,5 +848,916 @@ class ProductTestCase(TestCase):
         ##
         response = self.client.get(reverse('rest_api:product-list'))
         with self.assertRaises(IndexError):
-            self.assertEqual(response.json()[3], None)
-        self.assertIsNotNone(response.json()[2])
+            self.assertEqual(response.json()['results'][3], None)
+        self.assertIsNotNone(response.json()['results'][2])
+
+
+class PaginationTestCase(TestCase):
+    """
+    Ensures the list views are cursor paginated.
+    """
+
+    def setUp(self):
+        """
+        Initializes a handful of Transactions to page through.
+        """
+        super().setUp()
+        self.client = APIClient()
+        self.user = User.objects.create_user('ksyh3@mst.edu')
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.category = TransactionCategory.objects.create_category('test')
+        for i in range(5):
+            Transaction.objects.create_transaction(
+                str(i),
+                cost=3.00,
+                category=self.category,
+                sig=self.sig,
+            )
+
+    def test_cursor_pagination(self):
+        """
+        Ensures following the ``next`` cursors visits every Transaction
+        exactly once, without a count of the table being returned.
+        """
+        seen = []
+        url = reverse('rest_api:transaction-list') + '?page_size=2'
+        while url is not None:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.json())
+            self.assertLessEqual(len(response.json()['results']), 2)
+            seen.extend(t['id'] for t in response.json()['results'])
+            url = response.json()['next']
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(
+            set(seen),
+            set(str(pk) for pk in Transaction.objects.values_list(
+                'id', flat=True
+            ))
+        )
+
+    def test_page_size_is_capped(self):
+        """
+        Ensures a client cannot request a page larger than the cap.
+        """
+        with self.settings(REST_API_MAX_PAGE_SIZE=1):
+            response = self.client.get(
+                reverse('rest_api:transaction-list') + '?page_size=100'
+            )
+        self.assertEqual(len(response.json()['results']), 1)
+
+
+class ExportTestCase(TestCase):
+    """
+    Ensures the streaming exports behave as expected.
+    """
+
+    def setUp(self):
+        """
+        Initializes a staff user and a handful of Transactions to export.
+        """
+        super().setUp()
+        self.client = APIClient()
+        self.user = User.objects.create_superuser('ksyh3@mst.edu')
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.category = TransactionCategory.objects.create_category('test')
+        for i in range(3):
+            Transaction.objects.create_transaction(
+                str(i),
+                cost=3.00,
+                category=self.category,
+                sig=self.sig,
+            )
+
+    def test_export_requires_staff(self):
+        """
+        Ensures anonymous users cannot export a table.
+        """
+        response = self.client.get(reverse('rest_api:transaction-export'))
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_transaction_export(self):
+        """
+        Ensures every Transaction is streamed as one line of JSON.
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse('rest_api:transaction-export'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(
+            sorted(row['stripe_token'] for row in rows), ['0', '1', '2']
+        )
+
+    def test_export_does_not_shadow_details(self):
+        """
+        Ensures a SIG or Product whose key is ``export`` can still be read.
+        """
+        self.client.force_authenticate(user=self.user)
+        SIG.objects.create_sig(
+            id='export',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        Product.objects.create_product(
+            'export',
+            'export',
+            cost=3.00,
+            category=self.category,
+            sig=self.sig,
+        )
+
+        response = self.client.get(
+            reverse('rest_api:sig-detail', kwargs={'pk': 'export'})
+        )
+        self.assertEqual(response.json()['id'], 'export')
+        response = self.client.get(
+            reverse('rest_api:product-detail', kwargs={'pk': 'export'})
+        )
+        self.assertEqual(response.json()['tag'], 'export')
+
+
+class QueryCountTestCase(TestCase):
+    """
+    Ensures the list views fetch a page in a fixed number of queries, however
+    many rows the table holds and the page returns.
+    """
+
+    #: The sizes of the tables the list views are checked against.
+    row_counts = (1, 100, 10000)
+
+    #: The list views, the model each lists, and the number of queries each
+    #: should make for a page.
+    list_queries = (
+        ('rest_api:user-list', User, 1),
+        ('rest_api:event-list', Event, 1),
+        ('rest_api:sig-list', SIG, 1),
+        ('rest_api:transaction-list', Transaction, 1),
+        ('rest_api:product-list', Product, 1),
+        ('rest_api:category-list', TransactionCategory, 1),
+    )
+
+    def setUp(self):
+        """
+        Initializes the client used to request the list views.
+        """
+        super().setUp()
+        self.client = APIClient()
+
+    @staticmethod
+    def seed(rows):
+        """
+        Bulk inserts the given number of rows into each table listed by the
+        ``rest_api``.
+
+        :param rows: The number of rows to create in each table.
+        :type rows: int
+        """
+        now = timezone.now()
+        users = User.objects.bulk_create(
+            User(email='seed{}@mst.edu'.format(i)) for i in range(rows)
+        )
+        sigs = SIG.objects.bulk_create(
+            SIG(
+                id='seed-{}'.format(i),
+                founder=users[i],
+                chair=users[i],
+                description='seed',
+            )
+            for i in range(rows)
+        )
+        categories = TransactionCategory.objects.bulk_create(
+            TransactionCategory(name='seed-{}'.format(i))
+            for i in range(rows)
+        )
+        Event.objects.bulk_create(
+            Event(
+                creator=users[i],
+                hosting_sig=sigs[i],
+                title='seed',
+                description='seed',
+                location='seed',
+                date_hosted=now,
+                date_expire=now,
+                flier='seed.png',
+            )
+            for i in range(rows)
+        )
+        Product.objects.bulk_create(
+            Product(
+                tag='seed-{}'.format(i),
+                name='seed-{}'.format(i),
+                cost=3,
+                category=categories[i],
+                sig=sigs[i],
+            )
+            for i in range(rows)
+        )
+        Transaction.objects.bulk_create(
+            Transaction(
+                description='seed',
+                category=categories[i],
+                sig=sigs[i],
+                cost=3,
+                user=users[i],
+                stripe_token='seed',
+                charge_id='seed',
+            )
+            for i in range(rows)
+        )
+
+    def assertListQueries(self, rows):
+        """
+        Seeds each table with the given number of rows and asserts the exact
+        number of queries made for the largest page of each list view.
+
+        :param rows: The number of rows to seed each table with.
+        :type rows: int
+        """
+        self.seed(rows)
+        with self.settings(REST_API_MAX_PAGE_SIZE=1000):
+            for name, model, queries in self.list_queries:
+                # The tables also hold the rows created by migrations.
+                total = model.objects.count()
+                with self.subTest(view=name, rows=total):
+                    with self.assertNumQueries(queries):
+                        response = self.client.get(
+                            reverse(name) + '?page_size=1000'
+                        )
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(
+                        len(response.json()['results']), min(total, 1000)
+                    )
+
+    def test_list_queries_with_one_row(self):
+        self.assertListQueries(self.row_counts[0])
+
+    def test_list_queries_with_a_hundred_rows(self):
+        self.assertListQueries(self.row_counts[1])
+
+    def test_list_queries_with_ten_thousand_rows(self):
+        self.assertListQueries(self.row_counts[2])
+
+    def test_related_rows_are_joined(self):
+        """
+        Ensures following the foreign keys of a listed row does not query the
+        database again.
+        """
+        self.seed(1)
+        with self.assertNumQueries(1):
+            transaction = views.TransactionList.queryset.get(
+                description='seed'
+            )
+            self.assertEqual(transaction.category.name, 'seed-0')
+            self.assertEqual(transaction.sig.id, 'seed-0')
+            self.assertEqual(transaction.user.email, 'seed0@mst.edu')
+        with self.assertNumQueries(1):
+            event = views.EventList.queryset.get(title='seed')
+            self.assertEqual(event.creator.email, 'seed0@mst.edu')
+            self.assertEqual(event.hosting_sig.id, 'seed-0')
+        with self.assertNumQueries(1):
+            product = views.ProductList.queryset.get(tag='seed-0')
+            self.assertEqual(product.category.name, 'seed-0')
+            self.assertEqual(product.sig.id, 'seed-0')
+        with self.assertNumQueries(1):
+            sig = views.SIGList.queryset.get(id='seed-0')
+            self.assertEqual(sig.founder.email, 'seed0@mst.edu')
+            self.assertEqual(sig.chair.email, 'seed0@mst.edu')
+
+
+class SparseFieldsetTestCase(TestCase):
+    """
+    Ensures clients can narrow the fields returned by the ``rest_api``.
+    """
+
+    def setUp(self):
+        """
+        Initializes an Event to request a subset of the fields of.
+        """
+        super().setUp()
+        self.client = APIClient()
+        self.user = User.objects.create_user('ksyh3@mst.edu')
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.event = Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='test',
+            description='a' * 1000,
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+        )
+
+    def test_fields(self):
+        """
+        Ensures only the requested fields are serialized or read from the
+        database.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('rest_api:event-list') +
+                '?fields=id,title,date_hosted'
+            )
+        self.assertEqual(response.status_code, 200)
+        # Fields are returned in the order the serializer declares them.
+        self.assertEqual(
+            list(response.json()['results'][0]),
+            ['id', 'date_hosted', 'title'],
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0]['sql'])
+        self.assertNotIn('"flier"', queries[0]['sql'])
+        self.assertNotIn('JOIN', queries[0]['sql'])
+
+    def test_exclude(self):
+        """
+        Ensures excluded fields are left out of the response.
+        """
+        response = self.client.get(
+            reverse('rest_api:event-detail', kwargs={'pk': self.event.id}) +
+            '?exclude=description,flier'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('description', response.json())
+        self.assertNotIn('flier', response.json())
+        self.assertEqual(response.json()['title'], 'test')
+
+    def test_deferred_relation(self):
+        """
+        Ensures a relation joined in by the view can still be deferred.
+        """
+        response = self.client.get(
+            reverse('rest_api:event-list') + '?fields=title,hosting_sig'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['results'],
+            [{'title': 'test', 'hosting_sig': 'test'}],
+        )
+
+        response = self.client.get(
+            reverse('rest_api:event-list') + '?fields=title'
+        )
+        self.assertEqual(response.json()['results'], [{'title': 'test'}])
+
+    def test_unknown_field(self):
+        """
+        Ensures asking for a field which does not exist is rejected.
+        """
+        response = self.client.get(
+            reverse('rest_api:event-list') + '?fields=title,password'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.json()['fields'])
+
+    def test_writes_are_not_narrowed(self):
+        """
+        Ensures the fields of a write are not narrowed by the query string.
+        """
+        response = self.client.patch(
+            reverse('rest_api:event-detail', kwargs={'pk': self.event.id}) +
+            '?fields=title',
+            data=json.dumps({'title': 'changed'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'changed')
+        self.assertEqual(response.json()['description'], 'a' * 1000)
+
+
+class ValuesSerializationTestCase(TestCase):
+    """
+    Ensures the list views which read rows with ``.values()`` respond exactly
+    as their serializers would.
+    """
+
+    def setUp(self):
+        """
+        Initializes rows with every kind of column the list views encode.
+        """
+        super().setUp()
+        self.factory = APIRequestFactory()
+        self.user = User.objects.create_user(
+            'ksyh3@mst.edu', first_name='Zoë', last_name=' ',
+        )
+        self.user.last_login = timezone.now()
+        self.user.save()
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.category = TransactionCategory.objects.create_category('test')
+        for i, cost in enumerate(('3.00', '0.10', '12.5', '1000')):
+            Transaction.objects.create_transaction(
+                str(i),
+                cost=cost,
+                category=self.category,
+                sig=self.sig,
+                user=self.user if i % 2 else None,
+            )
+
+    def get(self, view, path, **initkwargs):
+        """
+        Renders the response of a list view.
+
+        :param view: The class of the list view.
+        :type view: :class:`rest_framework.generics.GenericAPIView`
+        :param path: The path and query string of the request.
+        :type path: str
+
+        :return: The rendered response.
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        request = self.factory.get(path, HTTP_HOST='localhost')
+        return view.as_view(**initkwargs)(request).render()
+
+    def test_output_is_identical(self):
+        """
+        Ensures both ways of listing rows produce the same bytes.
+        """
+        for view in (views.UserList, views.TransactionList):
+            for path in ('/', '/?page_size=2', '/?exclude=id'):
+                with self.subTest(view=view.__name__, path=path):
+                    with self.assertNumQueries(1):
+                        values = self.get(view, path)
+                    serialized = self.get(
+                        view, path, values_serialization=False
+                    )
+                    self.assertEqual(values.status_code, 200)
+                    self.assertEqual(values.content, serialized.content)
+
+    def test_next_page(self):
+        """
+        Ensures the cursor of the next page can be followed when the ordering
+        column is not returned.
+        """
+        first = self.get(
+            views.TransactionList, '/?page_size=2&fields=cost'
+        ).data
+        self.assertEqual(list(first['results'][0]), ['cost'])
+
+        second = self.get(views.TransactionList, first['next']).data
+        self.assertEqual(len(second['results']), 2)
+
+    def test_unsupported_serializer(self):
+        """
+        Ensures serializers with a field which can not be encoded from a
+        column are not read with ``.values()``.
+        """
+        self.assertIsNone(get_row_encoders(EventSerializer))
+        self.assertIsNotNone(get_row_encoders(TransactionSerializer))
+
+
+class ConditionalGetTestCase(TestCase):
+    """
+    Ensures clients which already hold a page or row are answered with an
+    empty 304 response.
+    """
+
+    def setUp(self):
+        """
+        Initializes an Event to request.
+        """
+        super().setUp()
+        self.client = APIClient()
+        self.user = User.objects.create_user('ksyh3@mst.edu')
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.event = Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='test',
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+        )
+
+    def assertNotModified(self, url):
+        """
+        Requests a URL again with the entity tag it was last returned with,
+        and asserts the response is an empty 304 which cost one query and no
+        serialization.
+
+        :param url: The URL to request.
+        :type url: str
+        """
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1), mock.patch.object(
+            EventSerializer, 'to_representation',
+            side_effect=AssertionError('serialized'),
+        ):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_list(self):
+        url = reverse('rest_api:event-list')
+        self.assertNotModified(url)
+
+        # A change made without sending any signal is still seen.
+        etag = self.client.get(url)['ETag']
+        Event.objects.filter(pk=self.event.pk).update(title='changed')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['results'][0]['title'], 'changed')
+
+    def test_detail(self):
+        url = reverse('rest_api:event-detail', kwargs={'pk': self.event.id})
+        self.assertNotModified(url)
+
+        etag = self.client.get(url)['ETag']
+        self.event.location = 'changed'
+        self.event.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_last_modified(self):
+        """
+        Ensures single rows of models which record their modification time
+        are sent with when they were last modified, and lists are not.
+        """
+        url = reverse('rest_api:event-detail', kwargs={'pk': self.event.id})
+        response = self.client.get(url)
+        self.assertEqual(
+            response['Last-Modified'],
+            http_date(self.event.date_modified.timestamp()),
+        )
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+        )
+        self.assertEqual(response.status_code, 304)
+
+        self.assertFalse(
+            self.client.get(reverse('rest_api:event-list')).has_header(
+                'Last-Modified'
+            )
+        )
+        self.assertFalse(
+            self.client.get(
+                reverse('rest_api:sig-detail', kwargs={'pk': self.sig.id})
+            ).has_header('Last-Modified')
+        )
+
+    def test_representations_are_tagged_apart(self):
+        """
+        Ensures narrower representations of the same rows are not matched.
+        """
+        url = reverse('rest_api:event-list')
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(
+            url + '?fields=title', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotModified(url + '?fields=title')
+
+    def test_values_list(self):
+        """
+        Ensures lists read with ``.values()`` are tagged too.
+        """
+        self.assertNotModified(reverse('rest_api:user-list'))
+
+    def test_writes_are_not_conditional(self):
+        url = reverse('rest_api:event-detail', kwargs={'pk': self.event.id})
+        etag = self.client.get(url)['ETag']
+        response = self.client.patch(
+            url,
+            data=json.dumps({'title': 'changed'}),
+            content_type='application/json',
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'changed')
+
+
+class BulkTestCase(TestCase):
+    """
+    Ensures many rows can be written in one request and one transaction.
+    """
+
+    def setUp(self):
+        """
+        Initializes a staff user, two categories and a few Transactions to
+        write in bulk.
+        """
+        super().setUp()
+        self.client = APIClient()
+        self.user = User.objects.create_superuser('ksyh3@mst.edu')
+        self.client.force_authenticate(user=self.user)
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.category = TransactionCategory.objects.create_category('test')
+        self.other = TransactionCategory.objects.create_category('other')
+        self.transactions = [
+            Transaction.objects.create_transaction(
+                str(i),
+                cost=3.00,
+                category=self.category,
+                sig=self.sig,
+            )
+            for i in range(3)
+        ]
+
+    def send(self, method, name, items):
+        """
+        Sends a list of items to a bulk endpoint as JSON.
+
+        :param method: The HTTP method, such as ``post``.
+        :type method: str
+        :param name: The name of the bulk endpoint's URL.
+        :type name: str
+        :param items: The items to send.
+        :type items: list
+
+        :return: The response of the endpoint.
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        return getattr(self.client, method)(
+            reverse(name),
+            data=json.dumps(items, default=str),
+            content_type='application/json',
+        )
+
+    def transaction_data(self, token):
+        return {
+            'description': 'test',
+            'cost': '5.00',
+            'stripe_token': token,
+            'charge_id': token,
+            'customer_id': token,
+            'category': self.category.id,
+            'sig': self.sig.id,
+        }
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(user=None)
+        response = self.send('post', 'rest_api:transaction-bulk', [])
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_create(self):
+        response = self.send(
+            'post', 'rest_api:transaction-bulk',
+            [self.transaction_data('a'), self.transaction_data('b')],
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [item['stripe_token'] for item in response.json()], ['a', 'b']
+        )
+        self.assertEqual(
+            Transaction.objects.filter(stripe_token__in=('a', 'b')).count(),
+            2,
+        )
+
+    def test_invalid_items_write_nothing(self):
+        invalid = self.transaction_data('b')
+        del invalid['category']
+        response = self.send(
+            'post', 'rest_api:transaction-bulk',
+            [self.transaction_data('a'), invalid],
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()[0], {})
+        self.assertIn('category', response.json()[1])
+        self.assertFalse(
+            Transaction.objects.filter(stripe_token='a').exists()
+        )
+
+    def test_update(self):
+        response = self.send(
+            'patch', 'rest_api:transaction-bulk',
+            [
+                {'id': transaction.id, 'category': self.other.id}
+                for transaction in self.transactions[:2]
+            ],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item['category'] for item in response.json()],
+            [str(self.other.id)] * 2,
+        )
+        self.assertEqual(
+            Transaction.objects.filter(category=self.other).count(), 2
+        )
+
+    def test_update_unknown_rows(self):
+        response = self.send(
+            'patch', 'rest_api:transaction-bulk',
+            [
+                {'id': self.transactions[0].id, 'category': self.other.id},
+                {'id': self.transactions[0].id, 'category': self.other.id},
+                {'id': 'not-an-id'},
+                {'id': '00000000-0000-0000-0000-000000000000'},
+            ],
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            [
+                {},
+                {'id': ['Duplicate id.']},
+                {'id': ['A valid id is required.']},
+                {'id': ['Not found.']},
+            ],
+        )
+        self.assertFalse(
+            Transaction.objects.filter(category=self.other).exists()
+        )
+
+    def test_destroy(self):
+        ids = [str(transaction.id) for transaction in self.transactions[:2]]
+        response = self.send('delete', 'rest_api:transaction-bulk', ids)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{'id': pk} for pk in ids])
+        self.assertEqual(Transaction.objects.count(), 1)
+
+        response = self.send('delete', 'rest_api:transaction-bulk', ids)
+        self.assertEqual(response.status_code, 400)
+
+    def test_too_many_items(self):
+        with self.settings(REST_API_MAX_BULK_SIZE=1):
+            response = self.send(
+                'post', 'rest_api:transaction-bulk',
+                [self.transaction_data('a'), self.transaction_data('b')],
+            )
+        self.assertEqual(response.status_code, 400)
+
+    def test_update_events_touches_modification_time(self):
+        """
+        Ensures Events updated in bulk record when they were changed, which
+        their cached cards are keyed on.
+        """
+        event = Event.objects.create(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='test',
+            description='test',
+            location='test',
+            date_hosted=timezone.now(),
+            date_expire=timezone.now(),
+            flier='test.png',
+        )
+        response = self.send(
+            'patch', 'rest_api:event-bulk',
+            [{'id': str(event.id), 'title': 'changed'}],
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        date_modified = event.date_modified
+        event.refresh_from_db()
+        self.assertEqual(event.title, 'changed')
+        self.assertGreater(event.date_modified, date_modified)
+
+    def test_create_events_with_fliers(self):
+        """
+        Ensures Events created in bulk have their uploaded fliers stored and
+        processed, and the caches of Events are invalidated.
+        """
+        cache.set(UPCOMING_EVENTS_CACHE_KEY, [])
+        fliers = {}
+        items = []
+        for i in range(2):
+            buffer = BytesIO()
+            Image.new(mode='RGB', size=(50, 50)).save(buffer, 'JPEG')
+            fliers['flier-{}'.format(i)] = SimpleUploadedFile(
+                name='flier{}.jpg'.format(i),
+                content=buffer.getvalue(),
+                content_type='image/jpeg',
+            )
+            items.append({
+                'title': 'bulk {}'.format(i),
+                'description': 'test',
+                'location': 'test',
+                'date_hosted': timezone.now().isoformat(),
+                'date_expire': timezone.now().isoformat(),
+                'flier': 'flier-{}'.format(i),
+                'creator': str(self.user.id),
+                'hosting_sig': self.sig.id,
+            })
+
+        with tempfile.TemporaryDirectory() as media_root, \
+                self.settings(MEDIA_ROOT=media_root):
+            response = self.client.post(
+                reverse('rest_api:event-bulk'),
+                data=dict(fliers, items=json.dumps(items)),
+            )
+            self.assertEqual(response.status_code, 201, response.content)
+
+            events = Event.objects.filter(title__startswith='bulk ')
+            self.assertEqual(events.count(), 2)
+            for event in events:
+                self.assertFalse(event.flier_processed)
+                self.assertTrue(event.flier.storage.exists(event.flier.name))
+            self.assertEqual(
+                Job.objects.filter(task='events.process_flier').count(), 2
+            )
+        self.assertIsNone(cache.get(UPCOMING_EVENTS_CACHE_KEY))
+
+
+class EventFilterTestCase(TestCase):
+    """
+    Ensures Events can be filtered by the ``rest_api``.
+    """
+
+    def setUp(self):
+        """
+        Initializes Events hosted by different SIGs and users at different
+        times.
+        """
+        super().setUp()
+        self.client = APIClient()
+        now = timezone.now()
+        self.user = User.objects.create_user('ksyh3@mst.edu')
+        self.other_user = User.objects.create_user('other@mst.edu')
+        self.sig = SIG.objects.create_sig(
+            id='test',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.other_sig = SIG.objects.create_sig(
+            id='other',
+            chair=self.user,
+            founder=self.user,
+            description='test',
+        )
+        self.past = Event.objects.create_event(
+            creator=self.user,
+            hosting_sig=self.sig,
+            title='Git workshop',
+            date_hosted=now - timezone.timedelta(days=2),
+            date_expire=now - timezone.timedelta(days=1),
+        )
+        self.upcoming = Event.objects.create_event(
+            creator=self.other_user,
+            hosting_sig=self.other_sig,
+            title='Lightning talks',
+            date_hosted=now + timezone.timedelta(days=1),
+            date_expire=now + timezone.timedelta(days=2),
+        )
+
+    def filter(self, **params):
+        """
+        Lists the Events matching the given filters.
+
+        :return: The titles of the Events listed.
+        :rtype: set
+        """
+        response = self.client.get(reverse('rest_api:event-list'), params)
+        self.assertEqual(response.status_code, 200)
+        return {event['title'] for event in response.json()['results']}
+
+    def test_filters(self):
+        now = timezone.now().isoformat()
+        self.assertEqual(self.filter(hosted_after=now), {'Lightning talks'})
+        self.assertEqual(self.filter(hosted_before=now), {'Git workshop'})
+        self.assertEqual(self.filter(active='true'), {'Lightning talks'})
+        self.assertEqual(self.filter(active='false'), {'Git workshop'})
+        self.assertEqual(self.filter(hosting_sig='test'), {'Git workshop'})
+        self.assertEqual(
+            self.filter(creator=self.other_user.id), {'Lightning talks'}
+        )
+        self.assertEqual(
+            self.filter(search='workshops', hosting_sig='test'),
+            {'Git workshop'},
+        )
+        self.assertEqual(self.filter(search='workshop', active='true'), set())
+        self.assertEqual(
+            self.filter(), {'Git workshop', 'Lightning talks'}
+        )
+
+    def test_invalid_filters(self):
+        response = self.client.get(
+            reverse('rest_api:event-list'), {'creator': 'not-an-id'}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -26,6 +26,9 @@ urlpatterns = [
     # acm.mst.edu/web-api/events/
     path('events/', views.EventList.as_view(), name='event-list'),
 
+    # acm.mst.edu/web-api/events/bulk/
+    path('events/bulk/', views.EventBulk.as_view(), name='event-bulk'),
+
     # acm.mst.edu/web-api/events/<pk>/
     path(
         'events/<uuid:pk>/',
@@ -50,6 +53,13 @@ urlpatterns = [
         name='transaction-list'
     ),
 
+    # acm.mst.edu/web-api/transactions/bulk/
+    path(
+        'transactions/bulk/',
+        views.TransactionBulk.as_view(),
+        name='transaction-bulk'
+    ),
+
     # acm.mst.edu/web-api/transactions/<pk>/
     path(
         'transactions/<uuid:pk>/',
@@ -76,6 +86,44 @@ urlpatterns = [
         views.CategoryDetail.as_view(),
         name='category-detail'
     ),
+
+    # acm.mst.edu/web-api/export/accounts/
+    path(
+        'export/accounts/',
+        views.UserExport.as_view(),
+        name='user-export'
+    ),
+
+    # acm.mst.edu/web-api/export/events/
+    path(
+        'export/events/',
+        views.EventExport.as_view(),
+        name='event-export'
+    ),
+
+    # acm.mst.edu/web-api/export/sigs/
+    path('export/sigs/', views.SIGExport.as_view(), name='sig-export'),
+
+    # acm.mst.edu/web-api/export/transactions/
+    path(
+        'export/transactions/',
+        views.TransactionExport.as_view(),
+        name='transaction-export'
+    ),
+
+    # acm.mst.edu/web-api/export/products/
+    path(
+        'export/products/',
+        views.ProductExport.as_view(),
+        name='product-export'
+    ),
+
+    # acm.mst.edu/web-api/export/categories/
+    path(
+        'export/categories/',
+        views.CategoryExport.as_view(),
+        name='category-export'
+    ),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
@@ -1,15 +1,21 @@
 """
 Contains the views for the rest_api route.
+
+Each view's queryset joins in the rows its serializer may follow through a
+foreign key with ``select_related``, so that a page of any size is fetched in
+a single query rather than one more query per row.
 """
 # third-party
 from rest_framework import mixins
 from rest_framework import generics
-# from rest_framework import permissions
+from rest_framework import permissions
 # from rest_framework.decorators import api_view
 # from rest_framework.response import Response
 
 # local Django
 from . import filters
+from .mixins import BulkModelMixin, ConditionalGetMixin, ExportModelMixin
+from .mixins import SparseFieldsetMixin, ValuesListMixin
 from accounts.models import User
 from accounts.serializers import UserSerializer
 from events.models import Event
@@ -23,7 +29,10 @@ from sigs.serializers import SIGSerializer
 # from rest_api.permissions import IsOwnerOrReadOnly, IsStaffOrReadOnly
 
 
-class UserList(mixins.ListModelMixin,
+class UserList(ConditionalGetMixin,
+               SparseFieldsetMixin,
+               ValuesListMixin,
+               mixins.ListModelMixin,
                mixins.CreateModelMixin,
                generics.GenericAPIView):
     """
@@ -32,16 +41,17 @@ class UserList(mixins.ListModelMixin,
     queryset = User.objects.all()
     serializer_class = UserSerializer
     filter_class = filters.UserFilter
+    cursor_ordering = ('email',)
 
     def get(self, request, *args, **kwargs):
         """
-        Lists all users.
+        Lists all users, one cursor paginated page at a time.
 
         :param request: Request for UserList information.
         :type request: :class:`django.http.request.HttpRequest`
 
-        :return: List of all users' details and a 200 response
-                 if the queryset is not empty.
+        :return: A page of users' details, the cursors of the neighbouring
+                 pages, and a 200 response.
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.list(request, *args, **kwargs)
@@ -60,7 +70,9 @@ class UserList(mixins.ListModelMixin,
         return self.create(request, *args, **kwargs)
 
 
-class UserDetail(mixins.RetrieveModelMixin,
+class UserDetail(ConditionalGetMixin,
+                 SparseFieldsetMixin,
+                 mixins.RetrieveModelMixin,
                  mixins.UpdateModelMixin,
                  mixins.DestroyModelMixin,
                  generics.GenericAPIView):
@@ -123,25 +135,28 @@ class UserDetail(mixins.RetrieveModelMixin,
         return self.destroy(request, *args, **kwargs)
 
 
-class EventList(mixins.ListModelMixin,
+class EventList(ConditionalGetMixin,
+                SparseFieldsetMixin,
+                mixins.ListModelMixin,
                 mixins.CreateModelMixin,
                 generics.GenericAPIView):
     """
     List all Events or create a new event.
     """
-    queryset = Event.objects.all()
+    queryset = Event.objects.select_related('creator', 'hosting_sig')
     serializer_class = EventSerializer
-    # filter_class = filters.EventFilter
+    filter_class = filters.EventFilter
+    cursor_ordering = ('-date_created', 'id')
 
     def get(self, request, *args, **kwargs):
         """
-        Lists all Events.
+        Lists all Events, one cursor paginated page at a time.
 
         :param request: Request for EventList infomation.
         :type request: :class:`django.http.request.HttpRequest`
 
-        :return: List of all Event details and a 200 response
-                 if queryset is not empty.
+        :return: A page of Event details, the cursors of the neighbouring
+                 pages, and a 200 response.
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.list(request, *args, **kwargs)
@@ -160,14 +175,16 @@ class EventList(mixins.ListModelMixin,
         return self.create(request, *args, **kwargs)
 
 
-class EventDetail(mixins.RetrieveModelMixin,
+class EventDetail(ConditionalGetMixin,
+                  SparseFieldsetMixin,
+                  mixins.RetrieveModelMixin,
                   mixins.UpdateModelMixin,
                   mixins.DestroyModelMixin,
                   generics.GenericAPIView):
     """
     Retrieve, updates, or delete a Event instance.
     """
-    queryset = Event.objects.all()
+    queryset = Event.objects.select_related('creator', 'hosting_sig')
     serializer_class = EventSerializer
 
     def get(self, request, *args, **kwargs):
@@ -222,25 +239,84 @@ class EventDetail(mixins.RetrieveModelMixin,
         return self.destroy(request, *args, **kwargs)
 
 
-class SIGList(mixins.ListModelMixin,
+class BulkView(BulkModelMixin, generics.GenericAPIView):
+    """
+    Base view for the admin-only endpoints which write many rows of a table
+    in one request.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+
+    def post(self, request, *args, **kwargs):
+        """
+        Creates a row for each item of the request.
+
+        :param request: Request holding the items to create.
+        :type request: :class:`django.http.request.HttpRequest`
+
+        :return: The created rows and a 201 response if every item is valid,
+                 otherwise the errors of each item and a 400 response.
+        :rtype: :class:`django.http.response.HttpResponse`
+        """
+        return self.bulk_create(request, *args, **kwargs)
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Partially updates the row named by each item of the request.
+
+        :param request: Request holding the items to update.
+        :type request: :class:`django.http.request.HttpRequest`
+
+        :return: The updated rows and a 200 response if every item is valid,
+                 otherwise the errors of each item and a 400 response.
+        :rtype: :class:`django.http.response.HttpResponse`
+        """
+        return self.bulk_update(request, *args, **kwargs)
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Deletes the row named by each id in the request.
+
+        :param request: Request holding the ids of the rows to delete.
+        :type request: :class:`django.http.request.HttpRequest`
+
+        :return: The ids of the deleted rows and a 200 response if every row
+                 was found, otherwise the errors of each id and a 400
+                 response.
+        :rtype: :class:`django.http.response.HttpResponse`
+        """
+        return self.bulk_destroy(request, *args, **kwargs)
+
+
+class EventBulk(BulkView):
+    """
+    Create, update, or delete many Events at once.
+    """
+    queryset = EventList.queryset
+    serializer_class = EventSerializer
+
+
+class SIGList(ConditionalGetMixin,
+              SparseFieldsetMixin,
+              mixins.ListModelMixin,
               mixins.CreateModelMixin,
               generics.GenericAPIView):
     """
     List all SIGs or create a new sig.
     """
-    queryset = SIG.objects.all()
+    queryset = SIG.objects.select_related('founder', 'chair')
     serializer_class = SIGSerializer
     filter_class = filters.SIGFilter
+    cursor_ordering = ('id',)
 
     def get(self, request, *args, **kwargs):
         """
-        Lists all SIGs' details.
+        Lists all SIGs' details, one cursor paginated page at a time.
 
         :param request: Request for SIGList details.
         :type request: :class:`django.http.request.HttpRequest`
 
-        :return: The list of all SIGs and a 200 response if
-                 the queryset is not empty.
+        :return: A page of SIGs, the cursors of the neighbouring pages, and a
+                 200 response.
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.list(request, *args, **kwargs)
@@ -259,14 +335,16 @@ class SIGList(mixins.ListModelMixin,
         return self.create(request, *args, **kwargs)
 
 
-class SIGDetail(mixins.RetrieveModelMixin,
+class SIGDetail(ConditionalGetMixin,
+                SparseFieldsetMixin,
+                mixins.RetrieveModelMixin,
                 mixins.UpdateModelMixin,
                 mixins.DestroyModelMixin,
                 generics.GenericAPIView):
     """
     Retrieve, updates, or delete a SIG instance.
     """
-    queryset = SIG.objects.all()
+    queryset = SIG.objects.select_related('founder', 'chair')
     serializer_class = SIGSerializer
 
     def get_serializer_class(self):
@@ -331,26 +409,32 @@ class SIGDetail(mixins.RetrieveModelMixin,
         return self.destroy(request, *args, **kwargs)
 
 
-class TransactionList(mixins.ListModelMixin,
+class TransactionList(ConditionalGetMixin,
+                      SparseFieldsetMixin,
+                      ValuesListMixin,
+                      mixins.ListModelMixin,
                       mixins.CreateModelMixin,
                       generics.GenericAPIView):
     """
     Lists all Transactions or creates a new Transaction List.
     """
-    queryset = Transaction.objects.all()
+    queryset = Transaction.objects.select_related(
+        'category', 'sig', 'user'
+    )
     serializer_class = TransactionSerializer
+    cursor_ordering = ('-date_created', 'id')
 
     # filter_class = filters.UserFilter
 
     def get(self, request, *args, **kwargs):
         """
-        Lists all Transactions.
+        Lists all Transactions, one cursor paginated page at a time.
 
         :param request: Request for all Transaction details.
         :type request: :class:`django.http.request.HttpRequest`
 
-        :return: A list of all User Transactions and a 200 response
-                 if the list is non empty.
+        :return: A page of User Transactions, the cursors of the neighbouring
+                 pages, and a 200 response.
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.list(request, *args, **kwargs)
@@ -369,14 +453,18 @@ class TransactionList(mixins.ListModelMixin,
         return self.create(request, *args, **kwargs)
 
 
-class TransactionDetail(mixins.RetrieveModelMixin,
+class TransactionDetail(ConditionalGetMixin,
+                        SparseFieldsetMixin,
+                        mixins.RetrieveModelMixin,
                         mixins.UpdateModelMixin,
                         mixins.DestroyModelMixin,
                         generics.GenericAPIView):
     """
     Retrieve, updates, or delete a Transaction.
     """
-    queryset = Transaction.objects.all()
+    queryset = Transaction.objects.select_related(
+        'category', 'sig', 'user'
+    )
     serializer_class = TransactionSerializer
 
     def get(self, request, *args, **kwargs):
@@ -431,25 +519,37 @@ class TransactionDetail(mixins.RetrieveModelMixin,
         return self.destroy(request, *args, **kwargs)
 
 
-class ProductList(mixins.ListModelMixin,
+class TransactionBulk(BulkView):
+    """
+    Create, update, or delete many Transactions at once.
+    """
+    queryset = TransactionList.queryset
+    serializer_class = TransactionSerializer
+
+
+class ProductList(ConditionalGetMixin,
+                  SparseFieldsetMixin,
+                  mixins.ListModelMixin,
                   mixins.CreateModelMixin,
                   generics.GenericAPIView):
     """
     List all Products or create a new Product.
     """
-    queryset = Product.objects.all()
+    queryset = Product.objects.select_related('category', 'sig')
     serializer_class = ProductSerializer
+    cursor_ordering = ('tag',)
     # filter_class = filters.UserFilter
 
     def get(self, request, *args, **kwargs):
         """
-        Retrieve the list of all Products
+        Retrieve the list of all Products, one cursor paginated page at a
+        time.
 
         :param request: Request for all Product details.
         :type request: :class:`django.http.request.HttpRequest`
 
-        :return: List of all Products and a 200 response
-                  if the queryset is not empty.
+        :return: A page of Products, the cursors of the neighbouring pages,
+                 and a 200 response.
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.list(request, *args, **kwargs)
@@ -468,14 +568,16 @@ class ProductList(mixins.ListModelMixin,
         return self.create(request, *args, **kwargs)
 
 
-class ProductDetail(mixins.RetrieveModelMixin,
+class ProductDetail(ConditionalGetMixin,
+                    SparseFieldsetMixin,
+                    mixins.RetrieveModelMixin,
                     mixins.UpdateModelMixin,
                     mixins.DestroyModelMixin,
                     generics.GenericAPIView):
     """
     Retrieve, updates, or delete a Product.
     """
-    queryset = Product.objects.all()
+    queryset = Product.objects.select_related('category', 'sig')
     serializer_class = ProductSerializer
 
     def get(self, request, *args, **kwargs):
@@ -530,7 +632,9 @@ class ProductDetail(mixins.RetrieveModelMixin,
         return self.destroy(request, *args, **kwargs)
 
 
-class CategoryList(mixins.ListModelMixin,
+class CategoryList(ConditionalGetMixin,
+                   SparseFieldsetMixin,
+                   mixins.ListModelMixin,
                    mixins.CreateModelMixin,
                    generics.GenericAPIView):
     """
@@ -538,17 +642,20 @@ class CategoryList(mixins.ListModelMixin,
     """
     queryset = TransactionCategory.objects.all()
     serializer_class = CategorySerializer
+    cursor_ordering = ('id',)
 
     # filter_class = filters.UserFilter
 
     def get(self, request, *args, **kwargs):
         """
-        Retrieves the list of all Categroies.
+        Retrieves the list of all Categroies, one cursor paginated page at a
+        time.
 
         :param request: Request for all Category details.
         :type request: :class:`django.http.request.HttpRequest`
 
-        :return: List of all Categories and a 200 response if successful.
+        :return: A page of Categories, the cursors of the neighbouring pages,
+                 and a 200 response if successful.
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.list(request, *args, **kwargs)
@@ -567,7 +674,9 @@ class CategoryList(mixins.ListModelMixin,
         return self.create(request, *args, **kwargs)
 
 
-class CategoryDetail(mixins.RetrieveModelMixin,
+class CategoryDetail(ConditionalGetMixin,
+                     SparseFieldsetMixin,
+                     mixins.RetrieveModelMixin,
                      mixins.UpdateModelMixin,
                      mixins.DestroyModelMixin,
                      generics.GenericAPIView):
@@ -628,3 +737,87 @@ class CategoryDetail(mixins.RetrieveModelMixin,
         :rtype: :class:`django.http.response.HttpResponse`
         """
         return self.destroy(request, *args, **kwargs)
+
+
+class ExportView(SparseFieldsetMixin, ExportModelMixin,
+                 generics.GenericAPIView):
+    """
+    Base view for the admin-only streaming exports of a table.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, *args, **kwargs):
+        """
+        Streams every row of the table as newline delimited JSON.
+
+        :param request: Request to export the table.
+        :type request: :class:`django.http.request.HttpRequest`
+
+        :return: A streaming response with one row per line and a 200
+                 response, or a 403 response if the user is not staff.
+        :rtype: :class:`django.http.StreamingHttpResponse`
+        """
+        return self.export(request, *args, **kwargs)
+
+
+class UserExport(ExportView):
+    """
+    Export all Users.
+    """
+    queryset = UserList.queryset
+    serializer_class = UserSerializer
+    filter_class = filters.UserFilter
+    cursor_ordering = UserList.cursor_ordering
+    export_filename = 'users'
+
+
+class EventExport(ExportView):
+    """
+    Export all Events.
+    """
+    queryset = EventList.queryset
+    serializer_class = EventSerializer
+    filter_class = filters.EventFilter
+    cursor_ordering = EventList.cursor_ordering
+    export_filename = 'events'
+
+
+class SIGExport(ExportView):
+    """
+    Export all SIGs.
+    """
+    queryset = SIGList.queryset
+    serializer_class = SIGSerializer
+    filter_class = filters.SIGFilter
+    cursor_ordering = SIGList.cursor_ordering
+    export_filename = 'sigs'
+
+
+class TransactionExport(ExportView):
+    """
+    Export all Transactions.
+    """
+    queryset = TransactionList.queryset
+    serializer_class = TransactionSerializer
+    cursor_ordering = TransactionList.cursor_ordering
+    export_filename = 'transactions'
+
+
+class ProductExport(ExportView):
+    """
+    Export all Products.
+    """
+    queryset = ProductList.queryset
+    serializer_class = ProductSerializer
+    cursor_ordering = ProductList.cursor_ordering
+    export_filename = 'products'
+
+
+class CategoryExport(ExportView):
+    """
+    Export all Categories.
+    """
+    queryset = CategoryList.queryset
+    serializer_class = CategorySerializer
+    cursor_ordering = CategoryList.cursor_ordering
+    export_filename = 'categories'
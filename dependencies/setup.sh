@@ -72,6 +72,8 @@ sed -i "s#{{ BUILD_URL }}#$BUILD_URL#g" /etc/uwsgi/apps-available/ACMGeneral_uws
 sed -i "s#{{ INSTALLATION_DIR }}#$INSTALLATION_DIR#g" /etc/uwsgi/apps-available/ACMGeneral_uwsgi.ini
 
 sed -i '/localhost/s/]/, u\x27'"$BUILD_URL"'\x27]/' ../ACM_General/ACM_General/settings_local.py
+# Serve the minified, hashed and precompressed static files in production
+sed -i 's/^# STATICFILES_STORAGE/STATICFILES_STORAGE/' ../ACM_General/ACM_General/settings_local.py
 
 ln -s /etc/uwsgi/apps-available/ACMGeneral_uwsgi.ini /etc/uwsgi/apps-enabled/
 ln -s /etc/nginx/sites-available/ssl-acm.mst.edu /etc/nginx/sites-enabled/